@@ -17,6 +17,22 @@ REQUIRED_TABLES = [
     "ignored_genres",
     "label_genre",
     "subgenre_genre",
+    "file_state",
+]
+
+# High-water mark and poll schedule of an account (see downloader/AccountSchedule.py)
+ACCOUNT_SCHEDULE_COLUMNS = [
+    "last_upload_date DATE NULL",
+    "last_video_id VARCHAR(255) NULL",
+    "upload_interval_days DOUBLE NULL",
+    "last_checked_at DATETIME NULL",
+    "next_check_at DATETIME NULL",
+]
+
+# Columns added after a table's first release; CREATE TABLE IF NOT EXISTS leaves existing tables alone
+COLUMN_MIGRATIONS = [
+    f"ALTER TABLE {table} " + ", ".join(f"ADD COLUMN IF NOT EXISTS {column}" for column in ACCOUNT_SCHEDULE_COLUMNS)
+    for table in ("soundcloud_accounts", "youtube_accounts")
 ]
 
 
@@ -27,7 +43,8 @@ def ensure_tables_exist() -> None:
             CREATE TABLE IF NOT EXISTS soundcloud_accounts (
                 name VARCHAR(255),
                 soundcloud_id VARCHAR(255),
-                PRIMARY KEY (name)
+                PRIMARY KEY (name),
+                """ + ",\n                ".join(ACCOUNT_SCHEDULE_COLUMNS) + """
             )
         """,
         "soundcloud_archive": """
@@ -45,7 +62,8 @@ def ensure_tables_exist() -> None:
         """,
         "youtube_accounts": """
             CREATE TABLE IF NOT EXISTS youtube_accounts (
-                name VARCHAR(255) PRIMARY KEY
+                name VARCHAR(255) PRIMARY KEY,
+                """ + ",\n                ".join(ACCOUNT_SCHEDULE_COLUMNS) + """
             )
         """,
         "youtube_archive": """
@@ -124,9 +142,19 @@ def ensure_tables_exist() -> None:
                 PRIMARY KEY (subgenre, genre)
             )
         """,
+        "file_state": """
+            CREATE TABLE IF NOT EXISTS file_state (
+                path_hash CHAR(40) PRIMARY KEY,
+                path TEXT NOT NULL,
+                size BIGINT NOT NULL,
+                mtime_ns BIGINT NOT NULL,
+                rules_version VARCHAR(64) NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """,
     }
 
-    queries = [table_queries[table] for table in REQUIRED_TABLES]
+    queries = [table_queries[table] for table in REQUIRED_TABLES] + COLUMN_MIGRATIONS
 
     try:
         conn = DatabaseConnector().connect()
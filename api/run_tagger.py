@@ -1,14 +1,25 @@
 from postprocessing.tagger import Tagger
 
 
-def run_tagger(steps):
-    """Run the tagger with the appropriate parsing options."""
+def run_tagger(steps, force=False, mode=None, workers=None, batchSize=None, dryRun=False):
+    """Run the tagger with the appropriate parsing options.
+
+    ``force`` re-tags every file, ignoring the file-state index.
+    ``mode``, ``workers`` and ``batchSize`` override the tagger settings
+    for this run. ``dryRun`` only logs the would-be writes and returns
+    the write summary.
+    """
     parse_all = "tag" in steps
     tagger = Tagger()
-    tagger.run(
+    return tagger.run(
         parse_labels=parse_all or "tag-labels" in steps,
         parse_soundcloud=parse_all or "tag-soundcloud" in steps,
         parse_youtube=parse_all or "tag-youtube" in steps,
         parse_generic=parse_all or "tag-generic" in steps,
         parse_telegram=parse_all or "tag-telegram" in steps,
+        force=bool(force),
+        mode=mode,
+        workers=workers,
+        batch_size=batchSize,
+        dry_run=bool(dryRun),
     )
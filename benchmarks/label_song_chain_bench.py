@@ -0,0 +1,217 @@
+"""
+Benchmark of the full LabelSong rule chain with the old and the slotted Tag.
+
+Runs LabelSong.build_rules() over SONGS in-memory songs (no files, helpers
+loaded from a fake database) once with LegacyTag, a copy of the previous Tag
+that copied its value list before every change and formatted log messages
+eagerly, and once with the current slotted Tag. Reports time per song, the
+memory blocks each song holds after its tags are built and the chain has run
+(sys.getallocatedblocks() and a tracemalloc snapshot diff, all songs kept
+alive), peak traced allocation per song and the size of one Tag instance.
+
+Run from the repository root: python -m benchmarks.label_song_chain_bench
+"""
+import gc
+import logging
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from mutagen.easyid3 import EasyID3
+
+from postprocessing.Song.Helpers.FilterTableHelper import FilterTableHelper
+from postprocessing.Song.Helpers.LookupTableHelper import LookupTableHelper
+from postprocessing.Song.Helpers.TableHelper import TableHelper
+from postprocessing.Song.LabelSong import LabelSong
+from postprocessing.Song.Tag import Tag
+from postprocessing.Song.TagCollection import TagCollection
+from postprocessing.constants import ARTIST_REGEX
+
+SONGS = 2_000
+
+ROWS = {
+    "artists": [(f"Artist {i}",) for i in range(2_000)] + [("Angerfist",), ("Miss K8",), ("Partyraiser",)],
+    "ignored_artists": [("Various Artists", None), ("Angerfist ", "Angerfist")],
+    "genres": [("Hardcore", None), ("Uptempo", None), ("Industrial", None), ("Frenchcore", None)],
+    "ignored_genres": [("Electronic", None)],
+    "artist_genre": [("Angerfist", "Hardcore"), ("Miss K8", "Hardcore"), ("Partyraiser", "Uptempo")],
+    "subgenre_genre": [("Uptempo", "Hardcore"), ("Frenchcore", "Hardcore")],
+}
+
+
+class LegacyTag(Tag):
+    """The previous Tag behaviour: defensive copies and eager f-string logging."""
+
+    def sort(self):
+        old_value = self.value[:]
+        self.value.sort()
+        if old_value != self.value:
+            logging.info(f"{self.tag} changed(sort) from {old_value} to {self.value}")
+            self.changed = True
+
+    def deduplicate(self):
+        old_value = self.value[:]
+        self.value = list(dict.fromkeys(self.value))
+        if old_value != self.value:
+            logging.info(f"{self.tag} changed(deduplicate) from {old_value} to {self.value}")
+            self.changed = True
+
+    def add(self, item):
+        if item not in self.value:
+            old_value = self.value[:]
+            self.value.append(item)
+            logging.info(f"{self.tag} changed(add) from {old_value} to {self.value}")
+            self.changed = True
+
+    def remove(self, val):
+        old_value = self.value[:]
+        if val in self.value:
+            self.value.remove(val)
+            logging.info(f"{self.tag} changed(remove) from {old_value} to {self.value}")
+            self.changed = True
+            return True
+        return False
+
+    def strip(self):
+        old_value = self.value[:]
+        self.value = [element.strip() for element in self.value]
+        if old_value != self.value:
+            logging.info(f"{self.tag} changed(strip) from {old_value} to {self.value}")
+            self.changed = True
+
+    def regex(self):
+        old_value = self.value[:]
+        self.value = [re.sub(ARTIST_REGEX, ";", elem) for elem in self.value]
+        if old_value != self.value:
+            self.resplit()
+            logging.info(f"{self.tag} changed(regex) from {old_value} to {self.value}")
+            self.changed = True
+
+
+class FakeCursor:
+    def __init__(self):
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        table = query.split(" FROM ")[1].split()[0]
+        self.rows = ROWS.get(table, [])
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def cursor(self):
+        return FakeCursor()
+
+    def close(self):
+        pass
+
+
+def build_helpers() -> dict:
+    with patch("postprocessing.Song.Helpers.DatabaseConnector.DatabaseConnector.connect",
+               side_effect=lambda: FakeConnection()):
+        return {
+            "artists": TableHelper("artists", "name"),
+            "ignored_artists": FilterTableHelper("ignored_artists", "name", "corrected_name"),
+            "genres": FilterTableHelper("genres", "genre", "corrected_genre"),
+            "ignored_genres": FilterTableHelper("ignored_genres", "name", "corrected_name"),
+            "artistGenreHelper": LookupTableHelper("artist_genre", "artist", "genre"),
+            "labelGenreHelper": LookupTableHelper("label_genre", "label", "genre"),
+            "subgenreHelper": LookupTableHelper("subgenre_genre", "subgenre", "genre"),
+        }
+
+
+def build_song(i: int) -> LabelSong:
+    tags = EasyID3()
+    tags["artist"] = [f"Angerfist & Artist {i % 2_000} feat. Miss K8 "]
+    tags["genre"] = ["Uptempo;Hardcore; Hardcore"]
+    tags["title"] = [f"Track {i} (Partyraiser Remix)"]
+    tags["albumartist"] = ["Angerfist"]
+    song = LabelSong.__new__(LabelSong)
+    song.rules = []
+    song._path = f"/music/Label/CAT{i:04d} Album/track{i}.mp3"
+    song._filename = f"track{i}.mp3"
+    song.tag_collection = TagCollection(tags)
+    return song
+
+
+@contextmanager
+def tag_class(cls):
+    with patch("postprocessing.Song.TagCollection.Tag", cls):
+        yield
+
+
+def run(rules, cls) -> dict:
+    """Runs the chain over SONGS songs per measurement; timed without tracemalloc."""
+    with tag_class(cls):
+        songs = [build_song(i) for i in range(SONGS)]
+        started = time.perf_counter()
+        for song in songs:
+            for rule in rules:
+                rule.apply(song)
+        elapsed = time.perf_counter() - started
+
+        songs = []
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        for i in range(SONGS):
+            song = build_song(i)
+            for rule in rules:
+                rule.apply(song)
+            songs.append(song)
+        gc.collect()
+        blocks = sys.getallocatedblocks() - blocks
+
+        songs = []
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        peaks = 0
+        for i in range(SONGS):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            song = build_song(i)
+            for rule in rules:
+                rule.apply(song)
+            peaks += tracemalloc.get_traced_memory()[1] - base
+            songs.append(song)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        traced = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "time": elapsed / SONGS,
+        "blocks": blocks / SONGS,
+        "traced_blocks": traced / SONGS,
+        "peak": peaks / SONGS,
+    }
+
+
+def tag_size(tag) -> int:
+    return sys.getsizeof(tag) + (sys.getsizeof(tag.__dict__) if hasattr(tag, "__dict__") else 0)
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    with patch("postprocessing.Song.LabelSong.databaseHelpers", build_helpers()):
+        rules = LabelSong.build_rules()
+
+    legacy = run(rules, LegacyTag)
+    slotted = run(rules, Tag)
+
+    print(f"{SONGS} songs, {len(rules)} rules per song")
+    for label, cls, result in (("legacy Tag ", LegacyTag, legacy), ("slotted Tag", Tag, slotted)):
+        print(f"  {label} : {result['time'] * 1e6:8.1f} us/song, "
+              f"{result['blocks']:5.1f} blocks/song ({result['traced_blocks']:5.1f} traced), "
+              f"peak {result['peak'] / 1024:5.1f} KiB/song, {tag_size(cls('artist', 'A;B'))} B/tag")
+
+if __name__ == "__main__":
+    main()
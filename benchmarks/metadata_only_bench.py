@@ -0,0 +1,57 @@
+"""
+Benchmark of header-only MP3 loading over a corpus of synthetic files.
+
+Writes CORPUS_SIZE MP3 files (an ID3 tag followed by FRAMES CBR MPEG frames)
+to a temporary folder and compares loading them with MP3(path, ID3=EasyID3),
+which also parses the stream info, against MetadataOnlyMP3, which only reads
+the ID3 header. Real files, with VBR headers and junk to sync over, widen the gap.
+
+Run from the repository root: python -m benchmarks.metadata_only_bench
+"""
+import os
+import tempfile
+import timeit
+
+from mutagen.easyid3 import EasyID3
+from mutagen.mp3 import MP3
+
+from postprocessing.Song.MetadataOnlyFile import MetadataOnlyMP3
+
+CORPUS_SIZE = 500
+FRAMES = 2_000
+ROUNDS = 3
+
+# MPEG-1 layer III, 128 kbps, 44.1 kHz, mono: 417 bytes per frame
+FRAME = b"\xff\xfb\x90\xc4" + b"\x00" * 413
+
+
+def build_corpus(folder: str) -> list[str]:
+    paths = []
+    for i in range(CORPUS_SIZE):
+        path = os.path.join(folder, f"track{i:04d}.mp3")
+        with open(path, "wb") as f:
+            f.write(FRAME * FRAMES)
+        tags = EasyID3()
+        tags["artist"] = [f"Artist {i}"]
+        tags["genre"] = ["Hardcore"]
+        tags["title"] = [f"Track {i}"]
+        tags.save(path)
+        paths.append(path)
+    return paths
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        paths = build_corpus(folder)
+
+        full = min(timeit.repeat(lambda: [MP3(p, ID3=EasyID3).tags for p in paths], number=1, repeat=ROUNDS))
+        header = min(timeit.repeat(lambda: [MetadataOnlyMP3(p).tags for p in paths], number=1, repeat=ROUNDS))
+
+    print(f"{CORPUS_SIZE} files of {len(FRAME) * FRAMES // 1024} KiB, best of {ROUNDS}")
+    print(f"  MP3 + stream info  : {full / CORPUS_SIZE * 1e6:10.1f} us/file")
+    print(f"  ID3 header only    : {header / CORPUS_SIZE * 1e6:10.1f} us/file")
+    print(f"  speed-up           : {full / header:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
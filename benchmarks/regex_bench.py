@@ -0,0 +1,83 @@
+"""
+Micro-benchmarks for the title and artist-splitting hot paths.
+
+Each case runs the previous form (a pattern string handed to re.* per call)
+against the precompiled pattern from constants.Patterns, first with re's
+internal cache warm, then with the cache purged before every call. The latter
+is what happens once other code has pushed these large alternations out of
+re's small shared cache, forcing a recompile.
+
+Run from the repository root: python -m benchmarks.regex_bench
+"""
+import re
+import timeit
+
+from postprocessing.Song.rules.InferArtistFromTitleRule import extract_artists_from_string
+from postprocessing.Song.rules.InferRemixerFromTitleRule import InferRemixerFromTitleRule
+from postprocessing.constants import ARTIST_REGEX, ARTIST_REGEX_NON_CAPTURING, Patterns
+
+CALLS = 20_000
+
+ARTISTS = "Angerfist & Miss K8 feat. Outblast vs. Partyraiser, Dr. Peacock x Sefa"
+REMIXER = "Partyraiser's Remix 2023"
+TITLE = "Angerfist - Street Fighter (Partyraiser Remix) [LIVE]"
+BRACKETED = r"\s*[\(\[\{<][^()\[\]{}<>]*[\)\]\}>]"
+
+
+def old_split_artists(value):
+    raw = re.sub(ARTIST_REGEX, ";", value)
+    return [name.strip() for name in raw.split(";") if name.strip()]
+
+
+def new_split_artists(value):
+    raw = Patterns.ARTIST_SEPARATOR.sub(";", value)
+    return [name.strip() for name in raw.split(";") if name.strip()]
+
+
+def old_extract_artists(value):
+    return [a.strip() for a in re.split(ARTIST_REGEX_NON_CAPTURING, value) if a.strip()]
+
+
+def old_strip_brackets(value):
+    return re.sub(BRACKETED, "", value).strip()
+
+
+def new_strip_brackets(value):
+    return Patterns.BRACKETED.sub("", value).strip()
+
+
+def old_clean_remixer(name):
+    name = re.sub(r"['’]s\s+(remix|edit|refix|version|bootleg|mix|vip)\b", r" \1", name, flags=re.IGNORECASE)
+    while True:
+        new_name = re.sub(Patterns.REMIX_SUFFIX_FULL.pattern, "", name, flags=re.IGNORECASE).strip()
+        if new_name == name:
+            return new_name
+        name = new_name
+
+
+CASES = [
+    ("split_artists", old_split_artists, new_split_artists, ARTISTS),
+    ("extract_artists_from_string", old_extract_artists, extract_artists_from_string, ARTISTS),
+    ("strip bracketed suffixes", old_strip_brackets, new_strip_brackets, TITLE),
+    ("clean remixer name", old_clean_remixer, InferRemixerFromTitleRule(object(), object())._clean_artist_name, REMIXER),
+]
+
+
+def main():
+    for name, old, new, value in CASES:
+        assert old(value) == new(value), name
+        warm_old = timeit.timeit(lambda: old(value), number=CALLS)
+        warm_new = timeit.timeit(lambda: new(value), number=CALLS)
+
+        rounds = CALLS // 10
+        cold_old = timeit.timeit(lambda: (re.purge(), old(value)), number=rounds)
+        cold_new = timeit.timeit(lambda: (re.purge(), new(value)), number=rounds)
+        base = timeit.timeit(re.purge, number=rounds)
+
+        print(name)
+        print(f"  warm cache   : {warm_old / CALLS * 1e6:8.2f} -> {warm_new / CALLS * 1e6:8.2f} us/call")
+        print(f"  cold cache   : {(cold_old - base) / rounds * 1e6:8.2f} -> {(cold_new - base) / rounds * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Micro-benchmark for set_cleaned_artist on a 50k-artist table.
+
+Compares the old per-call path (fetch every artist and build a lowercase dict)
+with the shared TableHelper.canonical_index. The old path is measured without
+the SELECT round-trip, so the real-world gap is larger than reported here.
+
+Run from the repository root: python -m benchmarks.set_cleaned_artist_bench
+"""
+import timeit
+from unittest.mock import MagicMock, patch
+
+from postprocessing.Song.Helpers.TableHelper import TableHelper
+from postprocessing.Song.rules.InferArtistFromTitleRule import set_cleaned_artist
+
+ARTIST_COUNT = 50_000
+CALLS = 200
+
+
+def build_helper() -> TableHelper:
+    with patch("postprocessing.Song.Helpers.TableHelper.DatabaseConnector"):
+        helper = TableHelper("artists", "name", preload=False)
+    for i in range(ARTIST_COUNT):
+        name = f"Artist {i:05d}"
+        helper._values.add(name)
+        helper._canonical_map[name.lower()] = name
+    helper._loaded = True
+    helper.get_all_values = lambda: list(helper._values)
+    return helper
+
+
+def old_set_cleaned_artist(song, artists, artist_db):
+    all_artists = {name.lower(): name for name in artist_db.get_all_values() if name}
+    song.tag_collection.set_item("artist", ";".join(all_artists.get(a.lower(), a) for a in artists))
+
+
+def main():
+    helper = build_helper()
+    song = MagicMock()
+    artists = ["artist 00042", "ARTIST 49999 (Live)", "Unknown"]
+
+    old = timeit.timeit(lambda: old_set_cleaned_artist(song, artists, helper), number=CALLS)
+    new = timeit.timeit(lambda: set_cleaned_artist(song, artists, helper), number=CALLS)
+
+    print(f"{ARTIST_COUNT} artists, {CALLS} calls")
+    print(f"  full scan per call : {old / CALLS * 1e6:10.1f} us/call")
+    print(f"  canonical_index    : {new / CALLS * 1e6:10.1f} us/call")
+    print(f"  speed-up           : {old / new:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
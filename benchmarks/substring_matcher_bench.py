@@ -0,0 +1,52 @@
+"""
+Benchmark for LookupTableHelper.get_substring.
+
+Compares the previous per-key loop (``key in title`` for every key) with the
+Aho–Corasick matcher built at preload, for several table sizes.
+
+Run from the repository root: python -m benchmarks.substring_matcher_bench
+"""
+import random
+import string
+import timeit
+from unittest.mock import patch
+
+from postprocessing.Song.Helpers.LookupTableHelper import LookupTableHelper
+
+TABLE_SIZES = (500, 5_000, 50_000)
+TITLES = 200
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+
+def build_helper(size: int, rng: random.Random) -> LookupTableHelper:
+    rows = [(f"{random_word(rng)} {random_word(rng)}", f"Genre {i % 50}") for i in range(size)]
+    with patch("postprocessing.Song.Helpers.LookupTableHelper.DatabaseConnector") as connector:
+        cursor = connector.return_value.connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = rows
+        return LookupTableHelper("subgenre_genre", "subgenre", "genre")
+
+
+def loop_get_substring(helper: LookupTableHelper, title: str) -> list[str]:
+    title = title.lower()
+    return sorted({value for key, values in helper._kv_map.items() if key in title for value in values})
+
+
+def main():
+    rng = random.Random(42)
+    for size in TABLE_SIZES:
+        helper = build_helper(size, rng)
+        keys = list(helper._kv_map)
+        titles = [f"{random_word(rng)} - {rng.choice(keys)} ({random_word(rng)} remix)" for _ in range(TITLES)]
+        assert all(loop_get_substring(helper, t) == helper.get_substring(t) for t in titles)
+
+        loop = timeit.timeit(lambda: [loop_get_substring(helper, t) for t in titles], number=1)
+        matcher = timeit.timeit(lambda: [helper.get_substring(t) for t in titles], number=1)
+        print(f"{size:>6} keys: loop {loop / TITLES * 1e6:9.1f} us/title, "
+              f"automaton {matcher / TITLES * 1e6:7.1f} us/title, speed-up {loop / matcher:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
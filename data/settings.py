@@ -34,8 +34,28 @@ class Settings(metaclass=SingletonMeta):
         self.eps_folder_path = os.getenv("eps_folder_path", "")
         self.music_folder_path = os.getenv("music_folder_path", "")
         self.delimiter = os.getenv("delimiter", os.sep)
+        self.tagger_mode = os.getenv("tagger_mode", "thread")
+        self.tagger_workers = int(os.getenv("tagger_workers", "16"))
+        self.tagger_batch_size = int(os.getenv("tagger_batch_size", "32"))
+        self.scan_workers = int(os.getenv("scan_workers", "8"))
+        self.download_max_concurrency = int(os.getenv("download_max_concurrency", "8"))
+        self.download_rate = float(os.getenv("download_rate", "1.0"))
+        self.download_burst = int(os.getenv("download_burst", "10"))
+        self.pipeline_archive_workers = int(os.getenv("pipeline_archive_workers", "2"))
+        self.pipeline_tag_workers = int(os.getenv("pipeline_tag_workers", "4"))
+        self.pipeline_queue_size = int(os.getenv("pipeline_queue_size", "32"))
+        # parse audio stream info only when a song's length is needed
+        self.metadata_only = os.getenv("metadata_only", "false").lower() in ("1", "true", "yes")
 
         logging.info('import_folder_path = %s', self.import_folder_path)
         logging.info('music_folder_path = %s', self.music_folder_path)
         logging.info('eps_folder_path = %s', self.eps_folder_path)
         logging.info('delimiter = %s', self.delimiter)
+        logging.info('tagger = %s mode, %s workers, batch size %s',
+                     self.tagger_mode, self.tagger_workers, self.tagger_batch_size)
+        logging.info('scan_workers = %s', self.scan_workers)
+        logging.info('download_max_concurrency = %s, download_rate = %s, download_burst = %s',
+                     self.download_max_concurrency, self.download_rate, self.download_burst)
+        logging.info('pipeline_archive_workers = %s, pipeline_tag_workers = %s, pipeline_queue_size = %s',
+                     self.pipeline_archive_workers, self.pipeline_tag_workers, self.pipeline_queue_size)
+        logging.info('metadata_only = %s', self.metadata_only)
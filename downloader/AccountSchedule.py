@@ -0,0 +1,165 @@
+import logging
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+
+
+class HighWaterMarkReached(Exception):
+    """Raised from the match filter to stop a crawl at the first already-seen upload."""
+
+
+@dataclass
+class AccountState:
+    name: str
+    last_upload_date: Optional[date] = None
+    last_video_id: Optional[str] = None
+    upload_interval_days: Optional[float] = None
+    next_check_at: Optional[datetime] = None
+
+
+def parse_upload_date(value) -> Optional[date]:
+    """yt-dlp's upload_date is 'YYYYMMDD'; the database returns a date."""
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value), "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+class AccountCrawl:
+    """
+    Tracks one crawl of an account against its high-water mark.
+
+    Used as yt-dlp's match_filter: entries come newest first, so the crawl
+    stops (HighWaterMarkReached) at the first entry that is the last recorded
+    upload or older than its date. The newest upload seen and the number of new
+    ones are kept for AccountSchedule.record(); reset() clears them before a
+    retry walks the account again.
+    """
+
+    def __init__(self, state: AccountState, match_filter: Callable = None):
+        self.state = state
+        self._match_filter = match_filter
+        self.reset()
+
+    def reset(self):
+        self.newest: Optional[tuple[date, str]] = None
+        self.oldest: Optional[date] = None
+        self.new_entries = 0
+
+    def match_filter(self, info: dict, incomplete: bool = False):
+        video_id = info.get("id")
+        upload_date = parse_upload_date(info.get("upload_date"))
+        mark = self.state.last_upload_date
+        if video_id is not None and video_id == self.state.last_video_id:
+            raise HighWaterMarkReached(f"Reached last seen upload {video_id} of {self.state.name}")
+        if mark is not None and upload_date is not None and upload_date < mark:
+            raise HighWaterMarkReached(f"Reached uploads older than {mark} of {self.state.name}")
+
+        if upload_date is not None and video_id is not None and not incomplete:
+            self.new_entries += 1
+            if self.newest is None or upload_date > self.newest[0]:
+                self.newest = (upload_date, video_id)
+            if self.oldest is None or upload_date < self.oldest:
+                self.oldest = upload_date
+
+        if incomplete or self._match_filter is None:
+            return None
+        return self._match_filter(info)
+
+
+class AccountSchedule:
+    """
+    High-water marks and poll schedule of the accounts in `soundcloud_accounts`
+    or `youtube_accounts`.
+
+    After each successful crawl the account's average upload interval is
+    updated (an exponential moving average, growing while the account stays
+    quiet) and the next check is planned at half that interval, bounded by
+    MIN_POLL and MAX_POLL. Dormant accounts are therefore polled far less
+    often than active ones.
+    """
+
+    MIN_POLL = timedelta(hours=1)
+    MAX_POLL = timedelta(days=7)
+    SMOOTHING = 0.5
+
+    def __init__(self, table_name: str, clock: Callable[[], datetime] = datetime.now):
+        self.table_name = table_name
+        self.clock = clock
+
+    def load(self) -> Optional[dict[str, AccountState]]:
+        """Return the state of every account, or None if the columns could not be read."""
+        try:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT name, last_upload_date, last_video_id, upload_interval_days, next_check_at
+                    FROM {self.table_name}
+                """)
+                rows = cursor.fetchall()
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Failed to load account schedule: {e}")
+            return None
+        return {
+            name: AccountState(name, parse_upload_date(last_date), last_id, interval, next_check)
+            for name, last_date, last_id, interval, next_check in rows
+        }
+
+    def due(self, states: dict[str, AccountState]) -> list[str]:
+        """Names of the accounts whose next check has passed, longest overdue first."""
+        now = self.clock()
+        due = [state for state in states.values() if state.next_check_at is None or state.next_check_at <= now]
+        due.sort(key=lambda state: (state.next_check_at or datetime.min, state.name))
+        skipped = len(states) - len(due)
+        if skipped:
+            logging.info(f"[{self.table_name}] {skipped} accounts not due yet")
+        return [state.name for state in due]
+
+    def record(self, crawl: AccountCrawl) -> AccountState:
+        """Advance the account's mark and plan its next check after a successful crawl."""
+        state = crawl.state
+        now = self.clock()
+
+        sample = None
+        if crawl.newest is not None and state.last_upload_date is not None:
+            sample = (crawl.newest[0] - state.last_upload_date).days / max(crawl.new_entries, 1)
+        elif crawl.newest is not None and crawl.new_entries > 1:
+            sample = (crawl.newest[0] - crawl.oldest).days / (crawl.new_entries - 1)
+
+        if sample is not None:
+            interval = sample if state.upload_interval_days is None else (
+                self.SMOOTHING * sample + (1 - self.SMOOTHING) * state.upload_interval_days)
+        elif crawl.newest is None and state.last_upload_date is not None:
+            # nothing new: the account has been quiet for at least this long
+            quiet = (now.date() - state.last_upload_date).days
+            interval = max(state.upload_interval_days or 0.0, float(quiet))
+        else:
+            interval = state.upload_interval_days
+
+        if crawl.newest is not None:
+            state.last_upload_date, state.last_video_id = crawl.newest
+        state.upload_interval_days = interval
+        poll = self.MIN_POLL if interval is None else timedelta(days=interval / 2)
+        state.next_check_at = now + min(self.MAX_POLL, max(self.MIN_POLL, poll))
+
+        try:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
+                cursor.execute(f"""
+                    UPDATE {self.table_name}
+                    SET last_upload_date = %s, last_video_id = %s, upload_interval_days = %s,
+                        last_checked_at = %s, next_check_at = %s
+                    WHERE name = %s
+                """, (state.last_upload_date, state.last_video_id, state.upload_interval_days,
+                      now, state.next_check_at, state.name))
+                conn.commit()
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Failed to record crawl of {state.name}: {e}")
+        return state
+
+
+soundcloud_schedule = AccountSchedule("soundcloud_accounts")
+youtube_schedule = AccountSchedule("youtube_accounts")
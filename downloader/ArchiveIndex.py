@@ -0,0 +1,139 @@
+import logging
+import os
+import threading
+from contextlib import closing
+
+from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+
+
+class ArchiveIndex:
+    """
+    In-memory set of the (account, video_id) pairs of one archive table.
+
+    Loaded with a single query at the start of a downloader run and kept up to
+    date by the archive's insert(), so the postprocessors can check for known
+    tracks without opening a connection per track. The instances below are
+    shared by the downloaders and the postprocessors of a platform.
+
+    download_archive() hands out one DownloadArchive per archive file for the
+    whole run, so a file shared by several accounts is read only once.
+    """
+
+    def __init__(self, table_name: str, extractor: str):
+        self.table_name = table_name
+        self.extractor = extractor
+        self.version = 0
+        self._entries: set[tuple[str, str]] = set()
+        self._video_ids: set[str] = set()
+        self._loaded = False
+        self._archives: dict[str, DownloadArchive] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self) -> bool:
+        """(Re)load the index from the database. Returns False if it could not be read."""
+        try:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
+                cursor.execute(f"SELECT account, video_id FROM {self.table_name}")
+                rows = cursor.fetchall()
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Failed to load archive index: {e}")
+            with self._lock:
+                self._loaded = False
+            return False
+
+        entries = {(str(account), str(video_id)) for account, video_id in rows}
+        with self._lock:
+            self._entries = entries
+            self._video_ids = {video_id for _, video_id in entries}
+            self._archives = {}
+            self._loaded = True
+            self.version += 1
+        logging.info(f"[{self.table_name}] Loaded {len(entries)} archived tracks")
+        return True
+
+    def ensure_loaded(self) -> bool:
+        return self._loaded or self.load()
+
+    def contains(self, account, video_id) -> bool:
+        if account is None or video_id is None:
+            return False
+        return (str(account), str(video_id)) in self._entries
+
+    def contains_video(self, video_id) -> bool:
+        return video_id is not None and str(video_id) in self._video_ids
+
+    def add(self, account, video_id):
+        if account is None or video_id is None:
+            return
+        with self._lock:
+            self._entries.add((str(account), str(video_id)))
+            self._video_ids.add(str(video_id))
+
+    def invalidate(self):
+        with self._lock:
+            self._entries = set()
+            self._video_ids = set()
+            self._archives = {}
+            self._loaded = False
+
+    def download_archive(self, archive_file: str | None = None) -> "DownloadArchive":
+        """Return the object to pass as yt-dlp's ``download_archive`` option for a file."""
+        if not archive_file:
+            return DownloadArchive(self)
+        key = os.path.abspath(archive_file)
+        with self._lock:
+            archive = self._archives.get(key)
+            if archive is None:
+                archive = self._archives[key] = DownloadArchive(self, archive_file)
+            return archive
+
+
+class DownloadArchive:
+    """
+    Set-like stand-in for a yt-dlp archive file, backed by an ArchiveIndex.
+
+    yt-dlp uses a non-path ``download_archive`` as-is: it checks entries such as
+    ``"soundcloud 12345"`` with ``in`` and records new ones with add(). Entries
+    are answered from the index first and then from the text file, which is read
+    once and still appended to, so the files stay usable without the database.
+    One instance may be used by several download threads at once.
+    """
+
+    def __init__(self, index: ArchiveIndex, archive_file: str | None = None):
+        self.index = index
+        self.archive_file = archive_file
+        self._lines: set[str] = set()
+        self._prefix = f"{index.extractor} "
+        self._lock = threading.Lock()
+        if archive_file and os.path.isfile(archive_file):
+            with open(archive_file, encoding="utf-8") as f:
+                self._lines = {line.strip() for line in f if line.strip()}
+
+    def __contains__(self, archive_id: str) -> bool:
+        if archive_id in self._lines:
+            return True
+        return archive_id.startswith(self._prefix) and self.index.contains_video(archive_id[len(self._prefix):])
+
+    def __bool__(self) -> bool:
+        # yt-dlp skips the lookup entirely for an empty archive
+        return True
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def add(self, archive_id: str):
+        with self._lock:
+            if archive_id in self._lines:
+                return
+            self._lines.add(archive_id)
+            if self.archive_file:
+                with open(self.archive_file, "a", encoding="utf-8") as f:
+                    f.write(archive_id + "\n")
+
+
+soundcloud_index = ArchiveIndex("soundcloud_archive", "soundcloud")
+youtube_index = ArchiveIndex("youtube_archive", "youtube")
@@ -0,0 +1,210 @@
+import logging
+import socket
+import threading
+import time
+import urllib.error
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from data.settings import Settings
+
+try:
+    from urllib3.exceptions import TimeoutError as Urllib3Timeout
+except ImportError:  # urllib3 is optional for yt-dlp
+    Urllib3Timeout = socket.timeout
+
+try:
+    from yt_dlp.networking.exceptions import HTTPError as YtDlpHTTPError
+    from yt_dlp.utils import ExistingVideoReached
+except ImportError:
+    YtDlpHTTPError = urllib.error.HTTPError
+    ExistingVideoReached = ()
+
+SUCCESS = "success"
+THROTTLED = "throttled"
+FAILED = "failed"
+
+THROTTLE_STATUSES = {403, 429}
+TIMEOUTS = (socket.timeout, TimeoutError, Urllib3Timeout)
+
+
+def _causes(error: BaseException) -> Iterator[BaseException]:
+    """The error and what it wraps: yt-dlp's exc_info and cause, urllib's reason, __cause__/__context__."""
+    pending, seen = [error], set()
+    while pending:
+        current = pending.pop(0)
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        exc_info = getattr(current, "exc_info", None)
+        if isinstance(exc_info, tuple) and len(exc_info) > 1 and isinstance(exc_info[1], BaseException):
+            pending.append(exc_info[1])
+        for attribute in ("cause", "reason"):
+            cause = getattr(current, attribute, None)
+            if isinstance(cause, BaseException):
+                pending.append(cause)
+        pending.extend((current.__cause__, current.__context__))
+
+
+def http_status(error: BaseException) -> Optional[int]:
+    """HTTP status of the first HTTPError (yt-dlp's or urllib's) in an error chain."""
+    for cause in _causes(error):
+        if isinstance(cause, (YtDlpHTTPError, urllib.error.HTTPError)):
+            return getattr(cause, "status", None) or getattr(cause, "code", None)
+    return None
+
+
+def classify(error: BaseException) -> str:
+    """Map a download error to an outcome: 403/429 and timeouts mean the host is throttling us."""
+    for cause in _causes(error):
+        if isinstance(cause, ExistingVideoReached):
+            return SUCCESS
+        if isinstance(cause, (YtDlpHTTPError, urllib.error.HTTPError)):
+            status = getattr(cause, "status", None) or getattr(cause, "code", None)
+            return THROTTLED if status in THROTTLE_STATUSES else FAILED
+        if isinstance(cause, TIMEOUTS):
+            return THROTTLED
+    return FAILED
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `capacity`. Not thread-safe on its own."""
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def take(self) -> float:
+        """Take a token; returns 0, or the seconds until one is available (nothing taken)."""
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass
+class HostState:
+    limit: float
+    bucket: TokenBucket
+    active: int = 0
+    cooldown_until: float = 0.0
+    penalty: float = 0.0
+    peak: int = 0
+
+
+class AimdController:
+    """
+    Additive-increase/multiplicative-decrease limit on concurrent tasks per host.
+
+    A task is whatever the caller holds a slot for; the downloaders hold one
+    per account crawl, so the limit is the number of accounts crawled at once
+    and the token bucket paces how often a crawl may start. Every successful
+    task raises a host's limit by `increase / limit` (about +1 per window of
+    `limit` tasks), a throttled one (HTTP 403/429 or a timeout anywhere in its
+    error chain) halves it and puts the host in a cool-down that doubles while
+    throttling continues. Workers block in acquire() rather than sleeping on
+    their own, so a throttled host slows every worker that talks to it.
+    """
+
+    def __init__(
+        self,
+        initial: float = 2,
+        minimum: float = 1,
+        maximum: float = 8,
+        rate: float = 1.0,
+        burst: float = 10,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 60.0,
+        max_cooldown: float = 600.0,
+        clock=time.monotonic,
+    ):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.rate = rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self._hosts: dict[str, HostState] = {}
+        self._cond = threading.Condition()
+
+    def _host(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = HostState(limit=min(self.maximum, max(self.minimum, self.initial)),
+                              bucket=TokenBucket(self.rate, self.burst, self.clock))
+            self._hosts[host] = state
+        return state
+
+    def limit(self, host: str) -> int:
+        with self._cond:
+            return int(self._host(host).limit)
+
+    def stats(self, host: str) -> dict:
+        with self._cond:
+            state = self._host(host)
+            return {"limit": int(state.limit), "active": state.active, "peak": state.peak}
+
+    def acquire(self, host: str):
+        """Block until `host` has a free slot, a token and no cool-down."""
+        with self._cond:
+            state = self._host(host)
+            while True:
+                wait = state.cooldown_until - self.clock()
+                if wait <= 0:
+                    if state.active >= int(state.limit):
+                        wait = None  # until a release
+                    else:
+                        wait = state.bucket.take()
+                        if wait == 0:
+                            state.active += 1
+                            state.peak = max(state.peak, state.active)
+                            return
+                self._cond.wait(wait)
+
+    def release(self, host: str, outcome: str = SUCCESS):
+        with self._cond:
+            state = self._host(host)
+            state.active -= 1
+            if outcome == SUCCESS:
+                state.limit = min(self.maximum, state.limit + self.increase / state.limit)
+                state.penalty = 0.0
+            elif outcome == THROTTLED:
+                state.limit = max(self.minimum, state.limit * self.decrease)
+                state.penalty = min(self.max_cooldown, state.penalty * 2 if state.penalty else self.cooldown)
+                state.cooldown_until = self.clock() + state.penalty
+                logging.warning(f"[{host}] Throttled: concurrency limit {int(state.limit)}, "
+                                f"cooling down {state.penalty:.0f}s")
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, host: str):
+        """Hold a slot for one task (an account crawl); an exception is classified to adjust the limit."""
+        self.acquire(host)
+        outcome = SUCCESS
+        try:
+            yield
+        except Exception as e:
+            outcome = classify(e)
+            raise
+        finally:
+            self.release(host, outcome)
+
+
+s = Settings()
+
+# Shared by the SoundCloud and YouTube downloaders; state is kept per host
+download_controller = AimdController(maximum=s.download_max_concurrency, rate=s.download_rate,
+                                     burst=s.download_burst)
@@ -0,0 +1,173 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from data.settings import Settings
+from postprocessing.Song.Helpers.WriteBehindBuffer import write_buffer
+
+_STOP = object()
+
+
+class PipelineClosed(RuntimeError):
+    """Raised by submit() once the pipeline is closing or a stage has no live workers."""
+
+
+@dataclass
+class DownloadedSong:
+    """A finished download handed from a yt-dlp postprocessor to the later stages."""
+    path: str
+    info: Optional[dict]
+    corrected_title: Optional[str] = None
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline stage. `handler` returns the item for the next stage, or None
+    to end the item's way through the pipeline.
+    """
+    name: str
+    handler: Callable[[Any], Any]
+    workers: int = 1
+    processed: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+
+
+class Pipeline:
+    """
+    Runs stages in their own worker threads, connected by bounded queues.
+
+    The download threads submit() finished songs; when the first queue is full
+    they block, so the downloads can only run `queue_size` songs ahead of the
+    archive and tag stages. close() drains the stages in order, waits for
+    every submitted song to pass through and flushes the buffered database
+    writes of the stages. Blocked puts wake up every `poll_interval` seconds,
+    so a submit() cannot hang on a stage whose workers are gone.
+    """
+
+    def __init__(self, name: str, stages: list[Stage], queue_size: int = 32, poll_interval: float = 0.5):
+        self.name = name
+        self.stages = stages
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self._queues: list[queue.Queue] = []
+        self._threads: list[list[threading.Thread]] = []
+        self._lock = threading.Lock()
+        self._submitted = threading.Condition(self._lock)
+        self._blocked = 0.0
+        self._closing = False
+        self._submitting = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        self._closing = False
+        self._queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        self._threads = []
+        for index, stage in enumerate(self.stages):
+            threads = [
+                threading.Thread(target=self._work, args=(index,), name=f"{self.name}-{stage.name}-{i}", daemon=True)
+                for i in range(max(1, stage.workers))
+            ]
+            for thread in threads:
+                thread.start()
+            self._threads.append(threads)
+
+    def submit(self, item):
+        """
+        Hand an item to the first stage; blocks while its queue is full.
+
+        Raises PipelineClosed once close() has started or the first stage has no
+        live workers left, instead of waiting for a slot that never frees up.
+        """
+        with self._lock:
+            if self._closing:
+                raise PipelineClosed(f"[{self.name}] Pipeline is closing")
+            self._submitting += 1
+        started = time.perf_counter()
+        try:
+            self._put(0, item)
+        finally:
+            waited = time.perf_counter() - started
+            with self._lock:
+                self._blocked += waited
+                self._submitting -= 1
+                self._submitted.notify_all()
+
+    def close(self):
+        """Stop the stages one after another once their queues are drained."""
+        with self._lock:
+            self._closing = True
+            # submits already past the check still reach the first queue before its stop markers
+            while self._submitting:
+                self._submitted.wait()
+        for index, threads in enumerate(self._threads):
+            if self._alive(index):
+                for _ in threads:
+                    self._queues[index].put(_STOP)
+            for thread in threads:
+                thread.join()
+        write_buffer.flush()
+        logging.info(f"[{self.name}] Pipeline finished: {self.stats()}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {stage.name: {"processed": stage.processed, "failed": stage.failed} for stage in self.stages}
+            stats["blocked_seconds"] = round(self._blocked, 1)
+            return stats
+
+    def _alive(self, index: int) -> bool:
+        return any(thread.is_alive() for thread in self._threads[index])
+
+    def _put(self, index: int, item):
+        """Put into a stage's queue, giving up if the stage has no live workers to take it."""
+        target = self._queues[index]
+        while True:
+            if not self._alive(index):
+                raise PipelineClosed(f"[{self.name}] {self.stages[index].name} stage has no live workers")
+            try:
+                target.put(item, timeout=self.poll_interval)
+                return
+            except queue.Full:
+                continue
+
+    def _work(self, index: int):
+        stage = self.stages[index]
+        source = self._queues[index]
+        has_next = index + 1 < len(self._queues)
+        while True:
+            item = source.get()
+            if item is _STOP:
+                return
+            try:
+                result = stage.handler(item)
+            except Exception as e:
+                logging.error(f"[{self.name}] {stage.name} failed for {getattr(item, 'path', item)}: {e}",
+                              exc_info=True)
+                with self._lock:
+                    stage.failed += 1
+                continue
+            with self._lock:
+                stage.processed += 1
+            if has_next and result is not None:
+                try:
+                    self._put(index + 1, result)
+                except PipelineClosed as e:
+                    logging.error(f"{e}; dropped {getattr(result, 'path', result)}")
+
+
+def song_pipeline(name: str, archive: Callable[[DownloadedSong], Any], tag: Callable[[DownloadedSong], Any]) -> Pipeline:
+    """The archive → tag pipeline of a downloader, sized from the settings."""
+    s = Settings()
+    return Pipeline(name, [
+        Stage("archive", archive, s.pipeline_archive_workers),
+        Stage("tag", tag, s.pipeline_tag_workers),
+    ], queue_size=s.pipeline_queue_size)
@@ -1,7 +1,9 @@
 import logging
+from contextlib import closing
 
 from numpy.testing.print_coercion_tables import print_new_cast_table
 
+from downloader.ArchiveIndex import soundcloud_index
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
 
 
@@ -14,14 +16,17 @@ class SoundcloudArchive:
     - Insert new entries after successful download and metadata enrichment.
 
     This ensures that we avoid duplicate downloads and retain metadata
-    for historical and tagging purposes.
+    for historical and tagging purposes. Lookups are answered from the shared
+    in-memory `soundcloud_index`; the database is only queried when the index
+    could not be loaded.
     """
 
     @staticmethod
     def exists(account: str, video_id: str) -> bool:
+        if soundcloud_index.ensure_loaded():
+            return soundcloud_index.contains(account, video_id)
         try:
-            conn = DatabaseConnector().connect()
-            with conn.cursor() as cursor:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
                 cursor.execute("""
                     SELECT 1 FROM soundcloud_archive WHERE account = %s AND video_id = %s
                 """, (account, video_id))
@@ -41,8 +46,7 @@ class SoundcloudArchive:
             return
 
         try:
-            conn = DatabaseConnector().connect()
-            with conn.cursor() as cursor:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
                 # check of account al bekend is
                 cursor.execute("SELECT soundcloud_id FROM soundcloud_accounts WHERE name = %s", (account_name,))
                 existing = cursor.fetchone()
@@ -67,6 +71,7 @@ class SoundcloudArchive:
                 """, (account_id, video_id, path, url, title))
 
                 conn.commit()
+                soundcloud_index.add(account_id, video_id)
                 logging.debug(f"Added to soundcloud_archive: {account_id}/{video_id}")
         except Exception as e:
             logging.error(f"Failed to insert archive info for {path}: {e}", exc_info=True)
@@ -1,27 +1,74 @@
-import json
 import logging
-import subprocess
+import threading
+from typing import Optional
 from urllib.parse import urlparse
 
 from yt_dlp.postprocessor import PostProcessor
 
+from downloader.Pipeline import DownloadedSong, Pipeline, PipelineClosed
 from downloader.SoundcloudArchive import SoundcloudArchive
 from postprocessing.Song.SoundcloudSong import SoundcloudSong
 
+# Fields of the info dict that the archive insert and SoundcloudSong rely on
+ENRICHED_FIELDS = ("id", "title", "uploader", "uploader_url")
+
+
+class EnrichStats:
+    """
+    Process-wide counters of metadata enrichment: how many tracks were
+    enriched from the live info dict alone (an extra fetch avoided) and how
+    many needed an extra extraction for missing fields.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.avoided = 0
+        self.fetched = 0
+        self.failed = 0
+
+    def record(self, fetched: bool, failed: bool = False):
+        with self._lock:
+            if fetched:
+                self.fetched += 1
+            else:
+                self.avoided += 1
+            if failed:
+                self.failed += 1
+
+    def reset(self):
+        with self._lock:
+            self.avoided = 0
+            self.fetched = 0
+            self.failed = 0
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {"avoided": self.avoided, "fetched": self.fetched, "failed": self.failed}
+
+
+enrich_stats = EnrichStats()
 
 class SoundcloudSongProcessor(PostProcessor):
     """
     A yt-dlp postprocessor for SoundCloud downloads.
 
     After a track is downloaded, this postprocessor:
-    - Fetches enriched metadata using yt-dlp's --dump-single-json.
+    - Takes the enriched metadata from the live yt-dlp info dict, extracting
+      the track again in process only when required fields are missing.
     - Checks if the track already exists in the soundcloud_archive table.
     - If not present, inserts metadata into the database.
     - Finally, passes the file to SoundcloudSong for tagging and processing.
 
+    With a pipeline, the archive and tagging steps run as its stages on their
+    own workers, and run() returns as soon as the song is queued.
+
     This class ensures that all SoundCloud downloads are archived in the database
     and enriched with metadata for later tagging or analysis.
     """
+    def __init__(self, pipeline: Optional[Pipeline] = None):
+        super().__init__()
+        self.pipeline = pipeline
+
     def run(self, info):
         path = info.get('filepath') or info.get('_filename')  # filepath may vary by yt-dlp version
         url = info.get('webpage_url')
@@ -31,18 +78,31 @@ class SoundcloudSongProcessor(PostProcessor):
 
         logging.info(f"Postprocessing downloaded file: {path}")
 
-        # Try to fetch extra metadata like uploader_id, original_url, and full title
-        enriched_info = self._fetch_enriched_info(url)
-        if not enriched_info:
-            # Fallback: basic SoundcloudSong instance without extra metadata
-            s = SoundcloudSong(path)
-            s.parse()
-            return [], info
+        # Complete metadata like uploader_id, original_url, and full title
+        enriched_info = self._enrich_info(info, url)
+        if enriched_info:
+            # Merge extra info into yt-dlp's original info dict
+            info.update(enriched_info)
+
+        song = DownloadedSong(path, enriched_info)
+        if self.pipeline is not None:
+            # archive and tag on the pipeline's workers; the next download can start
+            try:
+                self.pipeline.submit(song)
+                return [], info
+            except PipelineClosed as e:
+                logging.warning(f"{e}; processing {path} inline")
+        self.tag(self.archive(song))
+        return [], info
 
-        # Merge extra info into yt-dlp's original info dict
-        info.update(enriched_info)
+    @staticmethod
+    def archive(song: DownloadedSong) -> DownloadedSong:
+        """Pipeline stage: record the track in the soundcloud_archive table."""
+        enriched_info = song.info
+        if not enriched_info:
+            return song
 
-        account_name = self._extract_account_name_from_url(enriched_info.get("uploader_url"))
+        account_name = SoundcloudSongProcessor._extract_account_name_from_url(enriched_info.get("uploader_url"))
         account_id = enriched_info.get("channel_id")  or enriched_info.get("uploader_id") # '12345678' (sometimes present)
         video_id = enriched_info.get("id")
 
@@ -55,15 +115,22 @@ class SoundcloudSongProcessor(PostProcessor):
                 account_name= account_name,
                 account_id=account_id,
                 video_id=video_id,
-                path=path,
+                path=song.path,
                 url=enriched_info.get("original_url"),
                 title=enriched_info.get("title")
             )
+        return song
 
-        # Tag or further process the song
-        s = SoundcloudSong(path, enriched_info)
-        s.parse()
-        return [], info
+    @staticmethod
+    def tag(song: DownloadedSong) -> None:
+        """Pipeline stage: tag or further process the song."""
+        if not song.info:
+            # Fallback: basic SoundcloudSong instance without extra metadata
+            with SoundcloudSong(song.path) as s:
+                s.parse()
+            return
+        with SoundcloudSong(song.path, song.info) as s:
+            s.parse()
 
     @staticmethod
     def _extract_account_name_from_url(uploader_url: str) -> str | None:
@@ -74,32 +141,51 @@ class SoundcloudSongProcessor(PostProcessor):
             logging.warning(f"Failed to parse uploader_url '{uploader_url}': {e}")
             return None
 
-    @staticmethod
-    def _fetch_enriched_info(url: str):
+    def _enrich_info(self, info: dict, url: str) -> dict | None:
         """
-        Fetch full metadata from a SoundCloud URL using yt-dlp's --dump-single-json.
+        Build the enriched metadata from the live yt-dlp info dict.
 
-        This typically includes fields like:
-        - uploader_id
-        - title
-        - original_url
-        - id
-        - description
-        - tags
+        The info dict of the running YoutubeDL already holds the fields the
+        archive and tagging need (id, title, uploader, uploader_url, uploader_id).
+        Only when some of them are missing is the track extracted again, in
+        process through the live YoutubeDL's extractor, and only the missing
+        fields are taken from that result.
 
         Returns:
-            dict: Enriched metadata, or None if the fetch failed.
+            dict: Enriched metadata, or None if the track id is unknown.
         """
+        enriched = dict(info)
+        enriched.setdefault("original_url", url)
+
+        missing = self._missing_fields(enriched)
+        if not missing:
+            enrich_stats.record(fetched=False)
+            return enriched
+
+        extra = self._fetch_missing_fields(url, info.get("extractor_key") or "Soundcloud")
+        enrich_stats.record(fetched=True, failed=extra is None)
+        for field in missing:
+            if extra and extra.get(field):
+                enriched[field] = extra[field]
+        if extra and not enriched.get("channel_id"):
+            enriched["channel_id"] = extra.get("channel_id")
+        return enriched if enriched.get("id") else None
+
+    @staticmethod
+    def _missing_fields(info: dict) -> list[str]:
+        missing = [field for field in ENRICHED_FIELDS if not info.get(field)]
+        if not (info.get("channel_id") or info.get("uploader_id")):
+            missing.append("uploader_id")
+        return missing
+
+    def _fetch_missing_fields(self, url: str, extractor_key: str) -> dict | None:
+        """Extract *url* again with the live YoutubeDL, without processing or downloading it."""
+        downloader = getattr(self, "_downloader", None)
+        if downloader is None:
+            logging.warning(f"No YoutubeDL attached; cannot enrich metadata for {url}")
+            return None
         try:
-            result = subprocess.run(
-                ["yt-dlp", "--dump-single-json", "--no-playlist", url],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return json.loads(result.stdout)
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Failed to enrich metadata for {url}: {e.stderr}")
+            return downloader.get_info_extractor(extractor_key).extract(url)
         except Exception as e:
-            logging.error(f"Unexpected error enriching metadata for {url}: {e}", exc_info=True)
+            logging.error(f"Failed to enrich metadata for {url}: {e}", exc_info=True)
         return None
@@ -1,5 +1,7 @@
 import logging
+from contextlib import closing
 
+from downloader.ArchiveIndex import youtube_index
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
 
 
@@ -9,9 +11,10 @@ class YoutubeArchive:
     @staticmethod
     def exists(account: str, video_id: str) -> bool:
         """Return True if the given video was already archived for the account."""
+        if youtube_index.ensure_loaded():
+            return youtube_index.contains(account, video_id)
         try:
-            conn = DatabaseConnector().connect()
-            with conn.cursor() as cursor:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
                 cursor.execute(
                     """
                     SELECT 1 FROM youtube_archive WHERE account = %s AND video_id = %s
@@ -35,8 +38,7 @@ class YoutubeArchive:
             return
 
         try:
-            conn = DatabaseConnector().connect()
-            with conn.cursor() as cursor:
+            with closing(DatabaseConnector().connect()) as conn, conn.cursor() as cursor:
                 # Ensure account exists in youtube_accounts table
                 cursor.execute(
                     "INSERT IGNORE INTO youtube_accounts (name) VALUES (%s)", (account,)
@@ -51,6 +53,7 @@ class YoutubeArchive:
                 )
 
                 conn.commit()
+                youtube_index.add(account, video_id)
                 logging.debug(f"Added to youtube_archive: {account}/{video_id}")
         except Exception as e:
             logging.error(
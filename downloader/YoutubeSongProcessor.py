@@ -7,16 +7,26 @@ from typing import Optional
 from yt_dlp.postprocessor import PostProcessor
 from yt_dlp.utils import sanitize_filename
 
+from downloader.Pipeline import DownloadedSong, Pipeline, PipelineClosed
 from downloader.YoutubeArchive import YoutubeArchive
 from postprocessing.Song.YoutubeSong import YoutubeSong
 from postprocessing.constants import TITLE
 
 
 class YoutubeSongProcessor(PostProcessor):
-    """Postprocessor that archives metadata and tags downloaded YouTube songs."""
+    """
+    Postprocessor that archives metadata and tags downloaded YouTube songs.
+
+    With a pipeline, the archive and tagging steps run as its stages on their
+    own workers, and run() returns as soon as the song is queued.
+    """
 
     _GENERIC_TITLE_RE = re.compile(r".+ video #[0-9A-Za-z_-]+$", re.IGNORECASE)
 
+    def __init__(self, pipeline: Optional[Pipeline] = None):
+        super().__init__()
+        self.pipeline = pipeline
+
     def run(self, info):
         path = info.get("filepath") or info.get("_filename")
         url = info.get("webpage_url")
@@ -30,6 +40,21 @@ class YoutubeSongProcessor(PostProcessor):
         if corrected_title:
             path = self._apply_title_correction(path, info, corrected_title)
 
+        if self.pipeline is not None:
+            # archive and tag on the pipeline's workers; the next download can start.
+            # yt-dlp keeps using info after run() returns, so the stages get a copy.
+            try:
+                self.pipeline.submit(DownloadedSong(path, dict(info), corrected_title))
+                return [], info
+            except PipelineClosed as e:
+                logging.warning(f"{e}; processing {path} inline")
+        self.tag(self.archive(DownloadedSong(path, info, corrected_title)))
+        return [], info
+
+    @staticmethod
+    def archive(song: DownloadedSong) -> DownloadedSong:
+        """Pipeline stage: record the video in the youtube_archive table."""
+        info = song.info
         title_for_archive = info.get("title")
 
         account = (
@@ -41,22 +66,25 @@ class YoutubeSongProcessor(PostProcessor):
         video_id = info.get("id")
 
         if not YoutubeArchive.exists(account, video_id):
-            YoutubeArchive.insert(account, video_id, path, url, title_for_archive)
+            YoutubeArchive.insert(account, video_id, song.path, info.get("webpage_url"), title_for_archive)
         else:
             logging.info(
                 f"Track already in youtube_archive: {account}/{video_id} — skipping insert."
             )
+        return song
 
-        song = YoutubeSong(path, info)
-        if corrected_title:
-            try:
-                song.tag_collection.set_item(TITLE, corrected_title)
-            except Exception as exc:  # pragma: no cover - defensive guard
-                logging.warning(
-                    "Failed to apply corrected title tag for %s: %s", path, exc
-                )
-        song.parse()
-        return [], info
+    @staticmethod
+    def tag(song: DownloadedSong) -> None:
+        """Pipeline stage: tag the downloaded song."""
+        with YoutubeSong(song.path, song.info) as youtube_song:
+            if song.corrected_title:
+                try:
+                    youtube_song.tag_collection.set_item(TITLE, song.corrected_title)
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    logging.warning(
+                        "Failed to apply corrected title tag for %s: %s", song.path, exc
+                    )
+            youtube_song.parse()
 
     def _ensure_real_title(self, info: dict, url: str) -> Optional[str]:
         """Return a better title if yt-dlp provided a generic placeholder."""
@@ -1,8 +1,7 @@
 import concurrent.futures
+from contextlib import closing
 import logging
-import math
 import os
-import random
 import time
 from typing import Optional
 
@@ -11,16 +10,22 @@ from yt_dlp.postprocessor import FFmpegMetadataPP, EmbedThumbnailPP
 
 from api.jobs import job_manager
 
-from downloader.SoundcloudProcessor import SoundcloudSongProcessor
+from downloader.AccountSchedule import (AccountCrawl, AccountSchedule, AccountState, HighWaterMarkReached,
+                                        soundcloud_schedule)
+from downloader.ArchiveIndex import soundcloud_index
+from downloader.ConcurrencyController import SUCCESS, AimdController, classify, download_controller, http_status
+from downloader.Pipeline import song_pipeline
+from downloader.SoundcloudProcessor import SoundcloudSongProcessor, enrich_stats
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+from postprocessing.Song.Helpers.WriteBehindBuffer import write_buffer
 from pathlib import Path
 
+SOUNDCLOUD_HOST = "soundcloud.com"
 
 
 def get_accounts_from_db():
     try:
-        db = DatabaseConnector().connect()
-        with db.cursor() as cursor:
+        with closing(DatabaseConnector().connect()) as db, db.cursor() as cursor:
             cursor.execute("SELECT name FROM soundcloud_accounts")
             accounts = [row[0] for row in cursor.fetchall()]
         return accounts
@@ -37,15 +42,26 @@ class SoundcloudDownloader:
     - Downloads only MP3 files that are not yet in the archive.
     - Embeds metadata and optionally thumbnails using FFmpeg.
     - Supports private/follower-only tracks using session cookies.
-    - Handles batch downloads with configurable parallelism and throttling.
+    - Downloads accounts in parallel, paced by the shared AIMD concurrency controller.
+    - Archives and tags finished downloads in a staged pipeline, off the download threads.
     - Skips tracks outside a configurable duration range.
+    - Answers yt-dlp's archive check from the in-memory archive index, falling
+      back to the archive text files when the index is disabled or unavailable.
+    - Stops each account's crawl at its high-water mark (last seen upload) and
+      only polls accounts whose next check, planned from their posting
+      frequency, is due.
     """
-    def __init__(self, break_on_existing=True, max_workers=1, burst_size=10, min_pause=1, max_pause=5):
+    def __init__(self, break_on_existing=True, use_archive_index=True, controller: AimdController = None,
+                 schedule: AccountSchedule = None):
         self.output_folder = os.getenv("soundcloud_folder")
         self.archive_dir = os.getenv("soundcloud_archive")
         self.cookies_file = os.getenv("soundcloud_cookies", "soundcloud.com_cookies.txt")
         self.ffmpeg_location = os.getenv("ffmpeg-location", "usr/bin/local")
         self.default_break_on_existing = break_on_existing
+        self.use_archive_index = use_archive_index
+        self.controller = controller or download_controller
+        self.schedule = schedule or soundcloud_schedule
+        self._pipeline = None
 
         if not self.output_folder or not self.archive_dir:
             logging.warning(
@@ -67,10 +83,6 @@ class SoundcloudDownloader:
             self.archive_file = None
 
         self.enabled = True
-        self.max_workers = max_workers
-        self.burst_size = burst_size
-        self.min_pause = min_pause
-        self.max_pause = max_pause
 
         self.ydl_opts = {
             'http_headers': {
@@ -103,29 +115,51 @@ class SoundcloudDownloader:
             return "Outside allowed duration range"
         return None
 
-    def download_account(self, name: str, yt_dl_opts: dict = None):
+    def _download_archive(self, archive_file: str):
+        if self.use_archive_index and soundcloud_index.loaded:
+            return soundcloud_index.download_archive(archive_file)
+        return archive_file
+
+    def _crawl(self, name: str, states: Optional[dict], ydl_opts: dict) -> Optional[AccountCrawl]:
+        """Stop the account's crawl at its high-water mark, if the marks could be loaded."""
+        if states is None:
+            return None
+        crawl = AccountCrawl(states.get(name) or AccountState(name), self._match_filter)
+        ydl_opts['match_filter'] = crawl.match_filter
+        ydl_opts['lazy_playlist'] = True
+        return crawl
+
+    def download_account(self, name: str, yt_dl_opts: dict = None, crawl: AccountCrawl = None):
         link = f"http://soundcloud.com/{name}/tracks"
         logging.info(f"Downloading from SoundCloud account: {name}")
 
         for attempt in range(1, 4):
+            if crawl:
+                crawl.reset()
             try:
-                with YoutubeDL(yt_dl_opts) as ydl:
+                with self.controller.slot(SOUNDCLOUD_HOST), YoutubeDL(yt_dl_opts) as ydl:
                     ydl.add_post_processor(FFmpegMetadataPP(ydl))
                     ydl.add_post_processor(EmbedThumbnailPP(ydl))
-                    ydl.add_post_processor(SoundcloudSongProcessor())
-                    ydl.download([link])
+                    ydl.add_post_processor(SoundcloudSongProcessor(self._pipeline))
+                    try:
+                        ydl.download([link])
+                    except HighWaterMarkReached as e:
+                        logging.info(f"{e} — stopping.")
+                if crawl:
+                    self.schedule.record(crawl)
                 logging.info(f"Finished downloading from: {name}")
                 return
             except Exception as e:
-                msg = str(e)
-                if '403' in msg:
-                    wait_time = random.randint(60, 300)
-                    logging.warning(f"403 Forbidden for {name}. Pausing {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                elif '404' in msg:
+                status = http_status(e)
+                if status == 403:
+                    # the controller cools the host down before the next attempt acquires a slot
+                    logging.warning(f"403 Forbidden for {name}. Retrying after the host cool-down...")
+                elif status == 404:
                     logging.info(f"Got 404 for {name} — skip song.")
-                elif 'already in the archive' in msg:
+                elif classify(e) == SUCCESS:
                     logging.info(f"All tracks for {name} already in archive — skipping.")
+                    if crawl:
+                        self.schedule.record(crawl)
                     return  # ✅ don't retry
                 else:
                     logging.warning(f"Attempt {attempt} failed for {name}: {e}", exc_info=True)
@@ -144,61 +178,74 @@ class SoundcloudDownloader:
             logging.warning("SoundCloud downloader is not configured; skipping run().")
             return
 
+        # High-water marks are not used when redownloading everything
+        states = None if redownload else self.schedule.load()
         if not account:
-            accounts = get_accounts_from_db()
-            if not accounts:
-                logging.warning("No SoundCloud accounts found in the database.")
-                return
-            accounts.sort()
+            if states is not None:
+                accounts = self.schedule.due(states)
+                if not accounts:
+                    logging.info("No SoundCloud accounts due for a check.")
+                    return
+            else:
+                accounts = get_accounts_from_db()
+                if not accounts:
+                    logging.warning("No SoundCloud accounts found in the database.")
+                    return
+                accounts.sort()
         else:
             accounts = [account]
 
+        if self.use_archive_index and not redownload:
+            soundcloud_index.load()
+
+        effective_break = self.default_break_on_existing if breakOnExisting is None else breakOnExisting
+
+        self._pipeline = song_pipeline("soundcloud", SoundcloudSongProcessor.archive, SoundcloudSongProcessor.tag)
+        self._pipeline.start()
+        try:
+            self._download_accounts(accounts, effective_break, redownload, states)
+        finally:
+            self._pipeline.close()
+            self._pipeline = None
+            write_buffer.flush()
+
+        logging.info(f"SoundCloud concurrency: {self.controller.stats(SOUNDCLOUD_HOST)}")
+        logging.info(f"Metadata enrichment: {enrich_stats.as_dict()}")
+
+    def _download_accounts(self, accounts: list[str], effective_break: bool, redownload: bool,
+                           states: Optional[dict]):
         total_accounts = len(accounts)
         processed = 0
-        total_batches = math.ceil(total_accounts / self.burst_size)
-
-        for i in range(0, total_accounts, self.burst_size):
-            batch = accounts[i:i + self.burst_size]
-            batch_num = i // self.burst_size + 1
-            logging.info(f"Processing batch {batch_num} of {total_batches}")
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
-                futures = {}
-                for acc in batch:
-                    # Clone ydl_opts and set archive file (shared or per-account)
-                    ydl_opts = self.ydl_opts.copy()
-                    effective_break = (
-                        self.default_break_on_existing if breakOnExisting is None else breakOnExisting
-                    )
-                    if effective_break:
-                        ydl_opts['break_on_existing'] = True
-                    else:
-                        ydl_opts.pop('break_on_existing', None)
-
-                    if not redownload:
-                        if self.archive_file:
-                            ydl_opts['download_archive'] = str(self.archive_file)
-                            logging.info(f"Using shared archive: {self.archive_file}")
-                        else:
-                            account_archive = Path(self.archive_dir) / f"{acc}.txt"
-                            ydl_opts['download_archive'] = str(account_archive)
-                            logging.info(f"Using per-account archive: {account_archive} for {acc}")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=int(self.controller.maximum)) as executor:
+            futures = {}
+            for acc in accounts:
+                # Clone ydl_opts and set archive file (shared or per-account)
+                ydl_opts = self.ydl_opts.copy()
+                if effective_break:
+                    ydl_opts['break_on_existing'] = True
+                else:
+                    ydl_opts.pop('break_on_existing', None)
+
+                if not redownload:
+                    if self.archive_file:
+                        ydl_opts['download_archive'] = self._download_archive(str(self.archive_file))
+                        logging.info(f"Using shared archive: {self.archive_file}")
                     else:
-                        ydl_opts.pop('download_archive', None)
-                        logging.info(f"Redownload enabled — skipping archive for {acc}.")
-                    futures[executor.submit(self.download_account, acc, ydl_opts)] = acc
-
-                for future in concurrent.futures.as_completed(futures):
-                    acc = futures[future]
-                    processed += 1
-                    job_manager.publish({
-                        "type": "soundcloud-account",
-                        "account": acc,
-                        "current": processed,
-                        "total": total_accounts,
-                    })
-
-            if i + self.burst_size < total_accounts:
-                pause = random.randint(self.min_pause, self.max_pause)
-                logging.info(f"Throttling pause: sleeping {pause} seconds...")
-                time.sleep(pause)
+                        account_archive = Path(self.archive_dir) / f"{acc}.txt"
+                        ydl_opts['download_archive'] = self._download_archive(str(account_archive))
+                        logging.info(f"Using per-account archive: {account_archive} for {acc}")
+                else:
+                    ydl_opts.pop('download_archive', None)
+                    logging.info(f"Redownload enabled — skipping archive for {acc}.")
+                crawl = self._crawl(acc, states, ydl_opts)
+                futures[executor.submit(self.download_account, acc, ydl_opts, crawl)] = acc
+
+            for future in concurrent.futures.as_completed(futures):
+                acc = futures[future]
+                processed += 1
+                job_manager.publish({
+                    "type": "soundcloud-account",
+                    "account": acc,
+                    "current": processed,
+                    "total": total_accounts,
+                })
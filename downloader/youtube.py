@@ -1,36 +1,55 @@
 import concurrent.futures
+from contextlib import closing
 import logging
 import os
-import random
 import time
 from typing import Optional
 
 from yt_dlp import YoutubeDL
 
+from downloader.AccountSchedule import (
+    AccountCrawl,
+    AccountSchedule,
+    AccountState,
+    HighWaterMarkReached,
+    youtube_schedule,
+)
+from downloader.ArchiveIndex import youtube_index
+from downloader.ConcurrencyController import (
+    SUCCESS,
+    THROTTLED,
+    AimdController,
+    classify,
+    download_controller,
+    http_status,
+)
+from downloader.Pipeline import song_pipeline
 from downloader.YoutubeSongProcessor import YoutubeSongProcessor
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+from postprocessing.Song.Helpers.WriteBehindBuffer import write_buffer
+
+YOUTUBE_HOST = "www.youtube.com"
 
 
 class YoutubeDownloader:
     def __init__(
         self,
         break_on_existing: bool = True,
-        max_workers: int = 1,
-        burst_size: int = 10,
-        min_pause: int = 1,
-        max_pause: int = 5,
         socket_timeout: int = 30,
+        use_archive_index: bool = True,
+        controller: Optional[AimdController] = None,
+        schedule: Optional[AccountSchedule] = None,
     ):
         self.output_folder = os.getenv("youtube_folder")
         self.archive_dir = os.getenv("youtube_archive")
         self.ffmpeg_location = os.getenv("ffmpeg-location", "usr/bin/local")
 
-        self.max_workers = max_workers
-        self.burst_size = burst_size
-        self.min_pause = min_pause
-        self.max_pause = max_pause
+        self.controller = controller or download_controller
+        self.schedule = schedule or youtube_schedule
+        self._pipeline = None
         self.socket_timeout = socket_timeout
         self.default_break_on_existing = break_on_existing
+        self.use_archive_index = use_archive_index
 
         if not self.output_folder or not self.archive_dir:
             logging.warning(
@@ -109,7 +128,11 @@ class YoutubeDownloader:
                 for pp in self._base_ydl_opts["postprocessors"]
             ]
         if not redownload:
-            opts["download_archive"] = archive_file
+            if self.use_archive_index and youtube_index.loaded:
+                # Checked in memory; the text file is still appended to
+                opts["download_archive"] = youtube_index.download_archive(archive_file)
+            else:
+                opts["download_archive"] = archive_file
         else:
             opts.pop("download_archive", None)
         if break_on_existing:
@@ -120,7 +143,7 @@ class YoutubeDownloader:
 
     def _create_ydl(self, ydl_opts: dict) -> YoutubeDL:
         ydl = YoutubeDL(ydl_opts)
-        ydl.add_post_processor(YoutubeSongProcessor())
+        ydl.add_post_processor(YoutubeSongProcessor(self._pipeline))
         return ydl
 
     def _match_filter(self, info):
@@ -131,7 +154,20 @@ class YoutubeDownloader:
             return "Outside allowed duration range"
         return None
 
-    def download_account(self, name: str, ydl_opts: dict = None):
+    def _crawl(
+        self, name: str, states: Optional[dict], ydl_opts: dict
+    ) -> Optional[AccountCrawl]:
+        """Stop the account's crawl at its high-water mark, if the marks could be loaded."""
+        if states is None:
+            return None
+        crawl = AccountCrawl(states.get(name) or AccountState(name), self._match_filter)
+        ydl_opts["match_filter"] = crawl.match_filter
+        ydl_opts["lazy_playlist"] = True
+        return crawl
+
+    def download_account(
+        self, name: str, ydl_opts: dict = None, crawl: Optional[AccountCrawl] = None
+    ):
         link = f"http://www.youtube.com/{name}"
         archive_file = os.path.join(self.archive_dir, f"{name}.txt")
         opts_template = ydl_opts or self._build_ydl_opts(
@@ -139,6 +175,8 @@ class YoutubeDownloader:
         )
 
         for attempt in range(1, 4):
+            if crawl:
+                crawl.reset()
             try:
                 opts = dict(opts_template)
                 if "postprocessors" in opts_template:
@@ -146,32 +184,38 @@ class YoutubeDownloader:
                         pp.copy() if isinstance(pp, dict) else pp
                         for pp in opts_template["postprocessors"]
                     ]
-                with self._create_ydl(opts) as ydl:
+                with self.controller.slot(YOUTUBE_HOST), self._create_ydl(opts) as ydl:
                     logging.info(f"Downloading from account: {name}")
-                    ydl.download([link])
+                    try:
+                        ydl.download([link])
+                    except HighWaterMarkReached as e:
+                        logging.info(f"{e} — stopping.")
+                if crawl:
+                    self.schedule.record(crawl)
                 logging.info(f"Finished downloading from: {name}")
                 return
             except Exception as e:
-                msg = str(e)
-                if "403" in msg:
-                    wait_time = random.randint(60, 300)
+                status = http_status(e)
+                outcome = classify(e)
+                # 403s and timeouts make the controller cool the host down before the retry
+                if status == 403:
                     logging.warning(
-                        f"403 Forbidden for {name}. Pausing {wait_time}s before retry..."
+                        f"403 Forbidden for {name}. Retrying after the host cool-down..."
                     )
-                    time.sleep(wait_time)
-                elif "404" in msg:
+                elif status == 404:
                     logging.info(f"Got 404 for {name} — skipping video.")
                     return
-                elif "already been recorded" in msg or "already in the archive" in msg:
+                elif outcome == SUCCESS:
                     logging.info(
                         f"All videos for {name} already in archive — skipping further attempts."
                     )
+                    if crawl:
+                        self.schedule.record(crawl)
                     return
-                elif "timed out" in msg.lower():
+                elif outcome == THROTTLED:
                     logging.warning(
-                        f"Timeout encountered for {name}. Attempt {attempt} failed: {e}"
+                        f"Throttled or timed out for {name}. Attempt {attempt} failed: {e}"
                     )
-                    time.sleep(5 * attempt)
                 else:
                     logging.warning(
                         f"Attempt {attempt} failed for {name}: {e}", exc_info=True
@@ -195,7 +239,7 @@ class YoutubeDownloader:
                 break_on_existing=breakOnExisting,
                 redownload=redownload,
             )
-            with self._create_ydl(opts) as ydl:
+            with self.controller.slot(YOUTUBE_HOST), self._create_ydl(opts) as ydl:
                 logging.info(f"Downloading from url: {url}")
                 ydl.download([url])
             logging.info("Finished downloading video")
@@ -204,8 +248,7 @@ class YoutubeDownloader:
 
     def get_accounts_from_db(self):
         try:
-            db = DatabaseConnector().connect()
-            with db.cursor() as cursor:
+            with closing(DatabaseConnector().connect()) as db, db.cursor() as cursor:
                 cursor.execute("SELECT name FROM youtube_accounts")
                 accounts = [row[0] for row in cursor.fetchall()]
             return accounts
@@ -223,11 +266,18 @@ class YoutubeDownloader:
             logging.warning("YouTube downloader is not configured; skipping run().")
             return
 
+        # High-water marks are not used when redownloading everything
+        states = None if redownload else self.schedule.load()
         try:
             if account:
                 accounts = [account]
+            elif states is not None:
+                accounts = self.schedule.due(states)
+                if not accounts:
+                    logging.info("No YouTube accounts due for a check.")
+                    return
             else:
-                accounts = self.get_accounts_from_db()
+                accounts = sorted(self.get_accounts_from_db())
         except Exception as e:
             logging.error(f"Database error while fetching YouTube accounts: {e}")
             return
@@ -236,44 +286,50 @@ class YoutubeDownloader:
             logging.warning("No YouTube accounts found in the database.")
             return
 
-        total_accounts = len(accounts)
-        accounts.sort()
+        if self.use_archive_index and not redownload:
+            youtube_index.load()
 
-        total_batches = (total_accounts + self.burst_size - 1) // self.burst_size
+        effective_break = (
+            self.default_break_on_existing if breakOnExisting is None else breakOnExisting
+        )
 
-        for i in range(0, total_accounts, self.burst_size):
-            batch = accounts[i : i + self.burst_size]
-            batch_index = i // self.burst_size + 1
-            logging.info(
-                "Processing YouTube batch %s of %s", batch_index, total_batches
-            )
+        self._pipeline = song_pipeline(
+            "youtube", YoutubeSongProcessor.archive, YoutubeSongProcessor.tag
+        )
+        self._pipeline.start()
+        try:
+            self._download_accounts(accounts, effective_break, redownload, states)
+        finally:
+            self._pipeline.close()
+            self._pipeline = None
+            write_buffer.flush()
 
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.max_workers
-            ) as executor:
-                futures = {}
-                for acc in batch:
-                    account_archive = os.path.join(self.archive_dir, f"{acc}.txt")
-                    effective_break = (
-                        self.default_break_on_existing
-                        if breakOnExisting is None
-                        else breakOnExisting
-                    )
-                    ydl_opts = self._build_ydl_opts(
-                        account_archive,
-                        break_on_existing=effective_break,
-                        redownload=redownload,
-                    )
-                    futures[executor.submit(self.download_account, acc, ydl_opts)] = acc
+        logging.info("YouTube concurrency: %s", self.controller.stats(YOUTUBE_HOST))
 
-                for future in concurrent.futures.as_completed(futures):
-                    acc = futures[future]
-                    try:
-                        future.result()
-                    except Exception as exc:
-                        logging.error(f"Unhandled error downloading {acc}: {exc}")
-
-            if i + self.burst_size < total_accounts:
-                pause = random.randint(self.min_pause, self.max_pause)
-                logging.info(f"Throttling pause: sleeping {pause} seconds...")
-                time.sleep(pause)
+    def _download_accounts(
+        self,
+        accounts: list[str],
+        effective_break: bool,
+        redownload: bool,
+        states: Optional[dict],
+    ):
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(self.controller.maximum)
+        ) as executor:
+            futures = {}
+            for acc in accounts:
+                account_archive = os.path.join(self.archive_dir, f"{acc}.txt")
+                ydl_opts = self._build_ydl_opts(
+                    account_archive,
+                    break_on_existing=effective_break,
+                    redownload=redownload,
+                )
+                crawl = self._crawl(acc, states, ydl_opts)
+                futures[executor.submit(self.download_account, acc, ydl_opts, crawl)] = acc
+
+            for future in concurrent.futures.as_completed(futures):
+                acc = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    logging.error(f"Unhandled error downloading {acc}: {exc}")
@@ -44,6 +44,11 @@ def main():
         help="optional break on existing for downloaders",
         action="store_true"
     )
+    parser.add_argument(
+        "--force",
+        help="Re-tag all files, ignoring the file-state index",
+        action="store_true"
+    )
     parser.add_argument(
         "--repeat",
         help="Repeat every hour",
@@ -106,6 +111,7 @@ def main():
             parse_youtube=parse_all or "tag-youtube" in steps,
             parse_generic=parse_all or "tag-generic" in steps,
             parse_telegram=parse_all or "tag-telegram" in steps,
+            force=args.force,
         )
 
     steps_to_run = [
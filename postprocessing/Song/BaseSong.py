@@ -1,6 +1,6 @@
 import logging
 import os
-import re
+import threading
 
 import mutagen
 from mutagen.easyid3 import EasyID3
@@ -10,13 +10,14 @@ from mutagen.mp4 import MP4, MP4StreamInfoError
 from mutagen.wave import WAVE
 
 from data.settings import Settings
+from postprocessing.Song.MetadataOnlyFile import MetadataOnlyMP3
 from postprocessing.Song.Tag import Tag
 from postprocessing.Song.TagCollection import TagCollection
 from postprocessing.Song.rules.AnalyzeBpmRule import AnalyzeBpmRule
 from postprocessing.Song.rules.NormalizeFlacTagsRule import NormalizeFlacTagsRule
 from postprocessing.Song.rules.TagRule import TagRule
 from postprocessing.constants import ARTIST, GENRE, WAVTags, MP4Tags, DATE, FESTIVAL, PARSED, CATALOG_NUMBER, \
-    PUBLISHER, COPYRIGHT, ALBUM_ARTIST, BPM, MusicFileType, TITLE, FLACTags, ARTIST_REGEX, REMIXER, ALBUM, TRACK_NUMBER
+    PUBLISHER, COPYRIGHT, ALBUM_ARTIST, BPM, MusicFileType, TITLE, FLACTags, Patterns, REMIXER, ALBUM, TRACK_NUMBER
 
 LOG_FILE = "broken-files.log"
 s = Settings()
@@ -33,12 +34,56 @@ def log_broken_file(pad: str):
         f.write(pad + "\n")
 
 
+class WriteStats:
+    """
+    Process-wide counters of committed songs: how many were only inspected
+    and how many were actually rewritten on disk (write amplification).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.inspected = 0
+        self.rewritten = 0
+        self.would_rewrite = 0
+
+    def record(self, rewritten: bool, would_rewrite: bool = False):
+        with self._lock:
+            self.inspected += 1
+            if rewritten:
+                self.rewritten += 1
+            if would_rewrite:
+                self.would_rewrite += 1
+
+    def reset(self):
+        with self._lock:
+            self.inspected = 0
+            self.rewritten = 0
+            self.would_rewrite = 0
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {"inspected": self.inspected, "rewritten": self.rewritten, "would_rewrite": self.would_rewrite}
+
+
+write_stats = WriteStats()
+
+
 class BaseSong:
     """
     Represents a single audio file and its associated metadata.
 
     Supports MP3, FLAC, WAV, M4A, and AAC (partial).
     Provides methods to read, clean, update, and save tags.
+
+    Changes are written once, explicitly, through commit() or by using the
+    song as a context manager::
+
+        with LabelSong(path) as song:
+            song.parse()
+
+    Leaving the block normally commits; an exception discards all changes.
+    A tag is only written when its canonical value differs from the value read
+    from disk, see diff(). With dry_run set, commit() only logs the diff.
     """
 
     def __init__(self, path, extra_info=None):
@@ -49,13 +94,20 @@ class BaseSong:
             path (str): Path to the audio file.
         """
         self.rules: list[TagRule] = []
+        self.committed = False
+        self.rewritten = False
+        self.would_rewrite = False
+        self.dry_run = False
+        self._dirty = False
+        self._original: dict[str, tuple[str, ...]] = {}
         paths = path.rsplit(s.delimiter, 2)
         self._path: str = path
         self._filename = str(paths[-1])
         self._extension = os.path.splitext(self._filename)[1].lower()
 
+        # FLAC, WAV and M4A keep their stream info in the headers that are read anyway
         music_file_classes = {
-            ".mp3": lambda p: (MP3(p, ID3=EasyID3), MusicFileType.MP3),
+            ".mp3": lambda p: (MetadataOnlyMP3(p) if s.metadata_only else MP3(p, ID3=EasyID3), MusicFileType.MP3),
             ".flac": lambda p: (FLAC(p), MusicFileType.FLAC),
             ".wav": lambda p: (WAVE(p), MusicFileType.WAV),
             ".m4a": lambda p: (MP4(p), MusicFileType.M4A)
@@ -82,6 +134,7 @@ class BaseSong:
         self.tag_collection = TagCollection(
             self.music_file.tags if self.type != MusicFileType.AAC else self.music_file
         )
+        self._original = {key: tag.canonical() for key, tag in self.tag_collection.get().items()}
 
         if extra_info:
             self._apply_extra_info(extra_info)
@@ -91,10 +144,75 @@ class BaseSong:
         if analyze_bpm:
             self.rules.append(AnalyzeBpmRule())
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            logging.warning(f"Discarding changes to {self._path}: {exc_type.__name__}")
+        return False
+
     def parse(self):
-        """Run all rules and persist any changes."""
+        """Run all rules. Changes are persisted by commit()."""
         self.run_all_rules()
-        self.save_file()
+
+    def commit(self, dry_run: bool | None = None) -> bool:
+        """
+        Writes all pending changes to disk in a single save.
+
+        Only the first call has an effect; it is recorded in write_stats.
+
+        Args:
+            dry_run: Only log the would-be writes; defaults to self.dry_run.
+
+        Returns:
+            bool: True if the file was rewritten.
+        """
+        if self.committed:
+            return self.rewritten
+        self.committed = True
+        if not hasattr(self, 'tag_collection'):
+            return False
+        if dry_run is None:
+            dry_run = self.dry_run
+        if dry_run:
+            changes = self.diff()
+            for tag, (old, new) in changes.items():
+                logging.info(f"[DRY] {self._path}: {tag} '{';'.join(old)}' -> '{';'.join(new)}'")
+            self.would_rewrite = bool(changes) or getattr(self, "_dirty", False)
+            write_stats.record(False, would_rewrite=self.would_rewrite)
+            return False
+        self.rewritten = self.save_file()
+        write_stats.record(self.rewritten)
+        return self.rewritten
+
+    def diff(self) -> dict[str, tuple[tuple[str, ...], tuple[str, ...]]]:
+        """
+        Returns the tags whose canonical value differs from the one read from disk.
+
+        Tags that were only re-normalised (whitespace, ordering, duplicates)
+        are not part of the diff and do not cause a write.
+
+        Returns:
+            dict: tag name -> (original values, new values)
+        """
+        if not hasattr(self, 'tag_collection'):
+            return {}
+        changes = {}
+        originals = getattr(self, "_original", {})
+        for key, tag in self.tag_collection.get().items():
+            if isinstance(tag, Tag) and tag.has_changes():
+                original = originals.get(key, ())
+                new = tag.canonical()
+                if new != original:
+                    changes[key] = (original, new)
+        return changes
+
+    def mark_dirty(self):
+        """Flags changes made directly on music_file, outside the tag collection."""
+        self._dirty = True
 
     def delete_tag(self, tag):
         """Removes a tag from both the tag collection and file if present."""
@@ -104,31 +222,33 @@ class BaseSong:
             self.tag_collection.get()[tag].remove()
 
     def split_artists(self, artist_str: str) -> list[str]:
-        raw = re.sub(ARTIST_REGEX, ";", artist_str)
+        raw = Patterns.ARTIST_SEPARATOR.sub(";", artist_str)
         return [name.strip() for name in raw.split(";") if name.strip()]
 
     def merge_and_sort_genres(self, a, b):
-        """Merges and sorts two lists of genres, removing duplicates."""
-        return sorted(set(a + b))
+        """Merges and sorts two genre sequences (lists or tuples), removing duplicates."""
+        return sorted(set(a).union(b))
 
     def sort_genres(self):
         """Sorts the genre tag array alphabetically if the tag exists."""
         if self.tag_collection.has_item(GENRE):
-            genres = self.tag_collection.get_item(GENRE)
-            genres.value.sort()
+            self.tag_collection.get_item(GENRE).sort()
 
-    def save_file(self):
+    def save_file(self) -> bool:
+        """Saves the file if any tag changed; prefer commit(). Returns True if it was saved."""
         if not hasattr(self, 'tag_collection'):
-            return
+            return False
 
-        changes = False
-        for tag in self.tag_collection.get().values():
-            if isinstance(tag, Tag) and tag.has_changes():
-                self.set_tag(tag)
-                changes = True
+        changes = getattr(self, "_dirty", False)
+        tags = self.tag_collection.get()
+        for key in self.diff():
+            self.set_tag(tags[key])
+            changes = True
         if changes:
             logging.info(f"File saved: {self.path()}")
             self.music_file.save()
+            self._dirty = False
+        return changes
 
     def set_tag(self, tag: Tag):
         """Sets a tag on the underlying music file based on type."""
@@ -248,7 +368,3 @@ class BaseSong:
         for rule in self.rules:
             rule.apply(self)
 
-    def __del__(self):
-        """Ensure changes are saved when the object is deleted."""
-        self.save_file()
-
@@ -4,6 +4,7 @@ import sitecustomize
 
 from mutagen.easyid3 import EasyID3
 from mutagen.id3 import ID3Tags
+from mutagen.mp4 import MP4StreamInfoError
 
 from postprocessing.Song.BaseSong import BaseSong, ExtensionNotSupportedException
 from postprocessing.Song.Tag import Tag
@@ -43,15 +44,17 @@ class BaseSongTest(unittest.TestCase):
 
     def test_sort_genres(self):
         song = BaseSong.__new__(BaseSong)
-        mock_tag = MagicMock()
-        mock_tag.value = ["Techno", "Hardcore", "Ambient"]
+        genres = Tag(GENRE, "Techno;Hardcore;Ambient")
+        original = genres.value
         tag_collection = MagicMock()
         tag_collection.has_item.return_value = True
-        tag_collection.get_item.return_value = mock_tag
+        tag_collection.get_item.return_value = genres
 
         song.tag_collection = tag_collection
         song.sort_genres()
-        self.assertEqual(mock_tag.value, ["Ambient", "Hardcore", "Techno"])
+        self.assertEqual(genres.value, ["Ambient", "Hardcore", "Techno"])
+        self.assertTrue(genres.changed)
+        self.assertEqual(original, ["Techno", "Hardcore", "Ambient"])
 
     def test_tag_accessors_delegate_to_tag_collection(self):
         song = BaseSong.__new__(BaseSong)
@@ -95,6 +98,88 @@ class BaseSongTest(unittest.TestCase):
 
         song.music_file.save.assert_called_once()
 
+    def _changed_song(self):
+        tag = Tag(tag=ARTIST, value="Original Artist")
+        tag.set("Some Artist")
+        song = BaseSong.__new__(BaseSong)
+        song.committed = False
+        song.rewritten = False
+        song.dry_run = False
+        song._original = {ARTIST: ("Original Artist",)}
+        song._path = "some/path/test.mp3"
+        song.music_file = MagicMock()
+        song.set_tag = MagicMock()
+        song.tag_collection = MagicMock()
+        song.tag_collection.get.return_value = {ARTIST: tag}
+        return song
+
+    @patch("postprocessing.Song.BaseSong.write_stats")
+    @patch("postprocessing.Song.BaseSong.logging")
+    def test_context_commits_once(self, mock_logging, mock_stats):
+        song = self._changed_song()
+        with song:
+            pass
+        self.assertTrue(song.commit())
+
+        song.music_file.save.assert_called_once()
+        mock_stats.record.assert_called_once_with(True)
+
+    @patch("postprocessing.Song.BaseSong.write_stats")
+    @patch("postprocessing.Song.BaseSong.logging")
+    def test_context_discards_changes_on_error(self, mock_logging, mock_stats):
+        song = self._changed_song()
+        with self.assertRaises(RuntimeError):
+            with song:
+                raise RuntimeError("rule failed")
+
+        song.music_file.save.assert_not_called()
+        mock_stats.record.assert_not_called()
+
+    @patch("postprocessing.Song.BaseSong.logging")
+    def test_normalisation_only_changes_are_not_saved(self, mock_logging):
+        song = self._changed_song()
+        tag = Tag(tag=GENRE, value=["Techno", "Hardcore"])
+        tag.set(["Hardcore ", "Techno", "Hardcore"])
+        self.assertTrue(tag.has_changes())
+        song._original = {GENRE: ("Hardcore", "Techno")}
+        song.tag_collection.get.return_value = {GENRE: tag}
+
+        self.assertEqual(song.diff(), {})
+        self.assertFalse(song.save_file())
+        song.music_file.save.assert_not_called()
+
+    @patch("postprocessing.Song.BaseSong.write_stats")
+    @patch("postprocessing.Song.BaseSong.logging")
+    def test_dry_run_reports_without_saving(self, mock_logging, mock_stats):
+        song = self._changed_song()
+
+        self.assertEqual(song.diff(), {ARTIST: (("Original Artist",), ("Some Artist",))})
+        self.assertFalse(song.commit(dry_run=True))
+
+        song.music_file.save.assert_not_called()
+        self.assertTrue(song.would_rewrite)
+        mock_stats.record.assert_called_once_with(False, would_rewrite=True)
+
+    @patch("postprocessing.Song.BaseSong.write_stats")
+    @patch("postprocessing.Song.BaseSong.log_broken_file")
+    @patch("postprocessing.Song.BaseSong.os.remove")
+    @patch("postprocessing.Song.BaseSong.MP4", side_effect=MP4StreamInfoError("broken"))
+    def test_broken_m4a_commits_nothing(self, mock_mp4, mock_remove, mock_log_broken, mock_stats):
+        song = BaseSong("some/path/broken.m4a")
+        mock_remove.assert_called_once_with("some/path/broken.m4a")
+
+        self.assertEqual(song.diff(), {})
+        self.assertFalse(song.commit(dry_run=True))
+        self.assertFalse(song.commit())
+        mock_stats.record.assert_not_called()
+
+    def test_parse_does_not_save(self):
+        song = self._changed_song()
+        song.rules = [MagicMock()]
+        song.parse()
+        song.rules[0].apply.assert_called_once_with(song)
+        song.music_file.save.assert_not_called()
+
     def test_apply_extra_info_sets_artist(self):
         song = BaseSong.__new__(BaseSong)
         tag_collection = MagicMock()
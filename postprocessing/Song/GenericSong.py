@@ -1,5 +1,6 @@
 from data.settings import Settings
 from postprocessing.Song.BaseSong import BaseSong
+from postprocessing.Song.RuleRegistry import rule_registry
 from postprocessing.Song.Helpers.Cache import databaseHelpers
 from postprocessing.Song.rules.AddMissingArtistToDatabaseRule import AddMissingArtistToDatabaseRule
 from postprocessing.Song.rules.AddMissingGenreToDatabaseRule import AddMissingGenreToDatabaseRule
@@ -10,6 +11,7 @@ from postprocessing.Song.rules.InferGenreFromArtistRule import InferGenreFromArt
 from postprocessing.Song.rules.InferGenreFromSubgenreRule import InferGenreFromSubgenreRule
 from postprocessing.Song.rules.InferRemixerFromTitleRule import InferRemixerFromTitleRule
 from postprocessing.Song.rules.ReplaceInvalidUnicodeRule import ReplaceInvalidUnicodeRule
+from postprocessing.Song.rules.TagRule import TagRule
 from postprocessing.constants import ALBUM_ARTIST, PUBLISHER, CATALOG_NUMBER, GENRE, ARTIST, COPYRIGHT, FormatEnum
 
 s = Settings()
@@ -26,45 +28,50 @@ class GenericSong(BaseSong):
                 self.tag_collection.set_item(COPYRIGHT, self.calculate_copyright())
         self.sort_genres()
 
-        self.rules.append(InferRemixerFromTitleRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"]
-        ))  # Extract remixer info from title and add to REMIXERS
+        self.rules.extend(rule_registry.get(type(self), self.build_rules))
+        super().parse()
 
-        self.rules.append(CleanTagsRule())  # Clean tags by executing regex
+    @staticmethod
+    def build_rules() -> list[TagRule]:
+        return [
+            InferRemixerFromTitleRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Extract remixer info from title and add to REMIXERS
 
-        self.rules.append(InferGenreFromArtistRule(
-            helper=databaseHelpers["artistGenreHelper"]
-        ))  # Infer genre based on artist lookup
+            CleanTagsRule(),  # Clean tags by executing regex
 
-        self.rules.append(InferGenreFromSubgenreRule(
-            databaseHelpers["subgenreHelper"]
-        ))  # Infer genre based on subgenre mapping
+            InferGenreFromArtistRule(
+                helper=databaseHelpers["artistGenreHelper"]
+            ),  # Infer genre based on artist lookup
 
-        self.rules.append(CleanTagsRule())  # Re-run cleanup after inference steps
+            InferGenreFromSubgenreRule(
+                databaseHelpers["subgenreHelper"]
+            ),  # Infer genre based on subgenre mapping
 
-        self.rules.append(AddMissingArtistToDatabaseRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"]
-        ))  # Prompt user to classify unknown artists (valid/ignored/corrected)
+            CleanTagsRule(),  # Re-run cleanup after inference steps
 
-        self.rules.append(AddMissingGenreToDatabaseRule(
-            genre_db=databaseHelpers["genres"],
-            ignored_db=databaseHelpers["ignored_genres"]
-        ))  # Prompt user to classify unknown genres (valid/ignored/corrected)
+            AddMissingArtistToDatabaseRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Prompt user to classify unknown artists (valid/ignored/corrected)
 
-        self.rules.append(CleanAndFilterGenreRule(
-            databaseHelpers["genres"]
-        ))
+            AddMissingGenreToDatabaseRule(
+                genre_db=databaseHelpers["genres"],
+                ignored_db=databaseHelpers["ignored_genres"]
+            ),  # Prompt user to classify unknown genres (valid/ignored/corrected)
 
-        self.rules.append(CheckArtistRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"]
-        ))  # Normalize/correct/remove tags based on artist DB state
+            CleanAndFilterGenreRule(
+                databaseHelpers["genres"]
+            ),
 
-        self.rules.append(ReplaceInvalidUnicodeRule())
+            CheckArtistRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Normalize/correct/remove tags based on artist DB state
 
-        super().parse()
+            ReplaceInvalidUnicodeRule(),
+        ]
 
     def calculate_copyright(self):
         album_artist = self.album_artist()
@@ -0,0 +1,90 @@
+from collections import deque
+from typing import Iterable, Iterator
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class AhoCorasick:
+    """
+    Case-insensitive multi-pattern matcher (Aho–Corasick automaton).
+
+    Finds every occurrence of every pattern in a single pass over the input,
+    independent of the number of patterns. Build it once and reuse it.
+
+    With word_boundaries=True a match only counts when it sits on regex-style
+    word boundaries on both ends, like ``\\bpattern\\b``.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        self._size = 0
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern.lower())
+        self._link()
+
+    def __len__(self):
+        return self._size
+
+    def _add(self, pattern: str):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        if pattern not in self._out[state]:
+            self._out[state] += (pattern,)
+            self._size += 1
+
+    def _link(self):
+        """Computes failure links breadth-first and merges the output sets along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str, word_boundaries: bool = False) -> Iterator[tuple[int, int, str]]:
+        """
+        Yields (start, end, pattern) for every match in the lowercased text.
+        """
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            end = index + 1
+            for pattern in out[state]:
+                start = end - len(pattern)
+                if word_boundaries and not (self._at_boundary(text, start) and self._at_boundary(text, end)):
+                    continue
+                yield start, end, pattern
+
+    def find_all(self, text: str, word_boundaries: bool = False) -> set[str]:
+        """Returns the distinct (lowercase) patterns occurring in the text."""
+        return {pattern for _, _, pattern in self.iter_matches(text, word_boundaries)}
+
+    @staticmethod
+    def _at_boundary(text: str, index: int) -> bool:
+        before = index > 0 and _is_word_char(text[index - 1])
+        after = index < len(text) and _is_word_char(text[index])
+        return before != after
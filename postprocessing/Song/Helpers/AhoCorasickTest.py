@@ -0,0 +1,38 @@
+import re
+import unittest
+
+from postprocessing.Song.Helpers.AhoCorasick import AhoCorasick
+
+
+class AhoCorasickTest(unittest.TestCase):
+    def setUp(self):
+        self.matcher = AhoCorasick(["he", "she", "his", "hers", "Hard Core", ""])
+
+    def test_finds_overlapping_patterns_in_one_pass(self):
+        self.assertEqual(self.matcher.find_all("ushers"), {"he", "she", "hers"})
+
+    def test_is_case_insensitive(self):
+        self.assertEqual(self.matcher.find_all("HARD CORE night"), {"hard core"})
+
+    def test_reports_positions(self):
+        matches = sorted(self.matcher.iter_matches("xhisx"))
+        self.assertEqual(matches, [(1, 4, "his")])
+
+    def test_word_boundaries(self):
+        self.assertEqual(self.matcher.find_all("ushers", word_boundaries=True), set())
+        self.assertEqual(self.matcher.find_all("she said hers", word_boundaries=True), {"she", "hers"})
+
+    def test_ignores_empty_patterns(self):
+        self.assertEqual(len(self.matcher), 5)
+        self.assertEqual(AhoCorasick([]).find_all("anything"), set())
+
+    def test_matches_regex_word_boundary_semantics(self):
+        patterns = ["drum & bass", "d&b", "uk hardcore", "core"]
+        matcher = AhoCorasick(patterns)
+        for text in ["Drum & Bass mix", "d&b/uk hardcore", "hardcore", "(core)", "uk hardcore_2"]:
+            expected = {p for p in patterns if re.search(rf"\b{re.escape(p)}\b", text, re.IGNORECASE)}
+            self.assertEqual(matcher.find_all(text, word_boundaries=True), expected, text)
+
+
+if __name__ == "__main__":
+    unittest.main()
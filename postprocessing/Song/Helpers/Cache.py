@@ -1,13 +1,16 @@
+from postprocessing.Song.Helpers.FestivalHelper import FestivalHelper
 from postprocessing.Song.Helpers.FilterTableHelper import FilterTableHelper
 from postprocessing.Song.Helpers.LookupTableHelper import LookupTableHelper
 from postprocessing.Song.Helpers.TableHelper import TableHelper
+from postprocessing.Song.Helpers.WriteBehindBuffer import write_buffer
 
 databaseHelpers = {
-    "artists": TableHelper("artists", "name"),
-    "ignored_artists": FilterTableHelper("ignored_artists", "name", "corrected_name"),
-    "genres": FilterTableHelper("genres", "genre", "corrected_genre"),
-    "ignored_genres": FilterTableHelper("ignored_genres", "name", "corrected_name"),
+    "artists": TableHelper("artists", "name", write_buffer=write_buffer),
+    "ignored_artists": FilterTableHelper("ignored_artists", "name", "corrected_name", write_buffer=write_buffer),
+    "genres": FilterTableHelper("genres", "genre", "corrected_genre", write_buffer=write_buffer),
+    "ignored_genres": FilterTableHelper("ignored_genres", "name", "corrected_name", write_buffer=write_buffer),
     "artistGenreHelper": LookupTableHelper("artist_genre", "artist", "genre"),
     "labelGenreHelper": LookupTableHelper("label_genre", "label", "genre"),
     "subgenreHelper": LookupTableHelper("subgenre_genre", "subgenre", "genre"),
+    "festivalHelper": FestivalHelper(),
 }
\ No newline at end of file
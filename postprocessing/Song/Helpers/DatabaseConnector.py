@@ -1,7 +1,172 @@
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
 import pymysql
 import logging
 
+
+class PooledConnection:
+    """
+    Thin wrapper around a pymysql connection checked out from a ConnectionPool.
+
+    Behaves like the wrapped connection, except that close() hands it back to
+    the pool instead of closing the socket. Usable as a context manager.
+    """
+
+    def __init__(self, pool: "ConnectionPool", connection):
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name):
+        connection = self.__dict__.get("_connection")
+        if connection is None:
+            raise pymysql.err.InterfaceError(0, "Connection was returned to the pool")
+        return getattr(connection, name)
+
+    def close(self):
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            self._pool.release(connection)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # Safety net for callers that never call close()
+        if self.__dict__.get("_connection") is not None:
+            self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe, bounded pool of database connections.
+
+    Idle connections are health-checked with ping() on checkout and replaced
+    when dead. Callers block up to `timeout` seconds when all connections are
+    in use. Open transactions are rolled back when a connection is returned.
+    """
+
+    def __init__(self, factory, max_size: int = 16, timeout: float = 30):
+        self._factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+
+        self._idle = deque()
+        self._size = 0
+        self._condition = threading.Condition()
+
+        self.in_use = 0
+        self.created = 0
+        self.checkouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def acquire(self) -> PooledConnection:
+        started = time.monotonic()
+        with self._condition:
+            while not self._idle and self._size >= self.max_size:
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise TimeoutError(f"No database connection available after {self.timeout}s")
+                self._condition.wait(remaining)
+
+            connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                self._size += 1
+            self.in_use += 1
+            self.checkouts += 1
+            waited = time.monotonic() - started
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+        if connection is not None and not self._is_alive(connection):
+            self._close_quietly(connection)
+            connection = None
+
+        if connection is None:
+            try:
+                connection = self._factory()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self.in_use -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self.created += 1
+
+        return PooledConnection(self, connection)
+
+    def release(self, connection):
+        try:
+            connection.rollback()
+            reusable = True
+        except Exception:
+            reusable = False
+
+        with self._condition:
+            self.in_use -= 1
+            if reusable:
+                self._idle.append(connection)
+            else:
+                self._size -= 1
+            self._condition.notify()
+        if not reusable:
+            self._close_quietly(connection)
+
+    @contextmanager
+    def connection(self):
+        pooled = self.acquire()
+        try:
+            yield pooled
+        finally:
+            pooled.close()
+
+    def metrics(self) -> dict:
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self.in_use,
+                "created": self.created,
+                "checkouts": self.checkouts,
+                "wait_time": round(self.wait_time, 3),
+                "max_wait_time": round(self.max_wait_time, 3),
+            }
+
+    def close_all(self):
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+        for connection in idle:
+            self._close_quietly(connection)
+
+    @staticmethod
+    def _is_alive(connection) -> bool:
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools: dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
 class DatabaseConnector:
     def __init__(self):
         self.host = os.getenv("DB_HOST")
@@ -16,10 +181,40 @@ class DatabaseConnector:
         self.db = os.getenv("DB_DB")
         # Fail fast if the database cannot be reached
         self.connect_timeout = int(os.getenv('DB_CONNECT_TIMEOUT', '5'))
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '16'))
+        self.pool_timeout = float(os.getenv('DB_POOL_TIMEOUT', '30'))
 
     def connect(self):
+        """
+        Checks out a connection from the shared pool.
+        Calling close() on it returns it to the pool.
+        """
+        return self.pool().acquire()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks out a pooled connection and always returns it."""
+        with self.pool().connection() as connection:
+            yield connection
+
+    def pool(self) -> ConnectionPool:
+        """Returns the process-wide pool for these connection parameters."""
         if not all([self.host, self.user, self.password, self.db, self.port]):
             raise RuntimeError("Database connection parameters are not fully configured")
+
+        key = (os.getpid(), self.host, self.port, self.user, self.password, self.db, self.connect_timeout)
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(self._create_connection, self.pool_size, self.pool_timeout)
+                _pools[key] = pool
+            return pool
+
+    def metrics(self) -> dict:
+        """Pool metrics: size, idle, in_use, created, checkouts and wait times."""
+        return self.pool().metrics()
+
+    def _create_connection(self):
         return pymysql.connect(
             host=self.host,
             port=self.port,
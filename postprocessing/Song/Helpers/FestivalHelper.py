@@ -1,8 +1,10 @@
 import logging
-import re
+import threading
+import time
 from typing import Optional
 
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+from postprocessing.constants import Patterns
 
 
 class FestivalHelper:
@@ -10,11 +12,76 @@ class FestivalHelper:
     Helper class to identify festivals and their corresponding years/dates
     based on a string input (typically filenames or folder names).
     Looks up results from a SQL table, defaulting to 'festival_data'.
+
+    With preload enabled the table is kept in memory, bucketed by year with the
+    longest names first, and reloaded once `ttl` seconds have passed, so lookups
+    cost no database round-trips. A failed load is retried after `retry_backoff`
+    seconds, doubling up to `ttl` while the database stays unreachable.
     """
 
-    def __init__(self, table_name: str = "festival_data"):
+    def __init__(self, table_name: str = "festival_data", preload: bool = True, ttl: float = 3600,
+                 retry_backoff: float = 30):
         self.table_name = table_name
         self.db_connector = DatabaseConnector()
+        self.cache_enabled = preload
+        self.ttl = ttl
+        self.retry_backoff = retry_backoff
+
+        self._by_year: dict[int, list[tuple[str, str, object]]] = {}
+        self._loaded_at: float | None = None
+        self._retry_at: float | None = None
+        self._backoff = retry_backoff
+        self._lock = threading.Lock()
+
+        if preload:
+            self._preload()
+
+    def _preload(self):
+        """Load all festivals into per-year buckets, longest name first."""
+        query = f"SELECT festival, year, date FROM {self.table_name}"
+        try:
+            connection = self.db_connector.connect()
+        except Exception as e:
+            logging.error(f"[FestivalHelper] Error preloading {self.table_name}: {e}")
+            self._schedule_retry()
+            return
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query)
+                by_year = {}
+                for festival, year, date in cursor.fetchall():
+                    if festival and year:
+                        by_year.setdefault(int(year), []).append((festival.lower(), festival, date))
+            for festivals in by_year.values():
+                festivals.sort(key=lambda entry: len(entry[0]), reverse=True)
+            self._by_year = by_year
+            self._loaded_at = time.monotonic()
+            self._retry_at = None
+            self._backoff = self.retry_backoff
+        except Exception as e:
+            logging.error(f"[FestivalHelper] Error preloading {self.table_name}: {e}")
+            self._schedule_retry()
+        finally:
+            connection.close()
+
+    def _schedule_retry(self):
+        """Keeps serving the last loaded table and tries again after a growing back-off."""
+        self._retry_at = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, max(self.ttl, self.retry_backoff))
+
+    def invalidate(self):
+        """Forces a reload on the next lookup, e.g. after festival_data was edited."""
+        self._loaded_at = None
+        self._retry_at = None
+
+    def _ensure_fresh(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._retry_at is not None and now < self._retry_at:
+                return
+            if self._loaded_at is None or now - self._loaded_at >= self.ttl:
+                self._preload()
 
     def get(self, input_string: str) -> Optional[dict]:
         """
@@ -30,6 +97,16 @@ class FestivalHelper:
             logging.debug("[FestivalHelper] No year found in input.")
             return None
 
+        input_lower = input_string.lower()
+        if self.cache_enabled:
+            self._ensure_fresh()
+            # buckets are sorted longest first, so the first hit is the most specific
+            for festival_lower, festival, date in self._by_year.get(year, ()):
+                if festival_lower in input_lower:
+                    return self._result(festival, year, date)
+            logging.debug("[FestivalHelper] No matching festival found.")
+            return None
+
         query = f"SELECT festival, date FROM {self.table_name} WHERE year = %s"
         connection = self.db_connector.connect()
 
@@ -38,7 +115,6 @@ class FestivalHelper:
                 cursor.execute(query, (year,))
                 rows = cursor.fetchall()
 
-                input_lower = input_string.lower()
                 matches = [
                     (festival, date)
                     for festival, date in rows
@@ -53,11 +129,7 @@ class FestivalHelper:
                 matches.sort(key=lambda x: len(x[0]), reverse=True)
                 best_match = matches[0]
 
-                return {
-                    "festival": best_match[0],
-                    "year": year,
-                    "date": best_match[1].isoformat()
-                }
+                return self._result(best_match[0], year, best_match[1])
 
         except Exception as e:
             logging.error(f"[FestivalHelper] Error querying {self.table_name}: {e}")
@@ -65,6 +137,14 @@ class FestivalHelper:
         finally:
             connection.close()
 
+    @staticmethod
+    def _result(festival: str, year: int, date) -> dict:
+        return {
+            "festival": festival,
+            "year": year,
+            "date": date.isoformat()
+        }
+
     def _extract_year(self, text: str) -> Optional[int]:
         """
         Extracts a 4-digit year (starting with 20xx) from the input string.
@@ -72,5 +152,5 @@ class FestivalHelper:
         Returns:
             int or None: The extracted year, or None if not found.
         """
-        match = re.search(r"\b(20\d{2})\b", text)
+        match = Patterns.YEAR.search(text)
         return int(match.group(1)) if match else None
@@ -17,7 +17,7 @@ class FestivalHelperTest(unittest.TestCase):
         self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
         self.mock_connector_cls.return_value.connect.return_value = self.mock_connection
 
-        self.helper = FestivalHelper()
+        self.helper = FestivalHelper(preload=False)
 
     def test_extract_year_valid(self):
         self.assertEqual(self.helper._extract_year("Defqon.1 Weekend Festival 2022"), 2022)
@@ -70,6 +70,54 @@ class FestivalHelperTest(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_connection.close.assert_called_once()
 
+    def _cached_helper(self, ttl=3600):
+        self.mock_cursor.fetchall.return_value = [
+            ("Rebirth", 2023, date(2023, 4, 8)),
+            ("Rebirth Festival", 2023, date(2023, 4, 9)),
+            ("Defqon.1", 2022, date(2022, 6, 24)),
+        ]
+        helper = FestivalHelper(ttl=ttl)
+        self.mock_cursor.execute.reset_mock()
+        return helper
+
+    def test_cached_get_uses_year_bucket_and_longest_match(self):
+        helper = self._cached_helper()
+
+        result = helper.get("liveset from rebirth festival 2023")
+        self.assertEqual(result, {"festival": "Rebirth Festival", "year": 2023, "date": "2023-04-09"})
+        self.assertIsNone(helper.get("Defqon.1 2023"))
+        self.assertEqual(helper.get("Defqon.1 2022")["festival"], "Defqon.1")
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_cache_reloads_after_ttl_or_invalidate(self):
+        helper = self._cached_helper(ttl=0)
+        helper.get("Defqon.1 2022")
+        self.mock_cursor.execute.assert_called_once()
+
+        helper.ttl = 3600
+        helper.get("Defqon.1 2022")
+        self.mock_cursor.execute.assert_called_once()
+
+        helper.invalidate()
+        helper.get("Defqon.1 2022")
+        self.assertEqual(self.mock_cursor.execute.call_count, 2)
+
+    def test_failed_preload_retries_after_backoff(self):
+        self.mock_connector_cls.return_value.connect.side_effect = Exception("DB down")
+        with patch("postprocessing.Song.Helpers.FestivalHelper.time.monotonic", return_value=100.0) as clock:
+            helper = FestivalHelper(ttl=3600, retry_backoff=10)
+            self.assertIsNone(helper._loaded_at)
+
+            clock.return_value = 105.0
+            self.assertIsNone(helper.get("Defqon.1 2022"))
+            self.assertEqual(self.mock_connector_cls.return_value.connect.call_count, 1)
+
+            self.mock_connector_cls.return_value.connect.side_effect = None
+            self.mock_cursor.fetchall.return_value = [("Defqon.1", 2022, date(2022, 6, 24))]
+            clock.return_value = 111.0
+            self.assertEqual(helper.get("Defqon.1 2022")["festival"], "Defqon.1")
+            self.assertEqual(helper._loaded_at, 111.0)
+
 
 if __name__ == "__main__":
     unittest.main()
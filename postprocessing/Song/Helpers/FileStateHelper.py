@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+
+from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+
+
+def compute_rules_version() -> str:
+    """
+    Returns a short hash over the song, rule and helper sources and constants.py.
+
+    Any change to a song type, tag rule, lookup helper or shared pattern yields
+    a new version, so files tagged with an older rule set are picked up again
+    on the next run.
+    """
+    song_dir = Path(__file__).resolve().parent.parent
+    package_dir = song_dir.parent
+    sources = sorted(
+        list(song_dir.glob("*.py"))
+        + list((song_dir / "rules").glob("*.py"))
+        + list((song_dir / "Helpers").glob("*.py"))
+        + [package_dir / "constants.py"]
+    )
+    digest = hashlib.sha1()
+    for source in sources:
+        if source.stem.endswith("Test"):
+            continue
+        digest.update(source.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class FileStateHelper:
+    """
+    Helper class to remember which song files were already tagged.
+    Stores path, size, mtime and rule-set version in the 'file_state' table,
+    so the Tagger can skip files that did not change since the last run.
+    """
+
+    def __init__(self, table_name="file_state", flush_size=500, rules_version: str | None = None):
+        self.table_name = table_name
+        self.db_connector = DatabaseConnector()
+        self.flush_size = flush_size
+        self.rules_version = rules_version or compute_rules_version()
+
+        self._states: dict[str, tuple[int, int, str]] = {}
+        self._pending: list[tuple[str, str, int, int, str]] = []
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Load all known file states from the database into memory."""
+        query = f"SELECT path, size, mtime_ns, rules_version FROM {self.table_name}"
+        try:
+            connection = self.db_connector.connect()
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Error loading file states: {e}")
+            return
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query)
+                states = {
+                    str(path): (int(size), int(mtime_ns), str(version))
+                    for path, size, mtime_ns, version in cursor.fetchall()
+                }
+            with self._lock:
+                self._states = states
+            logging.info(f"[{self.table_name}] Loaded {len(states)} file states (rules {self.rules_version})")
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Error loading file states: {e}")
+        finally:
+            connection.close()
+
+    def is_unchanged(self, path: str) -> bool:
+        """
+        Returns True if the file still has the size, mtime and rule-set version
+        recorded after its last successful tag pass.
+        """
+        with self._lock:
+            state = self._states.get(path)
+        if state is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return state == (stat.st_size, stat.st_mtime_ns, self.rules_version)
+
+    def mark(self, path: str):
+        """
+        Records the current on-disk state of a freshly tagged file.
+        Must be called after the song was saved, so the new mtime is stored.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logging.warning(f"[{self.table_name}] Could not stat {path}: {e}")
+            return
+
+        state = (stat.st_size, stat.st_mtime_ns, self.rules_version)
+        path_hash = hashlib.sha1(path.encode("utf-8", "surrogateescape")).hexdigest()
+        with self._lock:
+            self._states[path] = state
+            self._pending.append((path_hash, path, *state))
+            should_flush = len(self._pending) >= self.flush_size
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Writes all pending file states to the database in one batch."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        query = f"""
+            INSERT INTO {self.table_name} (path_hash, path, size, mtime_ns, rules_version)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                size = VALUES(size),
+                mtime_ns = VALUES(mtime_ns),
+                rules_version = VALUES(rules_version)
+        """
+        try:
+            connection = self.db_connector.connect()
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Error storing file states: {e}")
+            return
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.executemany(query, pending)
+            connection.commit()
+        except Exception as e:
+            logging.error(f"[{self.table_name}] Error storing file states: {e}")
+            connection.rollback()
+        finally:
+            connection.close()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from postprocessing.Song.Helpers.FileStateHelper import FileStateHelper, compute_rules_version
+
+
+class FileStateHelperTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("postprocessing.Song.Helpers.FileStateHelper.DatabaseConnector")
+        self.addCleanup(patcher.stop)
+        self.mock_connector_cls = patcher.start()
+
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.mock_connector_cls.return_value.connect.return_value = self.mock_connection
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.path = os.path.join(self.tempdir.name, "song.mp3")
+        with open(self.path, "wb") as f:
+            f.write(b"data")
+
+        self.helper = FileStateHelper(rules_version="v1", flush_size=10)
+
+    def _stored_row(self, version="v1"):
+        stat = os.stat(self.path)
+        return self.path, stat.st_size, stat.st_mtime_ns, version
+
+    def test_unknown_file_is_changed(self):
+        self.mock_cursor.fetchall.return_value = []
+        self.helper.load()
+        self.assertFalse(self.helper.is_unchanged(self.path))
+
+    def test_loaded_file_is_unchanged(self):
+        self.mock_cursor.fetchall.return_value = [self._stored_row()]
+        self.helper.load()
+        self.assertTrue(self.helper.is_unchanged(self.path))
+
+    def test_modified_file_is_changed(self):
+        self.mock_cursor.fetchall.return_value = [self._stored_row()]
+        self.helper.load()
+        with open(self.path, "ab") as f:
+            f.write(b"more")
+        self.assertFalse(self.helper.is_unchanged(self.path))
+
+    def test_new_rules_version_is_changed(self):
+        self.mock_cursor.fetchall.return_value = [self._stored_row(version="v0")]
+        self.helper.load()
+        self.assertFalse(self.helper.is_unchanged(self.path))
+
+    def test_mark_updates_cache_and_flushes_batch(self):
+        self.helper.mark(self.path)
+        self.assertTrue(self.helper.is_unchanged(self.path))
+        self.mock_cursor.executemany.assert_not_called()
+
+        self.helper.flush()
+        self.mock_cursor.executemany.assert_called_once()
+        rows = self.mock_cursor.executemany.call_args.args[1]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][1], self.path)
+        self.mock_connection.commit.assert_called_once()
+
+    def test_flush_without_pending_skips_db(self):
+        self.helper.flush()
+        self.mock_connector_cls.return_value.connect.assert_not_called()
+
+    def test_rules_version_covers_constants_and_helpers(self):
+        original = Path.read_bytes
+        baseline = compute_rules_version()
+        for name in ("constants.py", "FestivalHelper.py"):
+            def read_bytes(path, name=name):
+                data = original(path)
+                return data + b"# changed" if path.name == name else data
+
+            with patch.object(Path, "read_bytes", read_bytes):
+                self.assertNotEqual(compute_rules_version(), baseline, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,15 +3,19 @@ from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
 
 
 class FilterTableHelper:
-    def __init__(self, table_name: str, column_name: str, corrected_column_name: str, preload: bool = True):
+    def __init__(self, table_name: str, column_name: str, corrected_column_name: str, preload: bool = True,
+                 write_buffer=None):
         self.table_name = table_name
         self.column_name = column_name
         self.corrected_column_name = corrected_column_name
         self.db_connector = DatabaseConnector()
         self.cache_enabled = preload
+        self.write_buffer = write_buffer  # optional WriteBehindBuffer for batched inserts
 
+        # both keyed by lowercase name, so cached lookups are case-insensitive hash hits
         self._exists_cache = set()
         self._corrected_map = {}
+        self.version = 0  # bumped on every change, lets consumers rebuild derived data
 
         if preload:
             self._preload()
@@ -30,18 +34,23 @@ class FilterTableHelper:
                 for row in cursor.fetchall():
                     name = str(row[0]).strip()
                     corrected = str(row[1]).strip() if row[1] else ""
-                    self._exists_cache.add(name)
-                    if corrected:
-                        self._corrected_map[name] = corrected
+                    self._cache(name, corrected)
+            self.version += 1
         except Exception as e:
             logging.error(f"[{self.table_name}] Error preloading table: {e}")
         finally:
             connection.close()
 
+    def _cache(self, name: str, corrected: str | None):
+        key = name.lower()
+        self._exists_cache.add(key)
+        if corrected:
+            self._corrected_map[key] = corrected
+
     def exists(self, key: str) -> bool:
         key = key.strip()
         if self.cache_enabled:
-            return key.lower() in (k.lower() for k in self._exists_cache)
+            return key.lower() in self._exists_cache
 
         query = f"SELECT 1 FROM {self.table_name} WHERE {self.column_name} = %s LIMIT 1"
         connection = self.db_connector.connect()
@@ -59,7 +68,7 @@ class FilterTableHelper:
     def get_corrected(self, key: str) -> str:
         key = key.strip()
         if self.cache_enabled:
-            return self._corrected_map.get(key, "")
+            return self._corrected_map.get(key.lower(), "")
 
         query = (
             f"SELECT {self.corrected_column_name} "
@@ -81,9 +90,10 @@ class FilterTableHelper:
     def get_corrected_or_exists(self, key: str) -> str | bool:
         key = key.strip()
         if self.cache_enabled:
-            if key in self._corrected_map:
-                return self._corrected_map[key]
-            elif key in self._exists_cache:
+            key_lower = key.lower()
+            if key_lower in self._corrected_map:
+                return self._corrected_map[key_lower]
+            elif key_lower in self._exists_cache:
                 return key
             else:
                 return False
@@ -121,6 +131,12 @@ class FilterTableHelper:
         placeholders = ", ".join(["%s"] * len(columns))
         column_names = ", ".join(columns)
         query = f"INSERT INTO {self.table_name} ({column_names}) VALUES ({placeholders})"
+        if self.cache_enabled:
+            self._cache(key, corrected)
+        self.version += 1
+        if self.write_buffer is not None:
+            self.write_buffer.add(self.table_name, tuple(columns), tuple(values))
+            return True
 
         connection = self.db_connector.connect()
         try:
@@ -67,5 +67,23 @@ class FilterTableHelperTest(unittest.TestCase):
         result = self.helper.get_all()
         self.assertEqual(result, ["Hardcore", "Speedcore", "Terror"])
 
+    def test_cached_lookups_are_case_insensitive(self):
+        self.mock_cursor.fetchall.return_value = [("Hard Tek", "Hardtek"), ("Rave", None)]
+        helper = FilterTableHelper("genres", "name", "corrected_name")
+
+        self.assertTrue(helper.exists("hard tek"))
+        self.assertEqual(helper.get_corrected("HARD TEK"), "Hardtek")
+        self.assertEqual(helper.get_corrected_or_exists("hard tek"), "Hardtek")
+        self.assertEqual(helper.get_corrected_or_exists("rave"), "rave")
+        self.assertFalse(helper.get_corrected_or_exists("jazz"))
+
+    def test_add_updates_cache(self):
+        self.mock_cursor.fetchall.return_value = []
+        helper = FilterTableHelper("genres", "name", "corrected_name")
+        helper.add("Terror", "Terrorcore")
+
+        self.assertTrue(helper.exists("terror"))
+        self.assertEqual(helper.get_corrected("terror"), "Terrorcore")
+
 
 unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(FilterTableHelperTest))
@@ -1,4 +1,6 @@
 import logging
+
+from postprocessing.Song.Helpers.AhoCorasick import AhoCorasick
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
 
 
@@ -21,7 +23,9 @@ class LookupTableHelper:
         self.db_connector = DatabaseConnector()
         self.cache_enabled = preload
 
-        self._kv_map = {}
+        self._kv_map: dict[str, tuple[str, ...]] = {}  # lowercase key -> values
+        self._matcher = AhoCorasick(())  # rebuilt together with _kv_map
+        self.version = 0  # bumped on every change, lets consumers rebuild derived data
 
         if preload:
             self._preload()
@@ -37,25 +41,30 @@ class LookupTableHelper:
         try:
             with connection.cursor() as cursor:
                 cursor.execute(query)
+                kv_map = {}
                 for key, value in cursor.fetchall():
                     if key is None or value is None:
                         continue
-                    key = str(key).strip()
+                    key = str(key).strip().lower()
                     value = str(value).strip()
-                    self._kv_map.setdefault(key, []).append(value)
+                    kv_map.setdefault(key, []).append(value)
+            self._kv_map = {key: tuple(values) for key, values in kv_map.items()}
+            self._matcher = AhoCorasick(self._kv_map)
+            self.version += 1
         except Exception as e:
             logging.error(f"[{self.table_name}] Failed to preload key-value pairs: {e}")
         finally:
             connection.close()
 
-    def get(self, key: str) -> list[str]:
+    def get(self, key: str) -> tuple[str, ...]:
+        """
+        Returns all values mapped to a key (case-insensitive).
+
+        The result is an immutable tuple shared with the cache.
+        """
         key = key.strip()
         if self.cache_enabled:
-            key_lower = key.lower()
-            for existing_key, values in self._kv_map.items():
-                if existing_key.lower() == key_lower:
-                    return values
-            return []
+            return self._kv_map.get(key.lower(), ())
 
         # fallback to DB
         query = f"SELECT {self.value_column_name} FROM {self.table_name} WHERE LOWER({self.key_column_name}) = LOWER(%s)"
@@ -63,27 +72,27 @@ class LookupTableHelper:
             connection = self.db_connector.connect()
         except Exception as e:
             logging.error(f"[{self.table_name}] Failed to get values for key '{key}': {e}")
-            return []
+            return ()
         try:
             with connection.cursor() as cursor:
                 cursor.execute(query, (key,))
-                return [str(row[0]).strip() for row in cursor.fetchall()]
+                return tuple(str(row[0]).strip() for row in cursor.fetchall())
         except Exception as e:
             logging.error(f"[{self.table_name}] Failed to get values for key '{key}': {e}")
-            return []
+            return ()
         finally:
             connection.close()
 
-    def get_substring(self, input_string: str) -> list[str]:
-        input_lower = input_string.lower()
+    def get_substring(self, input_string: str, word_boundaries: bool = False) -> list[str]:
+        """
+        Returns the sorted values of every key that occurs in the input string.
+
+        Args:
+            input_string: Text to search, e.g. a title.
+            word_boundaries: Only match keys that appear as whole words.
+        """
         if self.cache_enabled:
-            matches = {
-                value
-                for key, values in self._kv_map.items()
-                if key.lower() in input_lower
-                for value in values
-            }
-            return sorted(matches)
+            return self._match(self._matcher, self._kv_map, input_string, word_boundaries)
 
         # fallback to DB
         query = f"SELECT {self.key_column_name}, {self.value_column_name} FROM {self.table_name}"
@@ -95,15 +104,21 @@ class LookupTableHelper:
         try:
             with connection.cursor() as cursor:
                 cursor.execute(query)
-                result = cursor.fetchall()
-                matches = {
-                    str(value).strip()
-                    for name, value in result
-                    if name and name.lower().strip() in input_lower
-                }
-                return sorted(matches)
+                kv_map = {}
+                for name, value in cursor.fetchall():
+                    if name and value is not None:
+                        kv_map.setdefault(str(name).strip().lower(), []).append(str(value).strip())
+                return self._match(AhoCorasick(kv_map), kv_map, input_string, word_boundaries)
         except Exception as e:
             logging.error(f"[{self.table_name}] Failed to get substring matches for '{input_string}': {e}")
             return []
         finally:
             connection.close()
+
+    @staticmethod
+    def _match(matcher: AhoCorasick, kv_map, input_string: str, word_boundaries: bool) -> list[str]:
+        return sorted({
+            value
+            for key in matcher.find_all(input_string, word_boundaries)
+            for value in kv_map.get(key, ())
+        })
@@ -19,7 +19,7 @@ class LookupTableHelperTest(unittest.TestCase):
     def test_get_success(self):
         self.mock_cursor.fetchall.return_value = [("Hardcore",), ("Terror",)]
         result = self.helper.get("Evil Activities")
-        self.assertEqual(result, ["Hardcore", "Terror"])
+        self.assertEqual(result, ("Hardcore", "Terror"))
         self.mock_cursor.execute.assert_called_once_with(
             "SELECT genre FROM artist_genre WHERE LOWER(artist) = LOWER(%s)",
             ("Evil Activities",)
@@ -28,15 +28,30 @@ class LookupTableHelperTest(unittest.TestCase):
     def test_get_empty(self):
         self.mock_cursor.fetchall.return_value = []
         result = self.helper.get("Unknown Artist")
-        self.assertEqual(result, [])
+        self.assertEqual(result, ())
         self.mock_connection.close.assert_called_once()
 
     def test_get_exception(self):
         self.mock_cursor.execute.side_effect = Exception("DB Error")
         result = self.helper.get("Evil Activities")
-        self.assertEqual(result, [])
+        self.assertEqual(result, ())
         self.mock_connection.close.assert_called_once()
 
+    def test_cached_get_is_case_insensitive_and_immutable(self):
+        self.mock_cursor.fetchall.return_value = [
+            ("Evil Activities", "Hardcore"),
+            ("evil activities", "Terror"),
+            ("Angerfist", "Hardcore"),
+        ]
+        helper = LookupTableHelper("artist_genre", "artist", "genre")
+        self.mock_cursor.execute.reset_mock()
+
+        result = helper.get("EVIL ACTIVITIES")
+        self.assertEqual(result, ("Hardcore", "Terror"))
+        self.assertIsInstance(result, tuple)
+        self.assertEqual(helper.get("Unknown"), ())
+        self.mock_cursor.execute.assert_not_called()
+
     def test_get_substring_success(self):
         self.mock_cursor.fetchall.return_value = [
             ("Hardcore", "NL"),
@@ -49,6 +64,21 @@ class LookupTableHelperTest(unittest.TestCase):
         self.assertEqual(result, expected)
         self.mock_connection.close.assert_called_once()
 
+    def test_cached_get_substring_uses_matcher(self):
+        self.mock_cursor.fetchall.return_value = [
+            ("Hardcore", "NL"),
+            ("Core", "XX"),
+            ("Speedcore", "DE"),
+            ("House", "FR")
+        ]
+        helper = LookupTableHelper("subgenre_genre", "subgenre", "genre")
+        self.mock_cursor.execute.reset_mock()
+
+        self.assertEqual(helper.get_substring("HARDCORE and speedcore"), ["DE", "NL", "XX"])
+        self.assertEqual(helper.get_substring("HARDCORE and speedcore", word_boundaries=True), ["DE", "NL"])
+        self.assertEqual(helper.get_substring("nothing here"), [])
+        self.mock_cursor.execute.assert_not_called()
+
     def test_get_substring_exception(self):
         self.mock_cursor.execute.side_effect = Exception("DB Fail")
         result = self.helper.get_substring("any text")
@@ -1,23 +1,29 @@
 import logging
 from contextlib import closing
-from typing import List
+from types import MappingProxyType
+from typing import List, Mapping
 from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
 
 class TableHelper:
-    def __init__(self, table_name: str, column_name: str, preload: bool = True):
+    def __init__(self, table_name: str, column_name: str, preload: bool = True, write_buffer=None):
         self.table_name = table_name
         self.column_name = column_name
         self.db_connector = DatabaseConnector()
         self.cache_enabled = preload
+        self.write_buffer = write_buffer  # optional WriteBehindBuffer for batched inserts
 
         self._values = set()
         self._canonical_map = {}
+        self._canonical_index = MappingProxyType(self._canonical_map)
+        self._loaded = False
+        self.version = 0  # bumped on every change, lets consumers rebuild derived data
 
         if preload:
             self._preload()
 
     def _preload(self):
         """Load all values from the table into memory."""
+        self._loaded = True
         query = f"SELECT {self.column_name} FROM {self.table_name}"
         try:
             with closing(self.db_connector.connect()) as connection:
@@ -28,12 +34,26 @@ class TableHelper:
                         value = row[0]
                         self._values.add(value)
                         self._canonical_map[value.lower()] = value
+            self.version += 1
         except Exception as e:
             logging.error(f"Error preloading {self.table_name}: {e}")
 
+    @property
+    def canonical_index(self) -> Mapping[str, str]:
+        """
+        Shared read-only view of the lowercase -> canonical value index.
+
+        The view stays in sync with add(), so callers can keep a reference
+        instead of rebuilding a lookup dict from get_all_values() per call.
+        Without preload the table is loaded once on first access.
+        """
+        if not self._loaded:
+            self._preload()
+        return self._canonical_index
+
     def exists(self, key: str) -> bool:
         if self.cache_enabled:
-            return key.lower() in (k.lower() for k in self._values)
+            return key.lower() in self._canonical_map
         # fallback to DB
         query = f"SELECT 1 FROM {self.table_name} WHERE {self.column_name} = %s LIMIT 1"
         try:
@@ -61,10 +81,15 @@ class TableHelper:
             return key.title()
 
     def add(self, key: str) -> bool:
-        # Update cache if enabled
-        if self.cache_enabled:
+        # Update cache if enabled (or the index was loaded on demand)
+        if self.cache_enabled or self._loaded:
             self._values.add(key)
             self._canonical_map[key.lower()] = key
+        self.version += 1
+        if self.write_buffer is not None:
+            self.write_buffer.add(self.table_name, (self.column_name,), (key,))
+            return True
+
         query = f"INSERT INTO {self.table_name} ({self.column_name}) VALUES (%s)"
         connection = self.db_connector.connect()
 
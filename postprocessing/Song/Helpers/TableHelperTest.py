@@ -50,5 +50,29 @@ class TableHelperTest(unittest.TestCase):
         values = self.helper.get_all_values()
         self.assertEqual(values, ["Hardcore", "Uptempo"])
 
+    def test_cached_exists_is_case_insensitive(self):
+        self.mock_cursor.fetchall.return_value = [("Hardcore",)]
+        helper = TableHelper("genres", "name")
+        self.mock_cursor.execute.reset_mock()
+
+        self.assertTrue(helper.exists("HARDCORE"))
+        self.assertFalse(helper.exists("Techno"))
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_canonical_index_loads_once_and_is_read_only(self):
+        self.mock_cursor.fetchall.return_value = [("Hardcore",), ("Uptempo",)]
+        index = self.helper.canonical_index
+        self.assertEqual(index["hardcore"], "Hardcore")
+        self.assertIs(self.helper.canonical_index, index)
+        self.mock_cursor.execute.assert_called_once()
+        with self.assertRaises(TypeError):
+            index["techno"] = "Techno"
+
+    def test_canonical_index_follows_add(self):
+        self.mock_cursor.fetchall.return_value = []
+        index = self.helper.canonical_index
+        self.helper.add("Frenchcore")
+        self.assertEqual(index["frenchcore"], "Frenchcore")
+
 if __name__ == "__main__":
     unittest.main()
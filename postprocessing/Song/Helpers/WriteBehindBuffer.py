@@ -0,0 +1,105 @@
+import atexit
+import logging
+import threading
+import time
+
+from postprocessing.Song.Helpers.DatabaseConnector import DatabaseConnector
+
+
+class WriteBehindBuffer:
+    """
+    Collects inserts from all worker threads and writes them in batches.
+
+    Rows are grouped per table and column list and flushed with a single
+    `INSERT IGNORE ... executemany` per group once `flush_size` rows are pending
+    or `flush_interval` seconds after the first pending row, whichever comes
+    first. Callers keep their in-memory caches up to date themselves.
+
+    Rows of a failed flush are queued again and retried `flush_interval`
+    seconds later; the shared instance is flushed once more at interpreter exit.
+    """
+
+    def __init__(self, flush_size: int = 100, flush_interval: float = 5.0):
+        self.db_connector = DatabaseConnector()
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._pending: dict[tuple[str, tuple[str, ...]], list[tuple]] = {}
+        self._count = 0
+        self._timer: threading.Timer | None = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def add(self, table_name: str, columns: tuple[str, ...], row: tuple):
+        """Queues one row for insertion into `table_name`."""
+        with self._lock:
+            self._pending.setdefault((table_name, tuple(columns)), []).append(tuple(row))
+            self._count += 1
+            # after a failed flush the timer retries; don't hit the database on every add
+            should_flush = self._count >= self.flush_size and time.monotonic() >= self._retry_at
+            if not should_flush:
+                self._schedule()
+        if should_flush:
+            self.flush()
+
+    def _schedule(self):
+        """Starts the interval timer unless one is running. Caller holds the lock."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _requeue(self, pending: dict[tuple[str, tuple[str, ...]], list[tuple]]):
+        """Puts the rows of a failed flush back in front of the newer ones."""
+        with self._lock:
+            for key, rows in pending.items():
+                self._pending[key] = rows + self._pending.get(key, [])
+            self._count += sum(map(len, pending.values()))
+            self._retry_at = time.monotonic() + self.flush_interval
+            self._schedule()
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._count
+
+    def flush(self):
+        """Writes all pending rows. Safe to call from any thread, and when empty."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._count = 0
+                timer, self._timer = self._timer, None
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if not pending:
+                return
+
+            started = time.monotonic()
+            try:
+                connection = self.db_connector.connect()
+            except Exception as e:
+                logging.error(f"[WriteBehindBuffer] Error flushing {sum(map(len, pending.values()))} rows: {e}")
+                self._requeue(pending)
+                return
+
+            try:
+                with connection.cursor() as cursor:
+                    for (table_name, columns), rows in pending.items():
+                        placeholders = ", ".join(["%s"] * len(columns))
+                        query = f"INSERT IGNORE INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+                        cursor.executemany(query, rows)
+                connection.commit()
+                self._retry_at = 0.0
+                logging.debug(f"[WriteBehindBuffer] Flushed {sum(map(len, pending.values()))} rows "
+                              f"in {time.monotonic() - started:.3f}s")
+            except Exception as e:
+                logging.error(f"[WriteBehindBuffer] Error flushing rows: {e}")
+                connection.rollback()
+                self._requeue(pending)
+            finally:
+                connection.close()
+
+
+write_buffer = WriteBehindBuffer()
+atexit.register(write_buffer.flush)
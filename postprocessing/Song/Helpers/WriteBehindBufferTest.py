@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from postprocessing.Song.Helpers.FilterTableHelper import FilterTableHelper
+from postprocessing.Song.Helpers.TableHelper import TableHelper
+from postprocessing.Song.Helpers.WriteBehindBuffer import WriteBehindBuffer
+
+
+class WriteBehindBufferTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("postprocessing.Song.Helpers.WriteBehindBuffer.DatabaseConnector")
+        self.addCleanup(patcher.stop)
+        self.mock_connector_cls = patcher.start()
+
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.mock_connector_cls.return_value.connect.return_value = self.mock_connection
+
+        self.buffer = WriteBehindBuffer(flush_size=3, flush_interval=60)
+        self.addCleanup(self.buffer.flush)
+
+    def test_groups_rows_per_table_and_flushes_with_insert_ignore(self):
+        self.buffer.add("artists", ("name",), ("Angerfist",))
+        self.buffer.add("ignored_artists", ("name", "corrected_name"), ("Angerfst", "Angerfist"))
+        self.mock_cursor.executemany.assert_not_called()
+
+        self.buffer.flush()
+        queries = {call.args[0]: call.args[1] for call in self.mock_cursor.executemany.call_args_list}
+        self.assertEqual(queries["INSERT IGNORE INTO artists (name) VALUES (%s)"], [("Angerfist",)])
+        self.assertEqual(
+            queries["INSERT IGNORE INTO ignored_artists (name, corrected_name) VALUES (%s, %s)"],
+            [("Angerfst", "Angerfist")],
+        )
+        self.mock_connection.commit.assert_called_once()
+        self.assertEqual(self.buffer.pending(), 0)
+
+    def test_flushes_when_size_threshold_is_reached(self):
+        for name in ["A", "B", "C"]:
+            self.buffer.add("artists", ("name",), (name,))
+        self.mock_cursor.executemany.assert_called_once_with(
+            "INSERT IGNORE INTO artists (name) VALUES (%s)", [("A",), ("B",), ("C",)]
+        )
+
+    def test_flushes_after_interval(self):
+        buffer = WriteBehindBuffer(flush_size=100, flush_interval=0.01)
+        buffer.add("artists", ("name",), ("A",))
+        buffer._timer.join(1)
+        self.mock_cursor.executemany.assert_called_once()
+
+    def test_rolls_back_on_error(self):
+        self.mock_cursor.executemany.side_effect = Exception("db down")
+        self.buffer.add("artists", ("name",), ("A",))
+        self.buffer.flush()
+        self.mock_connection.rollback.assert_called_once()
+        self.assertEqual(self.buffer.pending(), 1)
+        self.mock_cursor.executemany.side_effect = None
+
+    def test_requeues_rows_when_flush_fails(self):
+        connect = self.mock_connector_cls.return_value.connect
+        connect.side_effect = Exception("db down")
+        for name in ["A", "B", "C"]:
+            self.buffer.add("artists", ("name",), (name,))
+        self.assertEqual(self.buffer.pending(), 3)
+
+        # no reconnect on every add while the retry timer is pending
+        self.buffer.add("artists", ("name",), ("D",))
+        self.assertEqual(connect.call_count, 1)
+
+        connect.side_effect = None
+        self.buffer.flush()
+        self.mock_cursor.executemany.assert_called_once_with(
+            "INSERT IGNORE INTO artists (name) VALUES (%s)", [("A",), ("B",), ("C",), ("D",)]
+        )
+        self.assertEqual(self.buffer.pending(), 0)
+
+    def test_empty_flush_skips_db(self):
+        self.buffer.flush()
+        self.mock_connector_cls.return_value.connect.assert_not_called()
+
+    def test_helpers_update_cache_immediately(self):
+        with patch("postprocessing.Song.Helpers.TableHelper.DatabaseConnector"), \
+                patch("postprocessing.Song.Helpers.FilterTableHelper.DatabaseConnector"):
+            artists = TableHelper("artists", "name", preload=False, write_buffer=self.buffer)
+            artists.cache_enabled = True
+            ignored = FilterTableHelper("ignored_artists", "name", "corrected_name", preload=False,
+                                        write_buffer=self.buffer)
+            ignored.cache_enabled = True
+
+            self.assertTrue(artists.add("Angerfist"))
+            self.assertTrue(ignored.add("Angerfst", "Angerfist"))
+
+        self.assertTrue(artists.exists("angerfist"))
+        self.assertEqual(ignored.get_corrected("angerfst"), "Angerfist")
+        self.assertEqual(self.buffer.pending(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3NoHeaderError
+from mutagen.mp3 import MP3
+
+
+class MetadataOnlyMP3:
+    """
+    Drop-in for ``MP3(path, ID3=EasyID3)`` that only parses the ID3 header.
+
+    The MPEG stream info (which may mean syncing on and scanning frames) is
+    parsed on first access of ``info``, e.g. from BaseSong.length(). Tag access
+    and save() go straight to the EasyID3 object.
+    """
+
+    def __init__(self, path: str):
+        self.filename = path
+        try:
+            self.tags = EasyID3(path)
+        except ID3NoHeaderError:
+            self.tags = EasyID3()
+        self._info = None
+
+    @property
+    def info(self):
+        if self._info is None:
+            self._info = MP3(self.filename).info
+        return self._info
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __getitem__(self, key):
+        return self.tags[key]
+
+    def __setitem__(self, key, value):
+        self.tags[key] = value
+
+    def __delitem__(self, key):
+        del self.tags[key]
+
+    def get(self, key, default=None):
+        return self.tags.get(key, default)
+
+    def pop(self, key, *default):
+        return self.tags.pop(key, *default)
+
+    def save(self):
+        self.tags.save(self.filename)
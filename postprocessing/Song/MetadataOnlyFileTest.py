@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mutagen.easyid3 import EasyID3
+from mutagen.mp3 import MP3
+
+from postprocessing.Song.MetadataOnlyFile import MetadataOnlyMP3
+
+# MPEG-1 layer III, 128 kbps, 44.1 kHz, mono: 417 bytes per frame
+FRAME = b"\xff\xfb\x90\xc4" + b"\x00" * 413
+
+
+class MetadataOnlyMP3Test(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.path = os.path.join(self.tempdir.name, "song.mp3")
+        with open(self.path, "wb") as f:
+            f.write(FRAME * 100)
+
+    def test_stream_info_is_parsed_on_first_access_only(self):
+        with patch("postprocessing.Song.MetadataOnlyFile.MP3", wraps=MP3) as mock_mp3:
+            song = MetadataOnlyMP3(self.path)
+            mock_mp3.assert_not_called()
+
+            self.assertAlmostEqual(song.info.length, MP3(self.path).info.length)
+            song.info.length
+            mock_mp3.assert_called_once_with(self.path)
+
+    def test_reads_and_saves_tags(self):
+        tags = EasyID3()
+        tags["artist"] = ["Angerfist"]
+        tags.save(self.path)
+
+        song = MetadataOnlyMP3(self.path)
+        self.assertEqual(song.get("artist"), ["Angerfist"])
+        song["genre"] = "Hardcore"
+        song.save()
+
+        self.assertEqual(MP3(self.path, ID3=EasyID3).tags["genre"], ["Hardcore"])
+
+    def test_file_without_id3_header_starts_empty(self):
+        song = MetadataOnlyMP3(self.path)
+        self.assertEqual(len(song), 0)
+        song["artist"] = "Angerfist"
+        song.save()
+        self.assertEqual(EasyID3(self.path)["artist"], ["Angerfist"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import logging
+import threading
+from typing import Callable, Hashable, Iterable
+
+from postprocessing.Song.Helpers.Cache import databaseHelpers
+from postprocessing.Song.rules.TagRule import TagRule
+
+
+class RuleRegistry:
+    """
+    Builds the rule chain of each song type once per process and hands the
+    same rule instances to every song of that type.
+
+    Rules read the shared helpers' live views, so a chain normally stays valid
+    for the whole process. A chain whose rules snapshot table data at build time
+    names those tables in get(); it is rebuilt when one of them reports a new
+    version, which happens whenever the table is (re)loaded or a row is added.
+    Inserts into tables a chain does not name never rebuild it.
+    """
+
+    def __init__(self, helpers: dict | None = None):
+        self._helpers = helpers if helpers is not None else databaseHelpers
+        self._pipelines: dict[Hashable, tuple[tuple, tuple[TagRule, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def _tables_version(self, tables: Iterable[str]) -> tuple:
+        return tuple(getattr(self._helpers.get(table), "version", 0) for table in tables)
+
+    def get(self, key: Hashable, builder: Callable[[], Iterable[TagRule]],
+            tables: Iterable[str] = ()) -> tuple[TagRule, ...]:
+        """
+        Returns the rule chain for a song type, building it on first use or when
+        one of the tables it snapshots changed since it was built.
+
+        Args:
+            key: Identifies the chain, usually the song class.
+            builder: Creates the rule instances of the chain.
+            tables: databaseHelpers keys whose data the rules copy at build time.
+        """
+        version = self._tables_version(tables)
+        pipeline = self._pipelines.get(key)
+        if pipeline is not None and pipeline[0] == version:
+            return pipeline[1]
+
+        with self._lock:
+            pipeline = self._pipelines.get(key)
+            if pipeline is None or pipeline[0] != version:
+                pipeline = (version, tuple(builder()))
+                self._pipelines[key] = pipeline
+                logging.debug(f"Built rule chain for {getattr(key, '__name__', key)} ({len(pipeline[1])} rules)")
+            return pipeline[1]
+
+    def clear(self):
+        """Drops all chains, forcing a rebuild on next use."""
+        with self._lock:
+            self._pipelines.clear()
+
+
+rule_registry = RuleRegistry()
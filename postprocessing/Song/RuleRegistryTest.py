@@ -0,0 +1,51 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from postprocessing.Song.RuleRegistry import RuleRegistry
+
+
+class RuleRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.artists = SimpleNamespace(version=1)
+        self.genres = SimpleNamespace(version=1)
+        self.registry = RuleRegistry({"artists": self.artists, "genres": self.genres})
+        self.builder = MagicMock(side_effect=lambda: [object(), object()])
+
+    def test_builds_chain_once_per_key(self):
+        first = self.registry.get("label", self.builder)
+        second = self.registry.get("label", self.builder)
+
+        self.assertIs(first, second)
+        self.assertIsInstance(first, tuple)
+        self.assertEqual(self.builder.call_count, 1)
+
+    def test_keys_have_separate_chains(self):
+        self.registry.get("label", self.builder)
+        self.registry.get("soundcloud", self.builder)
+        self.assertEqual(self.builder.call_count, 2)
+
+    def test_rebuilds_when_snapshotted_table_changes(self):
+        first = self.registry.get("label", self.builder, tables=("genres",))
+        self.genres.version += 1
+        second = self.registry.get("label", self.builder, tables=("genres",))
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.builder.call_count, 2)
+
+    def test_other_tables_do_not_rebuild(self):
+        first = self.registry.get("label", self.builder, tables=("genres",))
+        self.artists.version += 1
+        self.assertIs(self.registry.get("label", self.builder, tables=("genres",)), first)
+        self.assertIs(self.registry.get("generic", self.builder), self.registry.get("generic", self.builder))
+        self.assertEqual(self.builder.call_count, 2)
+
+    def test_clear_forces_rebuild(self):
+        self.registry.get("label", self.builder)
+        self.registry.clear()
+        self.registry.get("label", self.builder)
+        self.assertEqual(self.builder.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import logging
 
 from data.settings import Settings
 from postprocessing.Song.BaseSong import BaseSong
+from postprocessing.Song.RuleRegistry import rule_registry
 from postprocessing.Song.Helpers.Cache import databaseHelpers
 from postprocessing.Song.rules.AddMissingArtistToDatabaseRule import AddMissingArtistToDatabaseRule
 from postprocessing.Song.rules.AddMissingGenreToDatabaseRule import AddMissingGenreToDatabaseRule
@@ -17,6 +18,7 @@ from postprocessing.Song.rules.InferGenreFromTitleRule import InferGenreFromTitl
 from postprocessing.Song.rules.InferRemixerFromTitleRule import InferRemixerFromTitleRule
 from postprocessing.Song.rules.MergeDrumAndBassGenresRule import MergeDrumAndBassGenresRule
 from postprocessing.Song.rules.ReplaceInvalidUnicodeRule import ReplaceInvalidUnicodeRule
+from postprocessing.Song.rules.TagRule import TagRule
 from postprocessing.constants import ALBUM_ARTIST, PUBLISHER, CATALOG_NUMBER, GENRE, ARTIST, COPYRIGHT, FormatEnum, \
     TITLE, ALBUM
 
@@ -45,54 +47,59 @@ class SoundcloudSong(BaseSong):
                 self.tag_collection.set_item(COPYRIGHT, self.calculate_copyright())
         self.tag_collection.set_item(PUBLISHER, self._publisher)
 
-        # Rules voor tag-inferentie en opschoning
-        self.rules.append(InferArtistFromTitleRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"],
-            genre_db=databaseHelpers["genres"]
-        ))       # Extract artist from title
-        self.rules.append(InferRemixerFromTitleRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"]
-        ))  # Extract remixer info from title and add to REMIXERS
-
-        self.rules.append(CleanTagsRule())  # Clean tags by executing regex
-
-        self.rules.append(InferGenreFromArtistRule(
-            helper=databaseHelpers["artistGenreHelper"]
-        ))  # Infer genre based on artist lookup
-
-        self.rules.append(InferGenreFromSubgenreRule(
-            databaseHelpers["subgenreHelper"]
-        ))  # Infer genre based on subgenre mapping
-
-        self.rules.append(CleanTagsRule())  # Re-run cleanup after inference steps
-
-        self.rules.append(AddMissingArtistToDatabaseRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"]
-        ))  # Prompt user to classify unknown artists (valid/ignored/corrected)
-
-        self.rules.append(AddMissingGenreToDatabaseRule(
-            genre_db=databaseHelpers["genres"],
-            ignored_db=databaseHelpers["ignored_genres"]
-        ))  # Prompt user to classify unknown genres (valid/ignored/corrected)
-
-        self.rules.append(CleanAndFilterGenreRule(
-            databaseHelpers["genres"]
-        ))  # Clean/correct genre tags based on DB
-
-        self.rules.append(CleanTagsRule())  # Re-run cleanup after inference steps
-
-        self.rules.append(CheckArtistRule(
-            artist_db=databaseHelpers["artists"],
-            ignored_db=databaseHelpers["ignored_artists"]
-        ))  # Normalize/correct/remove tags based on artist DB state
-
-        self.rules.append(ReplaceInvalidUnicodeRule())
-
+        self.rules.extend(rule_registry.get(type(self), self.build_rules))
         super().parse()
 
+    @staticmethod
+    def build_rules() -> list[TagRule]:
+        # Rules voor tag-inferentie en opschoning
+        return [
+            InferArtistFromTitleRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"],
+                genre_db=databaseHelpers["genres"]
+            ),       # Extract artist from title
+            InferRemixerFromTitleRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Extract remixer info from title and add to REMIXERS
+
+            CleanTagsRule(),  # Clean tags by executing regex
+
+            InferGenreFromArtistRule(
+                helper=databaseHelpers["artistGenreHelper"]
+            ),  # Infer genre based on artist lookup
+
+            InferGenreFromSubgenreRule(
+                databaseHelpers["subgenreHelper"]
+            ),  # Infer genre based on subgenre mapping
+
+            CleanTagsRule(),  # Re-run cleanup after inference steps
+
+            AddMissingArtistToDatabaseRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Prompt user to classify unknown artists (valid/ignored/corrected)
+
+            AddMissingGenreToDatabaseRule(
+                genre_db=databaseHelpers["genres"],
+                ignored_db=databaseHelpers["ignored_genres"]
+            ),  # Prompt user to classify unknown genres (valid/ignored/corrected)
+
+            CleanAndFilterGenreRule(
+                databaseHelpers["genres"]
+            ),  # Clean/correct genre tags based on DB
+
+            CleanTagsRule(),  # Re-run cleanup after inference steps
+
+            CheckArtistRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Normalize/correct/remove tags based on artist DB state
+
+            ReplaceInvalidUnicodeRule(),
+        ]
+
 
     def calculate_copyright(self):
         album_artist = self.album_artist()
@@ -1,7 +1,5 @@
-import re
-
 from postprocessing.Song.Helpers.TableHelper import TableHelper
-from postprocessing.constants import ARTIST_REGEX
+from postprocessing.constants import Patterns
 
 import logging
 
@@ -13,8 +11,13 @@ class Tag:
         tag (str): The tag name (e.g., "artist", "genre").
         value (list[str]): The list of tag values.
         changed (bool): Whether the tag has been modified since initialization.
+
+    Mutating methods never modify the value list in place; they swap in a new
+    list, so references handed out by to_array() stay stable.
     """
 
+    __slots__ = ("tag", "value", "changed")
+
     def __init__(self, tag, value):
         """
         Initializes a Tag with a tag name and a string or list of values.
@@ -78,8 +81,11 @@ class Tag:
         """
         Further splits values by ';' and '/' delimiters.
         """
-        self.value = [item for sublist in self.value for item in sublist.split(';')]
-        self.value = [item for sublist in self.value for item in sublist.split('/')]
+        self.value = self._resplit(self.value)
+
+    @staticmethod
+    def _resplit(values: list[str]) -> list[str]:
+        return [part for item in values for sub in item.split(';') for part in sub.split('/')]
 
     def to_array(self):
         """
@@ -99,25 +105,34 @@ class Tag:
         """
         return ";".join(self.value)
 
+    def _replace(self, operation: str, new_value: list[str], log: bool = True):
+        """
+        Swaps in a new value list and marks the tag as changed if it differs.
+
+        The previous list is never mutated, so it doubles as the "before" value
+        for change detection and logging without a defensive copy.
+        """
+        old_value = self.value
+        if new_value != old_value:
+            self.value = new_value
+            self.changed = True
+            if log:
+                logging.info("%s changed(%s) from %s to %s", self.tag, operation, old_value, new_value)
+
     def sort(self):
         """
         Sorts the tag values alphabetically and marks as changed if modified.
         """
-        old_value = self.value[:]
-        self.value.sort()
-        if old_value != self.value:
-            logging.info(f"{self.tag} changed(sort) from {old_value} to {self.value}")
-            self.changed = True
+        value = self.value
+        if any(value[i] > value[i + 1] for i in range(len(value) - 1)):
+            self._replace("sort", sorted(value))
 
     def deduplicate(self):
         """
         Removes duplicate entries and marks as changed if modified.
         """
-        old_value = self.value[:]
-        self.value = list(dict.fromkeys(self.value))
-        if old_value != self.value:
-            logging.info(f"{self.tag} changed(deduplicate) from {old_value} to {self.value}")
-            self.changed = True
+        if len(set(self.value)) != len(self.value):
+            self._replace("deduplicate", list(dict.fromkeys(self.value)))
 
     def add(self, item):
         """
@@ -127,10 +142,7 @@ class Tag:
             item (str): The value to add.
         """
         if item not in self.value:
-            old_value = self.value[:]
-            self.value.append(item)
-            logging.info(f"{self.tag} changed(add) from {old_value} to {self.value}")
-            self.changed = True
+            self._replace("add", [*self.value, item])
 
     def remove(self, val):
         """
@@ -139,11 +151,9 @@ class Tag:
         Args:
             val (str): The value to remove.
         """
-        old_value = self.value[:]
         if val in self.value:
-            self.value.remove(val)
-            logging.info(f"{self.tag} changed(remove) from {old_value} to {self.value}")
-            self.changed = True
+            index = self.value.index(val)
+            self._replace("remove", self.value[:index] + self.value[index + 1:])
             return True
         return False
 
@@ -151,32 +161,22 @@ class Tag:
         """
         Title-cases all values (e.g., "my artist" -> "My Artist").
         """
-        old_value = self.value[:]
-        self.value = [element.title() for element in self.value]
-        if old_value != self.value:
-            # logging.info(f"{self.tag} changed(recapitalize) from {old_value} to {self.value}")
-            self.changed = True
+        self._replace("recapitalize", [element.title() for element in self.value], log=False)
 
     def strip(self):
         """
         Removes leading/trailing spaces from all values.
         """
-        old_value = self.value[:]
-        self.value = [element.strip() for element in self.value]
-        if old_value != self.value:
-            logging.info(f"{self.tag} changed(strip) from {old_value} to {self.value}")
-            self.changed = True
+        self._replace("strip", [element.strip() for element in self.value])
 
     def regex(self):
         """
-        Applies a regex split on each value using `ARTIST_REGEX` and resplits.
+        Applies a regex split on each value using `Patterns.ARTIST_SEPARATOR` and resplits.
         """
-        old_value = self.value[:]
-        self.value = [re.sub(ARTIST_REGEX, ";", elem) for elem in self.value]
-        if old_value != self.value:
-            self.resplit()
-            logging.info(f"{self.tag} changed(regex) from {old_value} to {self.value}")
-            self.changed = True
+        separator = Patterns.ARTIST_SEPARATOR
+        new_value = [separator.sub(";", elem) for elem in self.value]
+        if new_value != self.value:
+            self._replace("regex", self._resplit(new_value))
 
     def set(self, value):
         """
@@ -190,25 +190,35 @@ class Tag:
             # Strip whitespace and remove empty strings
             return [v.strip() for v in val if v.strip()]
 
-        old_value = normalize(self.value[:])
+        old_value = normalize(self.value)
 
         if isinstance(value, str):
-            self.value = normalize(value.split(";"))
+            new_value = normalize(value.split(";"))
         elif isinstance(value, list):
-            self.value = normalize(value)
+            new_value = normalize(value)
             try:
-                self.resplit()
+                new_value = normalize(self._resplit(new_value))
             except (AttributeError, TypeError):
                 logging.info("Error during set->resplit")
-
-        new_value = normalize(self.value)
+        else:
+            new_value = old_value
 
         if old_value != new_value:
-            logging.info(f"{self.tag} changed(set) from {old_value} to {new_value}")
+            logging.info("%s changed(set) from %s to %s", self.tag, old_value, new_value)
             self.changed = True
 
         self.value = new_value  # store the normalized version
 
+    def canonical(self) -> tuple[str, ...]:
+        """
+        Returns the values in a form that ignores normalisation-only differences
+        (surrounding whitespace, empty entries, duplicates and ordering).
+
+        Returns:
+            tuple[str]: Sorted, distinct, stripped non-empty values.
+        """
+        return tuple(sorted({v.strip() for v in self.value if v and v.strip()}))
+
     def has_changes(self):
         """
         Returns whether the tag was modified since initialization.
@@ -31,6 +31,8 @@ class TagCollection:
         tags (dict[str, Tag]): Dictionary mapping standard tag keys to Tag objects.
     """
 
+    __slots__ = ("tags",)
+
     def __init__(self, tags):
         """
         Initializes a TagCollection from a tag dictionary (format-specific).
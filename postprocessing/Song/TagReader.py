@@ -0,0 +1,104 @@
+import os
+from typing import Iterable
+
+from mutagen.easyid3 import EasyID3
+from mutagen.flac import FLAC
+from mutagen.id3 import ID3NoHeaderError
+from mutagen.mp4 import MP4
+from mutagen.wave import WAVE
+
+from postprocessing.Song.BaseSong import ExtensionNotSupportedException
+from postprocessing.constants import MP3Tags, FLACTags, MP4Tags, WAVTags
+
+
+def _split(value) -> list[str]:
+    """Splits a raw tag value the way Tag does: strings on ';', lists on ';' and '/'."""
+    if isinstance(value, str):
+        parts = value.split(";")
+    else:
+        parts = [part for item in value for sub in str(item).split(";") for part in sub.split("/")]
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _read_mp3(path: str, fields: tuple[str, ...]) -> dict[str, list[str]]:
+    # EasyID3 only parses the ID3 header, not the MPEG frames
+    try:
+        tags = EasyID3(path)
+    except ID3NoHeaderError:
+        return {}
+    result = {}
+    for field in fields:
+        key = MP3Tags.get(field)
+        if key and key in tags:
+            result[field] = _split(tags[key])
+    return result
+
+
+def _read_flac(path: str, fields: tuple[str, ...]) -> dict[str, list[str]]:
+    tags = FLAC(path).tags
+    if tags is None:
+        return {}
+    wanted = {FLACTags[field]: field for field in fields if field in FLACTags}
+    result = {}
+    # Keys are matched case-insensitively; NormalizeFlacTagsRule would rewrite them
+    for key, value in tags:
+        field = wanted.get(key.upper())
+        if field:
+            result.setdefault(field, []).extend(_split(value))
+    return result
+
+
+def _read_m4a(path: str, fields: tuple[str, ...]) -> dict[str, list[str]]:
+    tags = MP4(path).tags
+    if tags is None:
+        return {}
+    result = {}
+    for field in fields:
+        key = MP4Tags.get(field)
+        if key and key in tags:
+            result[field] = _split(tags[key])
+    return result
+
+
+def _read_wav(path: str, fields: tuple[str, ...]) -> dict[str, list[str]]:
+    tags = WAVE(path).tags
+    if tags is None:
+        return {}
+    result = {}
+    for field in fields:
+        key = WAVTags.get(field)
+        frame = tags.get(key) if key else None
+        if frame is not None:
+            result[field] = _split(getattr(frame, "text", frame))
+    return result
+
+
+_readers = {
+    ".mp3": _read_mp3,
+    ".flac": _read_flac,
+    ".m4a": _read_m4a,
+    ".wav": _read_wav,
+}
+
+
+def read_tags(path: str, fields: Iterable[str]) -> dict[str, list[str]]:
+    """
+    Reads the requested tags of an audio file without building a BaseSong.
+
+    Read-only: no TagCollection, no rules and never saves, so it is safe for
+    analysis and indexing passes over the library.
+
+    Args:
+        path: Path to the audio file.
+        fields: Standard tag names (e.g. ARTIST, GENRE) to read.
+
+    Returns:
+        Every requested field mapped to its values; missing tags map to [].
+    """
+    fields = tuple(fields)
+    extension = os.path.splitext(path)[1].lower()
+    reader = _readers.get(extension)
+    if reader is None:
+        raise ExtensionNotSupportedException(f"{extension} is not supported")
+    found = reader(path, fields)
+    return {field: found.get(field, []) for field in fields}
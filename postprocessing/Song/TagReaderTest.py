@@ -0,0 +1,71 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from mutagen.easyid3 import EasyID3
+
+from postprocessing.Song.BaseSong import ExtensionNotSupportedException
+from postprocessing.Song.TagReader import read_tags
+from postprocessing.constants import ARTIST, GENRE, TITLE
+
+
+def _flac_bytes(comments: list[str]) -> bytes:
+    """A minimal FLAC file: STREAMINFO (44.1kHz, stereo, 16 bit, no samples) plus a Vorbis comment block."""
+    stream_info = struct.pack(">HH", 4096, 4096) + b"\x00" * 6
+    stream_info += ((44100 << 44) | (1 << 41) | (15 << 36)).to_bytes(8, "big") + b"\x00" * 16
+    vendor = b"test"
+    comment = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(comments))
+    for entry in comments:
+        data = entry.encode("utf-8")
+        comment += struct.pack("<I", len(data)) + data
+    return (b"fLaC"
+            + bytes([0]) + len(stream_info).to_bytes(3, "big") + stream_info
+            + bytes([0x84]) + len(comment).to_bytes(3, "big") + comment)
+
+
+class TagReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.tempdir.name, name)
+
+    def test_reads_requested_mp3_fields(self):
+        path = self._path("song.mp3")
+        open(path, "wb").close()
+        tags = EasyID3()
+        tags["artist"] = ["Angerfist/Miss K8"]
+        tags["genre"] = ["Hardcore;Uptempo"]
+        tags["title"] = ["Street Fighter"]
+        tags.save(path)
+
+        result = read_tags(path, (ARTIST, GENRE))
+
+        self.assertEqual(result, {ARTIST: ["Angerfist", "Miss K8"], GENRE: ["Hardcore", "Uptempo"]})
+
+    def test_mp3_without_tags_returns_empty_fields(self):
+        path = self._path("empty.mp3")
+        open(path, "wb").close()
+        self.assertEqual(read_tags(path, (ARTIST, GENRE)), {ARTIST: [], GENRE: []})
+
+    def test_reads_lowercase_flac_keys_without_writing(self):
+        path = self._path("song.flac")
+        data = _flac_bytes(["artist=Angerfist", "GENRE=Hardcore", "GENRE=Industrial"])
+        with open(path, "wb") as f:
+            f.write(data)
+
+        result = read_tags(path, (ARTIST, GENRE, TITLE))
+
+        self.assertEqual(result, {ARTIST: ["Angerfist"], GENRE: ["Hardcore", "Industrial"], TITLE: []})
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_unsupported_extension(self):
+        with self.assertRaises(ExtensionNotSupportedException):
+            read_tags(self._path("song.aac"), (ARTIST,))
+
+
+if __name__ == "__main__":
+    unittest.main()
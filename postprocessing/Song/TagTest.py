@@ -93,6 +93,30 @@ class TestTag(unittest.TestCase):
         tag = Tag("title", "My Track")
         self.assertEqual(str(tag), "title: My Track")
 
+    def test_is_slotted(self):
+        tag = Tag("artist", "A")
+        self.assertFalse(hasattr(tag, "__dict__"))
+
+    def test_changes_do_not_mutate_previous_value(self):
+        tag = Tag("genre", ["Techno", "Hardcore", "Techno"])
+        before = tag.to_array()
+        tag.deduplicate()
+        tag.sort()
+        tag.add("Uptempo")
+        self.assertEqual(before, ["Techno", "Hardcore", "Techno"])
+        self.assertEqual(tag.to_array(), ["Hardcore", "Techno", "Uptempo"])
+        self.assertTrue(tag.has_changes())
+
+    def test_sort_of_sorted_values_is_not_a_change(self):
+        tag = Tag("genre", "Hardcore;Techno")
+        tag.sort()
+        self.assertFalse(tag.has_changes())
+
+    def test_canonical_ignores_normalisation(self):
+        tag = Tag("genre", "Techno; Hardcore;;Techno")
+        self.assertEqual(tag.canonical(), ("Hardcore", "Techno"))
+        self.assertEqual(tag.canonical(), Tag("genre", "Hardcore;Techno").canonical())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 from data.settings import Settings
 from postprocessing.Song.BaseSong import BaseSong
+from postprocessing.Song.RuleRegistry import rule_registry
+from postprocessing.Song.Helpers.Cache import databaseHelpers
 from postprocessing.Song.rules.CleanAndFilterGenreRule import CleanAndFilterGenreRule
 from postprocessing.Song.rules.CleanTagsRule import CleanTagsRule
 from postprocessing.Song.rules.InferFestivalFromTitleRule import InferFestivalFromTitleRule
@@ -8,6 +10,7 @@ from postprocessing.Song.rules.InferGenreFromArtistRule import InferGenreFromArt
 from postprocessing.Song.rules.InferGenreFromSubgenreRule import InferGenreFromSubgenreRule
 from postprocessing.Song.rules.InferRemixerFromTitleRule import InferRemixerFromTitleRule
 from postprocessing.Song.rules.ReplaceInvalidUnicodeRule import ReplaceInvalidUnicodeRule
+from postprocessing.Song.rules.TagRule import TagRule
 from postprocessing.constants import ALBUM_ARTIST, PUBLISHER, CATALOG_NUMBER, GENRE, ARTIST, COPYRIGHT, FormatEnum, \
     TITLE, ALBUM
 
@@ -45,16 +48,42 @@ class YoutubeSong(BaseSong):
         if self._catalog_number:
             self.tag_collection.set_item(CATALOG_NUMBER, self._catalog_number)
 
-        self.rules.append(InferRemixerFromTitleRule())
-        self.rules.append(InferFestivalFromTitleRule())
-        self.rules.append(InferGenreFromArtistRule())
-        self.rules.append(InferGenreFromAlbumArtistRule())
-        self.rules.append(InferGenreFromSubgenreRule())
-        self.rules.append(CleanTagsRule())
-        self.rules.append(CleanAndFilterGenreRule())
-        self.rules.append(ReplaceInvalidUnicodeRule())
+        self.rules.extend(rule_registry.get(type(self), self.build_rules))
         super().parse()
 
+    @staticmethod
+    def build_rules() -> list[TagRule]:
+        return [
+            InferRemixerFromTitleRule(
+                artist_db=databaseHelpers["artists"],
+                ignored_db=databaseHelpers["ignored_artists"]
+            ),  # Extract remixer info from title and add to REMIXERS
+
+            InferFestivalFromTitleRule(
+                databaseHelpers["festivalHelper"]
+            ),  # Tag festival and date of long livesets
+
+            InferGenreFromArtistRule(
+                helper=databaseHelpers["artistGenreHelper"]
+            ),  # Infer genre based on artist lookup
+
+            InferGenreFromAlbumArtistRule(
+                helper=databaseHelpers["labelGenreHelper"]
+            ),  # Infer genre based on the channel's label mapping
+
+            InferGenreFromSubgenreRule(
+                databaseHelpers["subgenreHelper"]
+            ),  # Infer genre based on subgenre mapping
+
+            CleanTagsRule(),  # Clean tags by executing regex
+
+            CleanAndFilterGenreRule(
+                databaseHelpers["genres"]
+            ),  # Clean/correct genre tags based on DB
+
+            ReplaceInvalidUnicodeRule(),
+        ]
+
     def calculate_copyright(self):
         album_artist = self.album_artist()
         date = self.date()
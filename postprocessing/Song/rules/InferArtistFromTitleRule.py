@@ -3,12 +3,11 @@ from difflib import get_close_matches
 
 from postprocessing.Song.Helpers.FilterTableHelper import FilterTableHelper
 from postprocessing.Song.rules.TagRule import TagRule
-from postprocessing.constants import TITLE, ARTIST, ARTIST_REGEX_NON_CAPTURING, ORIGINAL_TITLE
+from postprocessing.constants import TITLE, ARTIST, ORIGINAL_TITLE, Patterns
 
 def extract_artists_from_string(part: str) -> list[str]:
-    return [a.strip() for a in re.split(ARTIST_REGEX_NON_CAPTURING, part) if a.strip()]
+    return [a.strip() for a in Patterns.ARTIST_SEPARATOR_NON_CAPTURING.split(part) if a.strip()]
 
-import re
 from postprocessing.Song.Helpers.TableHelper import TableHelper
 from postprocessing.constants import ARTIST
 
@@ -21,14 +20,14 @@ def set_cleaned_artist(song, artists: str | list[str], artist_db=None) -> bool:
     }
 
     artist_db = artist_db or TableHelper("artists", "name")
-    all_artists = {name.lower(): name for name in artist_db.get_all_values() if name}
+    all_artists = artist_db.canonical_index
 
     cleaned = []
     for a in artists:
         raw = a.strip()
 
         # Remove anything in parentheses: e.g. "Artist (LIVE)" -> "Artist"
-        base = re.sub(r"\s*[\(\[\{<][^()\[\]{}<>]*[\)\]\}>]", "", raw).strip()
+        base = Patterns.BRACKETED.sub("", raw).strip()
 
         # Strip trailing blacklist suffixes (e.g. "LUNAKORPZ LIVE" -> "LUNAKORPZ")
         words = base.split()
@@ -52,30 +51,36 @@ def set_cleaned_artist(song, artists: str | list[str], artist_db=None) -> bool:
 
 
 class InferArtistFromTitleRule(TagRule):
+    """
+    Tries the title patterns below in order until one yields the artist.
+
+    The sub-rules read the helpers' live views (canonical_index, exists()), so
+    building the rule costs no queries and artists or genres added later in the
+    run are seen without rebuilding the chain.
+    """
+
+    # title segments of festival uploads that are not artists, next to the genres
+    NON_ARTIST_SEGMENTS = frozenset({"saturday", "sunday", "friday", "mainstage"})
+
     def __init__(self, artist_db=None, ignored_db:FilterTableHelper=None, genre_db: FilterTableHelper=None):
         self.artist_db = artist_db or TableHelper("artists", "name")
-        all_names = self.artist_db.get_all_values()
-        artist_names = set(name.lower() for name in all_names if name)
+        artist_names = self.artist_db.canonical_index
         self.genre_db = genre_db
-        all_genres =  genre_db.get_all()
-        all_genres = set(genre.lower() for genre in all_genres if genre)
-        all_genres.add('saturday')
-        all_genres.add('sunday')
-        all_genres.add('friday')
-        all_genres.add('mainstage')
-        ignored_db = ignored_db or []
 
         self.rules = [
             InferArtistFromPresentsOrColonRule(self.artist_db),
-            InferArtistFromTitleAtRule(ignored_db.get_all(), self.artist_db),
+            InferArtistFromTitleAtRule(self.artist_db),
             InferArtistFromTitleByRule(artist_names, self.artist_db),
-            InferArtistFromTitleDotRule(artist_names, self.artist_db),
+            InferArtistFromTitleDotRule(self.artist_db),
             InferArtistFromTitleSingleDashRule(artist_names, self.artist_db),
-            InferArtistFromTitleMultiDashRule(artist_names, self.artist_db, all_genres),
+            InferArtistFromTitleMultiDashRule(artist_names, self.artist_db, self._is_genre),
             InferArtistFromFirstSegmentFallbackRule(self.artist_db),
-            InferArtistFromTitleFallbackRule(ignored_db.get_all()),
+            InferArtistFromTitleFallbackRule(ignored_db),
         ]
 
+    def _is_genre(self, name: str) -> bool:
+        return name in self.NON_ARTIST_SEGMENTS or (self.genre_db is not None and self.genre_db.exists(name))
+
     def apply(self, song):
         if not song.tag_collection.has_item(ORIGINAL_TITLE):
             song.tag_collection.set_item(ORIGINAL_TITLE, song.tag_collection.get_item_as_string(TITLE))
@@ -86,19 +91,17 @@ class InferArtistFromTitleRule(TagRule):
                 return
 
 class InferArtistFromTitleDotRule(TagRule):
-    def __init__(self, ignored_artists, artist_db):
-        self.ignored_artists = set(a.lower() for a in ignored_artists)
+    def __init__(self, artist_db):
         self.artist_db = artist_db
 
 
 
     def apply(self, song):
-        CATALOG_PATTERN = re.compile(r"^(GB[EDH]\d{3,})[.\s]+(.*?)\s+-\s+(.*)")
         title = song.tag_collection.get_item_as_string(ORIGINAL_TITLE)
         if not title and not '. ' in title and not ' - ' in title:
             return False
 
-        match = CATALOG_PATTERN.match(title)
+        match = Patterns.CATALOG_TITLE.match(title)
         if not match:
             return False
 
@@ -114,8 +117,7 @@ class InferArtistFromTitleDotRule(TagRule):
 
         return True
 class InferArtistFromTitleAtRule(TagRule):
-    def __init__(self, ignored_artists, artist_db):
-        self.ignored_artists = set(a.lower() for a in ignored_artists)
+    def __init__(self, artist_db):
         self.artist_db = artist_db
 
     def apply(self, song):
@@ -140,7 +142,7 @@ class InferArtistFromTitleByRule(TagRule):
         title = song.tag_collection.get_item_as_string(ORIGINAL_TITLE)
         if not title or " by " not in title.lower():
             return False
-        parts = re.split(r"\sby\s", title, flags=re.IGNORECASE)
+        parts = Patterns.BY_SEPARATOR.split(title)
         if len(parts) == 2:
             track, artist_guess = parts[0].strip(), parts[1].strip()
             artists = extract_artists_from_string(artist_guess)
@@ -190,10 +192,10 @@ class InferArtistFromTitleSingleDashRule(TagRule):
         return False
 
 class InferArtistFromTitleMultiDashRule(TagRule):
-    def __init__(self, artist_names, artist_db, genre_names):
+    def __init__(self, artist_names, artist_db, is_genre):
         self.artist_names = artist_names
         self.artist_db = artist_db
-        self.genre_names = genre_names
+        self.is_genre = is_genre
 
     def apply(self, song):
         title = song.tag_collection.get_item_as_string(ORIGINAL_TITLE)
@@ -219,7 +221,7 @@ class InferArtistFromTitleMultiDashRule(TagRule):
             filtered_artists = []
             for artist in artists:
 
-                cleaned = re.sub(r"\s*[\(\[\{<][^()\[\]{}<>]*[\)\]\}>]", "", artist).strip()
+                cleaned = Patterns.BRACKETED.sub("", artist).strip()
                 if not cleaned or cleaned.lower() in {"live", "dj set", "set", "remix", "edit", "extended mix", "mix",
                                                       "version"}:
                     continue
@@ -228,7 +230,7 @@ class InferArtistFromTitleMultiDashRule(TagRule):
             for artist in filtered_artists:
                 lowered = artist.lower()
 
-                if lowered in self.genre_names:
+                if self.is_genre(lowered):
                     continue  # genres negeren
 
                 matches = get_close_matches(lowered, self.artist_names, n=1, cutoff=0.6)
@@ -270,15 +272,15 @@ class InferArtistFromFirstSegmentFallbackRule(TagRule):
         return False
 
 class InferArtistFromTitleFallbackRule(TagRule):
-    def __init__(self, ignored_artists):
-        self.ignored_artists = set(a.lower() for a in ignored_artists)
+    def __init__(self, ignored_db):
+        self.ignored_db = ignored_db
 
     def apply(self, song):
         title = song.tag_collection.get_item_as_string(ORIGINAL_TITLE)
         if not title:
             return False
         folder_artist = song.path().split(os.sep)[-2].strip().lower()
-        if folder_artist in self.ignored_artists:
+        if self.ignored_db is not None and self.ignored_db.exists(folder_artist):
             return False
         if " - " in title:
             parts = [s.strip() for s in title.split(" - ", 1)]
@@ -292,7 +294,7 @@ class InferArtistFromTitleFallbackRule(TagRule):
 class InferArtistFromPresentsOrColonRule(TagRule):
     def __init__(self, artist_db):
         self.artist_db = artist_db
-        self.artist_names = set(name.lower() for name in artist_db.get_all_values() if name)
+        self.artist_names = artist_db.canonical_index
 
     def apply(self, song):
         title = song.tag_collection.get_item_as_string(ORIGINAL_TITLE)
@@ -300,7 +302,7 @@ class InferArtistFromPresentsOrColonRule(TagRule):
             return False
 
         # Match patterns like: "Sound Rush presents: Magic", "Unresolved: Bad Blood"
-        match = re.search(r"\b([A-Za-z0-9 &\-_]+?)\s*(presents:|:)", title, flags=re.IGNORECASE)
+        match = Patterns.PRESENTS_PREFIX.search(title)
         if match:
             candidate = match.group(1).strip()
             if get_close_matches(candidate.lower(), self.artist_names, n=1, cutoff=0.7):
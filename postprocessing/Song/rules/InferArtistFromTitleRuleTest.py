@@ -14,18 +14,17 @@ class InferArtistFromTitleRuleTest(unittest.TestCase):
         self.song.path = lambda: "/home/teun/Music/D-Fence/track.mp3"
 
         self.mock_artist_db = MagicMock()
-        self.mock_artist_db.get_all_values.return_value = [
+        self.mock_artist_db.canonical_index = {name.lower(): name for name in [
             "Noisekick", "D-Fence", "Angerfist", "Headhunterz", "Wildstylez",
             "D-Sturb", "Hans Glock", "Lunakorpz", "The Viper", "Unresolved", "Bloodlust"
-        ]
+        ]}
 
         self.mock_genres_db = MagicMock()
-        self.mock_genres_db.get_all.return_value = [
-            "Hardstyle"
-        ]
+        self.mock_genres_db.exists.side_effect = lambda name: name.lower() in {"hardstyle"}
 
+        self.ignored_artists = set()  # add e.g. "vieze jack" for ignore tests
         self.mock_ignored_db = MagicMock()
-        self.mock_ignored_db.get_all.return_value = []  # add e.g. ["vieze jack"] for ignore tests
+        self.mock_ignored_db.exists.side_effect = lambda name: name.lower() in self.ignored_artists
 
     def _apply_rule(self, title):
         self.song.tag_collection.has_item.return_value = False
@@ -200,6 +199,19 @@ class InferArtistFromTitleRuleTest(unittest.TestCase):
         self.song.tag_collection.set_artist.assert_not_called()
         self.song.tag_collection.set_item.assert_any_call(ORIGINAL_TITLE, "Just One Part Title")
 
+    def test_cleaned_artist_uses_index_without_db_scan(self):
+        self._apply_rule("d-fence - Emporium 2024")
+        self.song.tag_collection.set_item.assert_any_call(ARTIST, "D-Fence")
+        self.mock_artist_db.get_all_values.assert_not_called()
+
+    def test_reads_live_views_without_queries(self):
+        self.mock_artist_db.canonical_index["guardelion"] = "Guardelion"
+        self._apply_rule("Future District by Guardelion")
+        self.song.tag_collection.set_item.assert_any_call(ARTIST, "Guardelion")
+        self.song.tag_collection.set_item.assert_any_call(TITLE, "Future District")
+        self.mock_genres_db.get_all.assert_not_called()
+        self.mock_ignored_db.get_all.assert_not_called()
+
     def test_original_is_set(self):
         self._apply_rule("Headhunterz - From Within")
         self.song.tag_collection.set_item.assert_any_call(ORIGINAL_TITLE, "Headhunterz - From Within")
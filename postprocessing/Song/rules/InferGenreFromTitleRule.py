@@ -1,23 +1,36 @@
-import re
+import threading
+from weakref import WeakKeyDictionary
+
 from postprocessing.Song.rules.TagRule import TagRule
 from postprocessing.constants import TITLE, GENRE
+from postprocessing.Song.Helpers.AhoCorasick import AhoCorasick
 from postprocessing.Song.Helpers.TableHelper import TableHelper
 
+# genre table -> (table version, matcher), shared by all rule instances
+_matchers = WeakKeyDictionary()
+_matchers_lock = threading.Lock()
+
+
+def genre_matcher(genre_db) -> AhoCorasick:
+    """
+    Returns a single automaton over all genres of the table, built once and
+    reused across songs and rule instances until the table changes.
+    """
+    version = getattr(genre_db, "version", None)
+    with _matchers_lock:
+        cached = _matchers.get(genre_db)
+        if cached is None or cached[0] != version:
+            cached = (version, AhoCorasick(genre_db.canonical_index))
+            _matchers[genre_db] = cached
+        return cached[1]
+
+
 class InferGenreFromTitleRule(TagRule):
     def __init__(self, genre_db=None, dryrun=True, dryrun_output_path="genre_matches.txt"):
         self.genre_db = genre_db or TableHelper("genres", "genre")
         self.dryrun = dryrun
         self.dryrun_output_path = dryrun_output_path
 
-        all_genres = self.genre_db.get_all_values()
-        self.genre_set = set(g.lower() for g in all_genres if g)
-
-        # Compile regex patterns for each genre
-        self.genre_patterns = {
-            genre: re.compile(rf"\b{re.escape(genre)}\b", flags=re.IGNORECASE)
-            for genre in self.genre_set
-        }
-
         if self.dryrun:
             self._output_file = open(self.dryrun_output_path, "w", encoding="utf-8")
         else:
@@ -28,18 +41,18 @@ class InferGenreFromTitleRule(TagRule):
         if not title:
             return False
 
+        # one scan over the title finds every genre that appears as a whole word
         found = False
-        for genre, pattern in self.genre_patterns.items():
-            if pattern.search(title):
-                canonical = self.genre_db.get(genre)
+        for genre in genre_matcher(self.genre_db).find_all(title, word_boundaries=True):
+            canonical = self.genre_db.get(genre)
 
-                if self.dryrun:
-                    line = f"{canonical} - {song.path}\n"
-                    self._output_file.write(line)
-                else:
-                    song.tag_collection.add(GENRE, canonical)
+            if self.dryrun:
+                line = f"{canonical} - {song.path}\n"
+                self._output_file.write(line)
+            else:
+                song.tag_collection.add(GENRE, canonical)
 
-                found = True
+            found = True
 
         return found
 
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, call
-from postprocessing.Song.rules.InferGenreFromTitleRule import InferGenreFromTitleRule
+from postprocessing.Song.rules.InferGenreFromTitleRule import InferGenreFromTitleRule, genre_matcher
 from postprocessing.constants import TITLE, GENRE
 
 
@@ -11,7 +11,7 @@ class InferGenreFromTitleRuleTest(unittest.TestCase):
         self.song.tag_collection.get_item_as_string.return_value = "This is a Hardstyle Anthem"
 
         self.genre_table = MagicMock()
-        self.genre_table.get_all_values.return_value = ["Hardstyle", "Techno", "House"]
+        self.genre_table.canonical_index = {g.lower(): g for g in ["Hardstyle", "Techno", "House", "Tech House"]}
         self.genre_table.get.side_effect = lambda g: g.capitalize()
 
         self.rule = InferGenreFromTitleRule(genre_db=self.genre_table, dryrun=False)
@@ -40,6 +40,27 @@ class InferGenreFromTitleRuleTest(unittest.TestCase):
         ], any_order=True)
         self.assertEqual(self.song.tag_collection.add.call_count, 2)
 
+    def test_matches_whole_words_only(self):
+        self.song.tag_collection.get_item_as_string.return_value = "Housewarming with tech house"
+        self.rule.apply(self.song)
+
+        self.song.tag_collection.add.assert_has_calls([
+            call(GENRE, "House"),
+            call(GENRE, "Tech house"),
+        ], any_order=True)
+        self.assertEqual(self.song.tag_collection.add.call_count, 2)
+
+    def test_matcher_is_shared_across_rule_instances(self):
+        other = InferGenreFromTitleRule(genre_db=self.genre_table, dryrun=False)
+        self.rule.apply(self.song)
+        other.apply(self.song)
+
+        matcher = genre_matcher(self.genre_table)
+        self.assertIs(genre_matcher(other.genre_db), matcher)
+
+        self.genre_table.version = 2
+        self.assertIsNot(genre_matcher(self.genre_table), matcher)
+
     def test_skips_empty_title(self):
         self.song.tag_collection.get_item_as_string.return_value = ""
         result = self.rule.apply(self.song)
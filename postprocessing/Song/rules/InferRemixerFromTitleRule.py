@@ -1,10 +1,9 @@
 import logging
-import re
 
 from postprocessing.Song.Helpers.FilterTableHelper import FilterTableHelper
 from postprocessing.Song.Helpers.TableHelper import TableHelper
 from postprocessing.Song.rules.TagRule import TagRule
-from postprocessing.constants import TITLE, ARTIST, REMIXER
+from postprocessing.constants import TITLE, ARTIST, REMIXER, Patterns
 
 
 class InferRemixerFromTitleRule(TagRule):
@@ -14,15 +13,9 @@ class InferRemixerFromTitleRule(TagRule):
     Nieuwe artiesten kunnen toegevoegd of genegeerd worden via gebruikersprompt.
     """
 
-    BRACKET_RE = re.compile(r"\(([^()]*)\)")
-    SUFFIX_CLEANUP_FULL = re.compile(
-        r"\s*\b("
-        r"album|bootleg|cinematic|climax|cut|dub|dubstep|edit|extended|hardcore|hardstyle|instrumental|kick|live|mix|non vocal|non-vocal|nostalgia|old school|original|pro remix|radio|refix|remastered|remix|re-kick|uptempo|version|vip|vocal|"
-        r"\d{4}|2k\d{2}"
-        r")\b\s*$",
-        re.IGNORECASE
-    )
-    SUFFIX_CLEANUP_SIMPLE = re.compile(r"\s*\b(edit|remix|refix|bootleg)\b\s*$", re.IGNORECASE)
+    BRACKET_RE = Patterns.PARENTHESIZED
+    SUFFIX_CLEANUP_FULL = Patterns.REMIX_SUFFIX_FULL
+    SUFFIX_CLEANUP_SIMPLE = Patterns.REMIX_SUFFIX_SIMPLE
 
     def __init__(self, artist_db=None, ignored_db=None, ask_for_missing: bool = False):
         self.artist_db = artist_db or TableHelper("artists", "name")
@@ -30,16 +23,16 @@ class InferRemixerFromTitleRule(TagRule):
         self.ask_for_missing = ask_for_missing
 
     def _clean_artist_name(self, name: str) -> str:
-        name = re.sub(r"['’]s\s+(remix|edit|refix|version|bootleg|mix|vip)\b", r" \1", name, flags=re.IGNORECASE)
+        name = Patterns.REMIX_POSSESSIVE.sub(r" \1", name)
         while True:
-            new_name = re.sub(self.SUFFIX_CLEANUP_FULL, "", name).strip()
+            new_name = self.SUFFIX_CLEANUP_FULL.sub("", name).strip()
             if new_name == name:
                 return new_name
             name = new_name
 
     def _clean_suffix_only(self, name: str) -> str:
         while True:
-            new_name = re.sub(self.SUFFIX_CLEANUP_SIMPLE, "", name).strip()
+            new_name = self.SUFFIX_CLEANUP_SIMPLE.sub("", name).strip()
             if new_name == name:
                 return new_name
             name = new_name
@@ -51,7 +44,7 @@ class InferRemixerFromTitleRule(TagRule):
 
         bracket_segments = self.BRACKET_RE.findall(title)
         for segment in bracket_segments:
-            if not re.search(r"(edit|remix|refix|bootleg|remix edit)", segment, re.IGNORECASE):
+            if not Patterns.REMIX_KEYWORD.search(segment):
                 continue
 
             for raw_artist in song.split_artists( self._clean_suffix_only(segment)):
@@ -3,15 +3,19 @@ from postprocessing.constants import MusicFileType
 
 
 class NormalizeFlacTagsRule(TagRule):
-    """Ensures all FLAC tag keys are uppercase and updates the file."""
+    """Ensures all FLAC tag keys are uppercase; the song saves them on commit."""
 
     def apply(self, song):
         if song.type != MusicFileType.FLAC:
             return
 
+        tags = song.music_file.tags
+        if all(tag == tag.upper() for tag in tags.keys()):
+            return
+
         new_tags = {
-            tag.upper(): value for tag, value in song.music_file.tags.items()
+            tag.upper(): value for tag, value in tags.items()
         }
-        song.music_file.tags.clear()
-        song.music_file.tags.update(new_tags)
-        song.music_file.save()
+        tags.clear()
+        tags.update(new_tags)
+        song.mark_dirty()
@@ -1,5 +1,4 @@
 import logging
-import re
 from collections import defaultdict
 from typing import Optional
 
@@ -7,7 +6,7 @@ from postprocessing.Song.Helpers.TableHelper import TableHelper
 from postprocessing.Song.rules.TagRule import TagRule
 from postprocessing.Song.rules.TagResult import TagResult, TagResultType
 from postprocessing.Song.rules.ExternalArtistLookup import ExternalArtistLookup
-from postprocessing.constants import ARTIST
+from postprocessing.constants import ARTIST, Patterns
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +15,9 @@ class VerifyArtistRule(TagRule):
     """Validate and normalize the ARTIST tag of a song."""
 
 
-    NUMERIC_ONLY = re.compile(r"^#?\d+[.)]?$")
-    NUMERIC_PREFIX = re.compile(r"^#?\d{1,3}[.)\s-]+")
-    INVALID_START = re.compile(r"^[&#\-\(\*'\"\[]+")
+    NUMERIC_ONLY = Patterns.NUMERIC_ONLY
+    NUMERIC_PREFIX = Patterns.NUMERIC_PREFIX
+    INVALID_START = Patterns.INVALID_START
 
     def __init__(self, artist_db: Optional[TableHelper] = None, lookup: Optional[ExternalArtistLookup] = None):
         self.artist_db = artist_db or TableHelper("artists", "name")
@@ -64,9 +63,9 @@ class VerifyArtistRule(TagRule):
             changed = True
 
         # length/composition checks
-        if len(name) <= 2 and not re.search(r"[A-Za-z]", name):
+        if len(name) <= 2 and not Patterns.LETTER.search(name):
             return original, False, True
-        if not re.search(r"[A-Za-z]", name):
+        if not Patterns.LETTER.search(name):
             return original, False, True
 
         return name, changed, False
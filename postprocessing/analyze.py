@@ -2,8 +2,11 @@ import logging
 from pathlib import Path
 
 from data.settings import Settings
-from postprocessing.Song.BaseSong import BaseSong, ExtensionNotSupportedException
+from postprocessing.Song.BaseSong import ExtensionNotSupportedException
+from postprocessing.Song.TagReader import read_tags
 from postprocessing.analyzer import Analyzer
+from postprocessing.scanner import FileScanner, SKIP
+from postprocessing.constants import ARTIST, GENRE
 from mutagen import MutagenError
 
 class Analyze:
@@ -34,31 +37,19 @@ class Analyze:
         self.analyzer.start()
         base = Path(self.settings.music_folder_path)
         if base.exists():
-            self._parse_folder(base)
+            scanner = FileScanner("analyze", self.extensions, self.settings.scan_workers)
+            scanner.scan(base, self._analyze_file, self._submit)
         self.analyzer.done()
 
-    def _parse_folder(self, folder: Path):
-        if "@eaDir" in str(folder):
-            return
-        try:
-            files = []
-            for ext, enabled in self.extensions.items():
-                if enabled:
-                    files.extend(folder.glob(f"*.{ext}"))
-            for file in files:
-                self._analyze_file(file)
-            for sub in [f for f in folder.iterdir() if f.is_dir() and not f.name.startswith("_")]:
-                self._parse_folder(sub)
-        except Exception as e:
-            logging.error(f"Error analyzing folder {folder}: {e}", exc_info=True)
+    def _submit(self, pairs: list[tuple[str, str]]):
+        for artist, genre in pairs:
+            self.analyzer.submit(artist, genre)
 
     def _analyze_file(self, file: Path):
+        """Reads the artist/genre pairs of a file; runs in a scanner worker and never writes."""
         try:
-            song = BaseSong(str(file))
-            for artist in song.artists():
-                for genre in song.genres():
-                    self.analyzer.submit(artist, genre)
+            tags = read_tags(str(file), (ARTIST, GENRE))
+            return [(artist, genre) for artist in tags[ARTIST] for genre in tags[GENRE]]
         except (PermissionError, MutagenError, FileNotFoundError, ExtensionNotSupportedException) as e:
             logging.warning(f"{type(e).__name__}: {e} -> {file}")
-        except Exception as e:
-            logging.error(f"Analyze failed: {e} -> {file}", exc_info=True)
+            return SKIP
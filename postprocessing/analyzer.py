@@ -3,10 +3,11 @@ import threading
 import logging
 import pymysql
 import queue
+from collections import Counter
 from typing import Tuple, List
 
 class Analyzer(threading.Thread):
-    def __init__(self):
+    def __init__(self, flush_size: int = 100_000, id_batch_size: int = 1000):
         super().__init__()
         import pymysql
         self.host = os.getenv('DB_HOST')
@@ -27,6 +28,15 @@ class Analyzer(threading.Thread):
         self.queue = queue.Queue()
         self._running = True
 
+        self.flush_size = flush_size
+        self.id_batch_size = id_batch_size
+        self.artist_counts = Counter()
+        self.genre_counts = Counter()
+        self.pair_counts = Counter()
+        self._pending = 0
+        self._artist_ids: dict[str, int] = {}
+        self._genre_ids: dict[str, int] = {}
+
     def start(self):
         """Start the analyzer thread and clear previous analysis data."""
         self._truncate_tables()
@@ -49,8 +59,11 @@ class Analyzer(threading.Thread):
                     break
                 artist, genre = item
                 self._process(artist, genre)
+                if self._pending >= self.flush_size:
+                    self.flush()
             except queue.Empty:
                 continue
+        self.flush()
         logging.info("Analyzer DB thread finished")
 
     def stop(self):
@@ -58,38 +71,75 @@ class Analyzer(threading.Thread):
         self.queue.put("STOP")
 
     def _process(self, artist: str, genre: str):
-        artist_id = self._insert_or_update_artist(artist)
+        """Aggregates one (artist, genre) observation; written to the database on flush()."""
+        self.artist_counts[artist] += 1
         if genre:
-            genre_id = self._insert_or_get_genre(genre)
-            self._insert_or_update_artist_genre(artist_id, genre_id)
+            self.genre_counts[genre] += 1
+            self.pair_counts[(artist, genre)] += 1
+        self._pending += 1
 
     def submit(self, artist: str, genre: str):
         self.queue.put((artist, genre))
 
-    def _insert_or_update_artist(self, name: str) -> int:
-        self.cursor.execute("""
-            INSERT INTO artists (name, count)
-            VALUES (%s, 1)
-            ON DUPLICATE KEY UPDATE count = count + 1
-        """, (name,))
-        self.cursor.execute("SELECT id FROM artists WHERE name = %s", (name,))
-        return self.cursor.fetchone()[0]
+    def flush(self):
+        """
+        Writes the aggregated counts with multi-row upserts.
 
-    def _insert_or_get_genre(self, name: str) -> int:
-        self.cursor.execute("""
+        pymysql's executemany folds each INSERT ... VALUES statement into
+        multi-row statements, so a flush costs a handful of round-trips
+        instead of three statements per (artist, genre) pair.
+        """
+        if not self._pending:
+            return
+        artist_counts, self.artist_counts = self.artist_counts, Counter()
+        genre_counts, self.genre_counts = self.genre_counts, Counter()
+        pair_counts, self.pair_counts = self.pair_counts, Counter()
+        self._pending = 0
+
+        self.cursor.executemany("""
+            INSERT INTO artists (name, count)
+            VALUES (%s, %s)
+            ON DUPLICATE KEY UPDATE count = count + VALUES(count)
+        """, list(artist_counts.items()))
+        self.cursor.executemany("""
             INSERT INTO genres (name)
             VALUES (%s)
             ON DUPLICATE KEY UPDATE name = name
-        """, (name,))
-        self.cursor.execute("SELECT id FROM genres WHERE name = %s", (name,))
-        return self.cursor.fetchone()[0]
+        """, [(genre,) for genre in genre_counts])
 
-    def _insert_or_update_artist_genre(self, artist_id: int, genre_id: int):
-        self.cursor.execute("""
+        artist_ids = self._resolve_ids("artists", self._artist_ids, {artist for artist, _ in pair_counts})
+        genre_ids = self._resolve_ids("genres", self._genre_ids, set(genre_counts))
+        self.cursor.executemany("""
             INSERT INTO artists_genres (artist_id, genre_id, count)
-            VALUES (%s, %s, 1)
-            ON DUPLICATE KEY UPDATE count = count + 1
-        """, (artist_id, genre_id))
+            VALUES (%s, %s, %s)
+            ON DUPLICATE KEY UPDATE count = count + VALUES(count)
+        """, [
+            (artist_ids[artist], genre_ids[genre], count)
+            for (artist, genre), count in pair_counts.items()
+            if artist in artist_ids and genre in genre_ids
+        ])
+        logging.info(f"Analyzer flushed {len(artist_counts)} artists, {len(genre_counts)} genres, "
+                     f"{len(pair_counts)} pairs")
+
+    def _resolve_ids(self, table: str, cache: dict, names: set) -> dict:
+        """
+        Returns {name: id} for the given names, querying only names not seen before.
+        """
+        missing = [name for name in names if name not in cache]
+        for start in range(0, len(missing), self.id_batch_size):
+            chunk = missing[start:start + self.id_batch_size]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            self.cursor.execute(f"SELECT name, id FROM {table} WHERE name IN ({placeholders})", chunk)
+            cache.update({name: id_ for name, id_ in self.cursor.fetchall()})
+
+        # the collation may fold case/accents, so fall back to a per-name lookup
+        for name in missing:
+            if name not in cache:
+                self.cursor.execute(f"SELECT id FROM {table} WHERE name = %s", (name,))
+                row = self.cursor.fetchone()
+                if row:
+                    cache[name] = row[0]
+        return cache
 
     def get_suspect_artists(self, threshold=1) -> List[str]:
         self.cursor.execute("""
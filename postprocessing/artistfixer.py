@@ -4,19 +4,22 @@ from pathlib import Path
 from mutagen import MutagenError
 
 from data.settings import Settings
-from postprocessing.Song.BaseSong import BaseSong, ExtensionNotSupportedException
+from postprocessing.Song.BaseSong import BaseSong, ExtensionNotSupportedException, write_stats
 from postprocessing.Song.Helpers.Cache import databaseHelpers
 from postprocessing.Song.rules.VerifyArtistRule import VerifyArtistRule
 from postprocessing.Song.rules.TagResult import TagResultType
+from postprocessing.scanner import FileScanner, SKIP
 
 
 class ArtistFixer:
     """Iterate over all songs and fix the ARTIST tag using VerifyArtistRule."""
 
-    def __init__(self):
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
         self.settings = Settings()
         self.artist_db = databaseHelpers["artists"]
         self.rule = VerifyArtistRule(self.artist_db)
+        self.rewritten = 0
         self.extensions = {
             "mp3": True,
             "flac": True,
@@ -25,34 +28,34 @@ class ArtistFixer:
             "aac": False,
         }
 
-    def run(self):
-        logging.info("Starting Artist Fixer Step")
+    def run(self, dry_run: bool | None = None):
+        """
+        Fixes the artist tag of every song in the music folder.
+
+        @param dry_run: Only log the would-be writes; defaults to the value given to the constructor
+        @return: Write summary of the run: inspected, rewritten and would_rewrite files
+        """
+        if dry_run is not None:
+            self.dry_run = bool(dry_run)
+        logging.info(f"Starting Artist Fixer Step{' (dry run)' if self.dry_run else ''}")
+        write_stats.reset()
         root = Path(self.settings.music_folder_path)
         if root.exists():
-            self._parse_folder(root)
-
-    def _parse_folder(self, folder: Path):
-        if "@eaDir" in str(folder):
-            return
-        try:
-            files: list[Path] = []
-            for ext, enabled in self.extensions.items():
-                if enabled:
-                    files.extend(folder.glob(f"*.{ext}"))
-            for file in files:
-                self._fix_file(file)
-            for sub in [f for f in folder.iterdir() if f.is_dir() and not f.name.startswith("_")]:
-                self._parse_folder(sub)
-        except Exception as e:
-            logging.error(f"Error processing folder {folder}: {e}", exc_info=True)
+            self.rewritten = 0
+            scanner = FileScanner("artistfixer", self.extensions, self.settings.scan_workers)
+            stats = scanner.scan(root, self._fix_file, self._write)
+            logging.info(f"[artistfixer] rewrote {self.rewritten} of {stats.files} inspected files")
+        summary = write_stats.as_dict()
+        logging.info(f"[artistfixer] writes{' (dry run)' if self.dry_run else ''}: {summary}")
+        return summary
 
     def _fix_file(self, path: Path):
+        """Reads a file and applies the rule; runs in a scanner worker, saving is left to _write."""
         try:
             song = BaseSong(str(path))
             original = song.artist()
             was_known = self.artist_db.exists(original) if original else True
             result = self.rule.apply(song)
-            song.save_file()
 
             # if result.result_type == TagResultType.VALID and not was_known:
             #     print(f"✅ added '{original}' to artists table")
@@ -60,7 +63,18 @@ class ArtistFixer:
             #     print(f"✏️ updated '{original}' -> '{result.value}'")
             # elif result.result_type == TagResultType.IGNORED:
             #     print(f"🗑️ removed invalid artist '{original}'")
+            return path, song
         except (PermissionError, MutagenError, FileNotFoundError, ExtensionNotSupportedException) as e:
             logging.warning(f"{type(e).__name__}: {e} -> {path}")
+            return SKIP
+
+    def _write(self, item: tuple[Path, BaseSong]):
+        """Single writer: commits the songs fixed by the workers, one at a time."""
+        path, song = item
+        try:
+            if song.commit(dry_run=self.dry_run):
+                self.rewritten += 1
+        except (PermissionError, MutagenError, FileNotFoundError) as e:
+            logging.warning(f"{type(e).__name__}: {e} -> {path}")
         except Exception as e:
             logging.error(f"Artist fix failed: {e} -> {path}", exc_info=True)
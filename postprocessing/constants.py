@@ -1,3 +1,4 @@
+import re
 from enum import Enum
 from typing import Final
 
@@ -5,6 +6,46 @@ from typing import Final
 ARTIST_REGEX: Final = r"(?i)\s(&|，|aka|and|b2b|b3b|feat\.?|featuring|features|ft|ft\.?|invite|invites|meets|pres\.?|present|presents|presenting|versus|vs\.?|with|x|\+|,|et)\s|,\s|，\s|presents:\s|present:\s|:\s"
 ARTIST_REGEX_NON_CAPTURING: Final = r"(?i)\s(?:&|:\s|，|aka|and|b2b|b3b|feat\.?|featuring|features|ft\.?|invite|invites|meets|pres\.?|present|presents|presenting|versus|vs\.?|with|x|\+|,|et)\s|,\s|，\s|presents:\s|present:\s|:\s"
 
+
+class Patterns:
+    """
+    Registry of the precompiled regular expressions used by the tag rules.
+
+    Everything is compiled once at import. Use these instead of passing pattern
+    strings to re.* in hot paths; re's own cache is small and shared.
+    """
+    # artist separators, see ARTIST_REGEX / ARTIST_REGEX_NON_CAPTURING
+    ARTIST_SEPARATOR: Final = re.compile(ARTIST_REGEX)
+    ARTIST_SEPARATOR_NON_CAPTURING: Final = re.compile(ARTIST_REGEX_NON_CAPTURING)
+
+    # "Artist (LIVE)", "Artist [Set]" -> bracketed suffixes
+    BRACKETED: Final = re.compile(r"\s*[\(\[\{<][^()\[\]{}<>]*[\)\]\}>]")
+    PARENTHESIZED: Final = re.compile(r"\(([^()]*)\)")
+
+    # title layouts
+    CATALOG_TITLE: Final = re.compile(r"^(GB[EDH]\d{3,})[.\s]+(.*?)\s+-\s+(.*)")
+    BY_SEPARATOR: Final = re.compile(r"\sby\s", re.IGNORECASE)
+    PRESENTS_PREFIX: Final = re.compile(r"\b([A-Za-z0-9 &\-_]+?)\s*(presents:|:)", re.IGNORECASE)
+    YEAR: Final = re.compile(r"\b(20\d{2})\b")
+
+    # remix / edit annotations
+    REMIX_KEYWORD: Final = re.compile(r"(edit|remix|refix|bootleg|remix edit)", re.IGNORECASE)
+    REMIX_POSSESSIVE: Final = re.compile(r"['’]s\s+(remix|edit|refix|version|bootleg|mix|vip)\b", re.IGNORECASE)
+    REMIX_SUFFIX_FULL: Final = re.compile(
+        r"\s*\b("
+        r"album|bootleg|cinematic|climax|cut|dub|dubstep|edit|extended|hardcore|hardstyle|instrumental|kick|live|mix|non vocal|non-vocal|nostalgia|old school|original|pro remix|radio|refix|remastered|remix|re-kick|uptempo|version|vip|vocal|"
+        r"\d{4}|2k\d{2}"
+        r")\b\s*$",
+        re.IGNORECASE
+    )
+    REMIX_SUFFIX_SIMPLE: Final = re.compile(r"\s*\b(edit|remix|refix|bootleg)\b\s*$", re.IGNORECASE)
+
+    # artist name validation
+    LETTER: Final = re.compile(r"[A-Za-z]")
+    NUMERIC_ONLY: Final = re.compile(r"^#?\d+[.)]?$")
+    NUMERIC_PREFIX: Final = re.compile(r"^#?\d{1,3}[.)\s-]+")
+    INVALID_START: Final = re.compile(r"^[&#\-\(\*'\"\[]+")
+
 # noinspection SpellCheckingInspection
 ALBUM_ARTIST: Final = "albumartist"
 ARTIST: Final = "artist"
@@ -0,0 +1,124 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# Marks a task result the consumer should not see (e.g. unreadable file)
+SKIP = object()
+
+
+@dataclass
+class ScanStats:
+    """Counters of one scan; failed files raised from the task."""
+    name: str = ""
+    files: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self):
+        return {**asdict(self), "files_per_second": round(self.files_per_second, 1)}
+
+
+class FileScanner:
+    """
+    Walks a music folder and runs a task on every audio file in a worker pool.
+
+    One walker thread feeds a bounded queue, so traversal never runs far ahead of
+    the workers. Task results are handed to the consumer in the calling thread,
+    one by one as they complete, so the consumer (analyzer queue, tag writer, ...)
+    needs no locking of its own.
+    """
+
+    def __init__(self, name: str, extensions: dict[str, bool], workers: int = 8):
+        self.name = name
+        self.extensions = [ext for ext, enabled in extensions.items() if enabled]
+        self.workers = max(1, workers)
+
+    def iter_files(self, folder: Path) -> Iterator[Path]:
+        """Recursively yields the enabled audio files below a folder."""
+        if "@eaDir" in str(folder):
+            return
+        try:
+            for ext in self.extensions:
+                yield from folder.glob(f"*.{ext}")
+            for sub in [f for f in folder.iterdir() if f.is_dir() and not f.name.startswith("_")]:
+                yield from self.iter_files(sub)
+        except Exception as e:
+            logging.error(f"Error scanning folder {folder}: {e}", exc_info=True)
+
+    def scan(self, root: Path, task: Callable[[Path], Any], consumer: Callable[[Any], None]) -> ScanStats:
+        """
+        Runs task(path) for every file below root and streams the results to consumer.
+
+        Results equal to SKIP are counted but not passed on. Exceptions raised by the
+        task are logged and counted as failed; exceptions from the consumer propagate.
+        """
+        stats = ScanStats(name=self.name)
+        started = time.monotonic()
+        work_queue = queue.Queue(maxsize=self.workers * 4)
+        stop = threading.Event()
+        walker = threading.Thread(target=self._walk, args=(root, work_queue, stop),
+                                  name=f"{self.name}-walker", daemon=True)
+        walker.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name) as executor:
+                in_flight = set()
+                finished = False
+                while not finished or in_flight:
+                    while not finished and len(in_flight) < self.workers * 2:
+                        path = work_queue.get()
+                        if path is None:
+                            finished = True
+                        else:
+                            in_flight.add(executor.submit(self._run_task, task, path))
+                    if in_flight:
+                        completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in completed:
+                            ok, result = future.result()
+                            stats.files += 1
+                            if not ok:
+                                stats.failed += 1
+                            elif result is not SKIP:
+                                consumer(result)
+        finally:
+            stop.set()
+            self._drain(work_queue)
+            walker.join()
+            stats.elapsed = time.monotonic() - started
+            logging.info(f"[{self.name}] scanned {stats.files} files ({stats.failed} failed) "
+                         f"in {stats.elapsed:.1f}s, {stats.files_per_second:.1f} files/sec")
+        return stats
+
+    def _walk(self, root: Path, work_queue: queue.Queue, stop: threading.Event):
+        try:
+            for path in self.iter_files(root):
+                if stop.is_set():
+                    break
+                work_queue.put(path)
+        finally:
+            work_queue.put(None)
+
+    @staticmethod
+    def _drain(work_queue: queue.Queue):
+        """Unblocks a walker stuck on a full queue after the consumer gave up."""
+        try:
+            while True:
+                work_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _run_task(self, task: Callable[[Path], Any], path: Path) -> tuple[bool, Any]:
+        try:
+            return True, task(path)
+        except Exception as e:
+            logging.error(f"[{self.name}] failed: {e} -> {path}", exc_info=True)
+            return False, None
@@ -1,5 +1,11 @@
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed, ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 import logging
 import sys
@@ -8,15 +14,19 @@ from mutagen import MutagenError
 from mutagen.easyid3 import EasyID3
 from mutagen.easymp4 import EasyMP4Tags
 
+from api.jobs import job_manager
 from data.settings import Settings
 from postprocessing.Song.BaseSong import ExtensionNotSupportedException
 from postprocessing.Song.GenericSong import GenericSong
 from postprocessing.Song.Helpers.BrokenSongHelper import BrokenSongHelper
+from postprocessing.Song.Helpers.FileStateHelper import FileStateHelper
+from postprocessing.Song.Helpers.WriteBehindBuffer import write_buffer
 from postprocessing.Song.LabelSong import LabelSong
 from postprocessing.Song.SoundcloudSong import SoundcloudSong
 from postprocessing.Song.YoutubeSong import YoutubeSong
 from postprocessing.Song.TelegramSong import TelegramSong
 from postprocessing.constants import SongTypeEnum, MP3Tags
+from postprocessing.scanner import FileScanner
 
 # global vars
 EasyID3.RegisterTXXXKey('publisher', 'publisher')
@@ -36,7 +46,29 @@ parse_m4a = True
 parse_wav = False  # WAV is currently bugged
 parse_aac = False  # AAC has no tags, downloads changed to M4A
 
+PROGRESS_INTERVAL = 2  # seconds between progress updates
+
 broken_song_helper = BrokenSongHelper()
+file_state_helper = FileStateHelper()
+
+
+@dataclass
+class TagProgress:
+    """Counters of a tag pass, published through the job manager."""
+    seen: int = 0
+    skipped: int = 0
+    queued: int = 0
+    tagged: int = 0
+    rewritten: int = 0
+    would_rewrite: int = 0
+    failed: int = 0
+    published_at: float = field(default=0.0, repr=False)
+
+    def as_dict(self):
+        data = asdict(self)
+        data.pop("published_at")
+        return data
+
 
 class Tagger:
     """
@@ -46,46 +78,108 @@ class Tagger:
 
     def __init__(self):
         self.parallel = True
-        pass
+        self.force = False
+        self.dry_run = False
+        self.mode = s.tagger_mode
+        self.workers = s.tagger_workers
+        self.batch_size = s.tagger_batch_size
+        self._executor = None
+        self._scanner = FileScanner("tagger", {
+            "mp3": parse_mp3,
+            "flac": parse_flac,
+            "wav": parse_wav,
+            "m4a": parse_m4a,
+            "aac": parse_aac
+        })
 
-    def run(self, parse_labels=True, parse_soundcloud=True, parse_youtube=True, parse_generic=True, parse_telegram=True):
+    def run(self, parse_labels=True, parse_soundcloud=True, parse_youtube=True, parse_generic=True, parse_telegram=True,
+            force=False, mode=None, workers=None, batch_size=None, dry_run=False):
         """
         Entrypoint for the tagging process.
         Scans various music directories (labels, YouTube, SoundCloud, generic) and applies appropriate tag parsing.
+
+        @param force: Ignore the file-state index and re-tag every file
+        @param mode: "thread" or "process", overrides Settings.tagger_mode
+        @param workers: Worker count, overrides Settings.tagger_workers
+        @param batch_size: Paths per submitted task, overrides Settings.tagger_batch_size
+        @param dry_run: Only log the would-be writes; no file is saved or marked as tagged
+        @return: Write summary of the run: inspected, rewritten and would_rewrite files
+        """
+        logging.info("Starting Tag Step with options: {}, {}, {}, {}, {}, force={}, dry_run={}".format(parse_labels, parse_soundcloud, parse_youtube, parse_generic, parse_telegram, force, dry_run))
+        self.force = force
+        self.dry_run = bool(dry_run)
+        self.mode = mode or self.mode
+        self.workers = int(workers or self.workers)
+        self.batch_size = max(1, int(batch_size or self.batch_size))
+        if not force:
+            file_state_helper.load()
+
+        self._executor = self._create_executor() if self.parallel else None
+        try:
+            progress = self._process(self._collect_roots(parse_labels, parse_soundcloud, parse_youtube, parse_generic, parse_telegram))
+        finally:
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+            write_buffer.flush()
+            file_state_helper.flush()
+
+        # counted from the worker results: write_stats of worker processes is not shared
+        summary = {"inspected": progress.tagged, "rewritten": progress.rewritten,
+                   "would_rewrite": progress.would_rewrite}
+        logging.info(f"Tag writes{' (dry run)' if self.dry_run else ''}: {summary}")
+        return summary
+
+    def _create_executor(self):
         """
-        logging.info("Starting Tag Step with options: {}, {}, {}, {}, {}".format(parse_labels, parse_soundcloud, parse_youtube, parse_generic, parse_telegram))
+        Creates the worker pool shared by all folders of this run.
 
+        Process mode sidesteps the GIL for the pure-Python rule chain; each worker
+        loads the database caches once through the initializer.
+        """
+        logging.info(f"Tagging with {self.workers} {self.mode} workers, batch size {self.batch_size}")
+        if self.mode == "process":
+            # spawn instead of fork: the walker thread is already running when workers start
+            return ProcessPoolExecutor(max_workers=self.workers, initializer=Tagger._init_worker,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _collect_roots(self, parse_labels, parse_soundcloud, parse_youtube, parse_generic, parse_telegram):
+        """
+        Returns the (folder, song type) pairs to tag, in the order they are walked.
+        """
+        roots = []
         if parse_labels:
-            self._parse_label_folders()
+            roots.extend(self._label_roots())
 
         if parse_soundcloud:
-            self._parse_channel_folders("Soundcloud", SongTypeEnum.SOUNDCLOUD)
+            roots.extend(self._channel_roots("Soundcloud", SongTypeEnum.SOUNDCLOUD))
 
         if parse_youtube:
-            self._parse_channel_folders("Youtube", SongTypeEnum.YOUTUBE)
+            roots.extend(self._channel_roots("Youtube", SongTypeEnum.YOUTUBE))
 
         if parse_telegram:
-            self._parse_channel_folders("Telegram", SongTypeEnum.TELEGRAM)
+            roots.extend(self._channel_roots("Telegram", SongTypeEnum.TELEGRAM))
 
         if parse_generic:
-           self._parse_generic_folders()
-
+            roots.extend(self._generic_roots())
+        return roots
 
-    def _parse_label_folders(self):
+    def _label_roots(self):
         """
-        Parses the EPS folder which contains label/ep/song hierarchies.
+        Lists the EPS folder which contains label/ep/song hierarchies.
         """
         eps_root = Path(s.eps_folder_path)
         label_folders = sorted([f for f in eps_root.iterdir() if f.is_dir()])
 
-        for label in label_folders:
-            song_type = SongTypeEnum.LABEL if not label.name.startswith("_") else SongTypeEnum.GENERIC
-            print(label)
-            self.parse_folder(label, song_type)
+        return [
+            (label, SongTypeEnum.LABEL if not label.name.startswith("_") else SongTypeEnum.GENERIC)
+            for label in label_folders
+        ]
 
-    def _parse_channel_folders(self, source_folder: str, song_type: SongTypeEnum):
+    def _channel_roots(self, source_folder: str, song_type: SongTypeEnum):
         """
-        Parses folders under a platform-specific directory like SoundCloud or YouTube.
+        Lists folders under a platform-specific directory like SoundCloud or YouTube.
 
         @param source_folder: Root subfolder under music_folder_path
         @param song_type: Enum describing the song origin
@@ -93,24 +187,24 @@ class Tagger:
         root = Path(s.music_folder_path) / source_folder
         if not root.exists():
             logging.warning(f"Folder '{root}' does not exist, skipping.")
-            return
+            return []
 
-        for channel in sorted([f for f in root.iterdir() if f.is_dir()]):
-            self.parse_folder(channel, song_type)
+        return [(channel, song_type) for channel in sorted([f for f in root.iterdir() if f.is_dir()])]
 
-    def _parse_generic_folders(self):
+    def _generic_roots(self):
         """
-        Parses generic folders like Livesets, Podcasts, Top 100.
+        Lists generic folders like Livesets, Podcasts, Top 100.
         """
         generic_folders = ["Livesets", "Podcasts", "Top 100", "Warm Up Mixes"]
         music_root = Path(s.music_folder_path)
 
+        roots = []
         for folder_name in generic_folders:
             root_path = music_root / folder_name
             if not root_path.exists():
                 continue
-            for subfolder in [f for f in root_path.iterdir() if f.is_dir()]:
-                self.parse_folder(subfolder, SongTypeEnum.GENERIC)
+            roots.extend((subfolder, SongTypeEnum.GENERIC) for subfolder in root_path.iterdir() if subfolder.is_dir())
+        return roots
 
     def parse_folder(self, folder: Path, song_type: SongTypeEnum):
         """
@@ -119,43 +213,110 @@ class Tagger:
         @param folder: Path object to folder to scan
         @param song_type: Enum to define tag strategy
         """
-        if "@eaDir" in str(folder):
-            return
-
-        extensions = {
-            "mp3": parse_mp3,
-            "flac": parse_flac,
-            "wav": parse_wav,
-            "m4a": parse_m4a,
-            "aac": parse_aac
-        }
+        self._process([(folder, song_type)])
 
+    def _walk(self, roots, work_queue: queue.Queue, progress: "TagProgress"):
+        """
+        Producer: streams every new or modified file of all roots into the work queue.
+        Blocks when the queue is full, so traversal never runs far ahead of tagging.
+        """
         try:
-            files = []
-            for ext, enabled in extensions.items():
-                if enabled:
-                    files.extend(folder.glob(f"*.{ext}"))
-
-            if self.parallel and files:
-                with ThreadPoolExecutor(max_workers=16) as executor:
-                    futures = [executor.submit(Tagger._parse_worker, str(file), song_type.name) for file in files]
-                    for future in as_completed(futures):
-                        path, status = future.result()
-                        if status != "OK":
-                            logging.warning(f"{path}: {status}")
-            else:
-                for file in files:
-                    self._try_parse(file, song_type)
+            for folder, song_type in roots:
+                for file in self._scanner.iter_files(folder):
+                    progress.seen += 1
+                    path = str(file)
+                    if not self.force and file_state_helper.is_unchanged(path):
+                        progress.skipped += 1
+                        continue
+                    work_queue.put((path, song_type.name))
+                    progress.queued += 1
+        except Exception as e:
+            logging.error(f"Error walking music folders: {e}", exc_info=True)
+        finally:
+            work_queue.put(None)
 
-            for subfolder in [f for f in folder.iterdir() if f.is_dir() and not f.name.startswith("_")]:
-                self.parse_folder(subfolder, song_type)
+    def _process(self, roots):
+        """
+        Consumer: drains the work queue into the long-lived worker pool.
 
-        except Exception as e:
-            logging.error(f"Error parsing folder {folder}: {e}", exc_info=True)
+        One walker thread feeds a bounded queue; files are grouped into batches of
+        batch_size and at most two batches per worker are in flight at a time.
+        """
+        progress = TagProgress()
+        work_queue = queue.Queue(maxsize=self.workers * self.batch_size * 2)
+        walker = threading.Thread(target=self._walk, args=(roots, work_queue, progress),
+                                  name="tagger-walker", daemon=True)
+        walker.start()
+
+        in_flight = set()
+        batch = []
+        finished = False
+        while not finished:
+            try:
+                item = work_queue.get(timeout=0.5)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                finished = True
+            elif item:
+                batch.append(item)
+
+            if batch and (finished or not item or len(batch) >= self.batch_size):
+                if self._executor:
+                    in_flight.add(self._executor.submit(Tagger._parse_batch, batch, self.dry_run))
+                else:
+                    for path, song_type_str in batch:
+                        self._count(progress, path, self._try_parse(Path(path), SongTypeEnum[song_type_str]))
+                batch = []
+
+            if len(in_flight) >= self.workers * 2:
+                completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            else:
+                completed = {future for future in in_flight if future.done()}
+                in_flight -= completed
+            self._collect(completed, progress)
+            self._publish_progress(progress)
+
+        completed, _ = wait(in_flight)
+        self._collect(completed, progress)
+        walker.join()
+        self._publish_progress(progress, final=True)
+        logging.info(f"Tag pass finished: {progress.as_dict()}")
+        return progress
+
+    def _collect(self, futures, progress: "TagProgress"):
+        for future in futures:
+            for path, status in future.result():
+                if status not in ("OK", "WRITTEN"):
+                    logging.warning(f"{path}: {status}")
+                self._count(progress, path, status)
+
+    def _count(self, progress: "TagProgress", path: str, status: str):
+        """
+        Counts a parse result: "OK" (inspected), "WRITTEN" (rewritten on disk, or
+        would be in a dry run) or an error.
+        """
+        if status in ("OK", "WRITTEN"):
+            progress.tagged += 1
+            if status == "WRITTEN" and self.dry_run:
+                progress.would_rewrite += 1
+            elif status == "WRITTEN":
+                progress.rewritten += 1
+            if not self.dry_run:
+                file_state_helper.mark(path)
+        else:
+            progress.failed += 1
+
+    def _publish_progress(self, progress: "TagProgress", final: bool = False):
+        now = time.monotonic()
+        if not final and now - progress.published_at < PROGRESS_INTERVAL:
+            return
+        progress.published_at = now
+        job_manager.publish({"type": "tagger-progress", "final": final, **progress.as_dict()})
 
-    def _try_parse(self, file: Path, song_type: SongTypeEnum):
+    def _try_parse(self, file: Path, song_type: SongTypeEnum) -> str:
         try:
-            self.parse_song(file, song_type)
+            return "WRITTEN" if self.parse_song(file, song_type, dry_run=self.dry_run) else "OK"
         except KeyboardInterrupt:
             logging.info('KeyboardInterrupt')
             sys.exit(1)
@@ -164,14 +325,18 @@ class Tagger:
             broken_song_helper.add(str(file), type(e).__name__)
         except Exception as e:
             logging.error(f"Parse_song failed: {e} -> {file}", exc_info=True)
+        return "FAILED"
 
     @staticmethod
-    def parse_song(path: Path, song_type: SongTypeEnum, manual_tags: dict[str, str] | None = None):
+    def parse_song(path: Path, song_type: SongTypeEnum, manual_tags: dict[str, str] | None = None,
+                   dry_run: bool = False) -> bool:
         """
-        Creates a Song instance to trigger tag parsing logic.
+        Creates a Song instance to trigger tag parsing logic and commits it once.
 
         @param path: Path object to the song
         @param song_type: Type of song source (LABEL, YOUTUBE, etc)
+        @param dry_run: Only log the would-be writes
+        @return: True if the file was rewritten, or would be in a dry run
         """
         song = None
         if song_type == SongTypeEnum.LABEL:
@@ -184,21 +349,37 @@ class Tagger:
             song = TelegramSong(str(path))
         elif song_type == SongTypeEnum.GENERIC:
             song = GenericSong(str(path))
-        if song:
+        if not song:
+            return False
+        song.dry_run = dry_run
+        with song:
             song.parse()
             if manual_tags:
                 for tag, value in manual_tags.items():
                     song.tag_collection.add(tag, value)
-                song.save_file()
+        return song.would_rewrite if dry_run else song.rewritten
         #for artist in song.artists():
         #    for genre in song.genres():
         #        a.submit(artist, genre)
 
     @staticmethod
-    def _parse_worker(file: str, song_type_str: str, manual_tags: dict[str, str] | None = None):
+    def _init_worker():
+        """Loads the shared database caches once per worker process."""
+        from postprocessing.Song.Helpers.Cache import databaseHelpers
+        # workers exit without atexit handlers; flush pending inserts on shutdown
+        multiprocessing.util.Finalize(None, write_buffer.flush, exitpriority=10)
+        logging.info(f"Tag worker {os.getpid()} ready with {len(databaseHelpers)} cached tables")
+
+    @staticmethod
+    def _parse_batch(items: list[tuple[str, str]], dry_run: bool = False):
+        return [Tagger._parse_worker(file, song_type_str, dry_run=dry_run) for file, song_type_str in items]
+
+    @staticmethod
+    def _parse_worker(file: str, song_type_str: str, manual_tags: dict[str, str] | None = None,
+                      dry_run: bool = False):
         try:
             song_type = SongTypeEnum[song_type_str]
-            Tagger.parse_song(Path(file), song_type, manual_tags)
-            return file, "OK"
+            rewritten = Tagger.parse_song(Path(file), song_type, manual_tags, dry_run)
+            return file, "WRITTEN" if rewritten else "OK"
         except Exception as e:
             return file, f"{type(e).__name__}: {e}"
@@ -58,8 +58,8 @@ def post_processing_songs(folder_path):
                     continue
                 try:
                     logging.info(f"Processing file with LabelSong: {full_path}")
-                    s = LabelSong(str(full_path))
-                    s.parse()
+                    with LabelSong(str(full_path)) as s:
+                        s.parse()
                 except Exception as e:
                     logging.error(f"Failed to process {full_path} with LabelSong: {e}")
 
@@ -84,6 +84,8 @@ class Mover:
         except Exception as e:
             logging.error(f"Error querying database: {e}")
             return None
+        finally:
+            connection.close()
 
     def remove(self, folder):
         """
@@ -106,6 +106,17 @@ if 'data.settings' not in sys.modules:
             self.eps_folder_path = ""
             self.music_folder_path = ""
             self.delimiter = "/"
+            self.tagger_mode = "thread"
+            self.tagger_workers = 16
+            self.tagger_batch_size = 32
+            self.scan_workers = 8
+            self.download_max_concurrency = 8
+            self.download_rate = 1.0
+            self.download_burst = 10
+            self.pipeline_archive_workers = 2
+            self.pipeline_tag_workers = 4
+            self.pipeline_queue_size = 32
+            self.metadata_only = False
     settings_mod.Settings = Settings
     sys.modules['data.settings'] = settings_mod
 
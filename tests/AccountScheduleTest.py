@@ -0,0 +1,119 @@
+import unittest
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from downloader.AccountSchedule import (
+    AccountCrawl,
+    AccountSchedule,
+    AccountState,
+    HighWaterMarkReached,
+)
+
+NOW = datetime(2024, 3, 1, 12, 0)
+
+
+class DummyConnector:
+    rows = []
+    executed = []
+
+    def connect(self):
+        class DummyConn:
+            def cursor(self_inner):
+                class Ctx:
+                    def __enter__(self_ctx):
+                        return self_ctx
+
+                    def __exit__(self_ctx, exc_type, exc, tb):
+                        pass
+
+                    def execute(self_ctx, q, params=None):
+                        DummyConnector.executed.append((q, params))
+
+                    def fetchall(self_ctx):
+                        return DummyConnector.rows
+
+                return Ctx()
+
+            def commit(self_inner):
+                pass
+
+            def close(self_inner):
+                pass
+
+        return DummyConn()
+
+
+class AccountCrawlTest(unittest.TestCase):
+    def test_stops_at_last_seen_upload(self):
+        crawl = AccountCrawl(AccountState("acc", date(2024, 2, 1), "old"))
+        self.assertIsNone(crawl.match_filter({"id": "new", "upload_date": "20240210"}))
+        with self.assertRaises(HighWaterMarkReached):
+            crawl.match_filter({"id": "old"}, incomplete=True)
+        self.assertEqual(crawl.newest, (date(2024, 2, 10), "new"))
+        self.assertEqual(crawl.new_entries, 1)
+
+    def test_stops_at_older_upload_date(self):
+        crawl = AccountCrawl(AccountState("acc", date(2024, 2, 1), "gone"))
+        with self.assertRaises(HighWaterMarkReached):
+            crawl.match_filter({"id": "x", "upload_date": "20240131"})
+
+    def test_delegates_complete_entries_to_match_filter(self):
+        crawl = AccountCrawl(AccountState("acc"), lambda info: "too short")
+        self.assertEqual(crawl.match_filter({"id": "a", "upload_date": "20240101"}), "too short")
+        self.assertIsNone(crawl.match_filter({"id": "a"}, incomplete=True))
+
+    def test_reset_forgets_entries_of_a_failed_attempt(self):
+        crawl = AccountCrawl(AccountState("acc", date(2024, 2, 1), "old"))
+        crawl.match_filter({"id": "new", "upload_date": "20240210"})
+        crawl.reset()
+        crawl.match_filter({"id": "new", "upload_date": "20240210"})
+        self.assertEqual(crawl.new_entries, 1)
+        self.assertEqual(crawl.oldest, date(2024, 2, 10))
+
+
+class AccountScheduleTest(unittest.TestCase):
+    def setUp(self):
+        DummyConnector.rows = []
+        DummyConnector.executed = []
+        patcher = patch("downloader.AccountSchedule.DatabaseConnector", DummyConnector)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.schedule = AccountSchedule("soundcloud_accounts", clock=lambda: NOW)
+
+    def test_due_orders_by_next_check(self):
+        DummyConnector.rows = [
+            ("later", None, None, None, NOW + timedelta(days=1)),
+            ("overdue", None, None, 2.0, NOW - timedelta(days=2)),
+            ("new", None, None, None, None),
+            ("due", None, None, 1.0, NOW - timedelta(hours=1)),
+        ]
+        self.assertEqual(self.schedule.due(self.schedule.load()), ["new", "overdue", "due"])
+
+    def test_record_active_account(self):
+        crawl = AccountCrawl(AccountState("acc", date(2024, 2, 21), "a", 4.0))
+        crawl.match_filter({"id": "c", "upload_date": "20240229"})
+        crawl.match_filter({"id": "b", "upload_date": "20240225"})
+
+        state = self.schedule.record(crawl)
+        self.assertEqual((state.last_upload_date, state.last_video_id), (date(2024, 2, 29), "c"))
+        self.assertEqual(state.upload_interval_days, 4.0)
+        self.assertEqual(state.next_check_at, NOW + timedelta(days=2))
+        query, params = DummyConnector.executed[-1]
+        self.assertIn("UPDATE soundcloud_accounts", query)
+        self.assertEqual(params[-1], "acc")
+
+    def test_dormant_account_is_polled_less_often(self):
+        crawl = AccountCrawl(AccountState("acc", date(2023, 12, 1), "a", 3.0))
+        state = self.schedule.record(crawl)
+        self.assertEqual(state.last_video_id, "a")
+        self.assertEqual(state.upload_interval_days, 91.0)
+        self.assertEqual(state.next_check_at, NOW + AccountSchedule.MAX_POLL)
+
+    def test_unknown_interval_polls_at_minimum(self):
+        state = self.schedule.record(AccountCrawl(AccountState("acc")))
+        self.assertIsNone(state.upload_interval_days)
+        self.assertEqual(state.next_check_at, NOW + AccountSchedule.MIN_POLL)
+
+
+if __name__ == "__main__":
+    unittest.main()
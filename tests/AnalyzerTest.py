@@ -31,6 +31,8 @@ pymysql_mod = types.ModuleType('pymysql')
 pymysql_mod.connect = dummy_connect
 sys.modules['pymysql'] = pymysql_mod
 
+from unittest.mock import MagicMock
+
 from postprocessing.analyzer import Analyzer
 
 class AnalyzerTest(unittest.TestCase):
@@ -50,5 +52,37 @@ class AnalyzerTest(unittest.TestCase):
         finally:
             Analyzer._truncate_tables = original
 
+    def test_aggregates_and_flushes_bulk_upserts(self):
+        analyzer = Analyzer(flush_size=100)
+        cursor = MagicMock()
+        ids = {"Angerfist": 1, "Miss K8": 2, "Hardcore": 10, "Uptempo": 11}
+        cursor.fetchall.side_effect = lambda: [(name, ids[name]) for name in cursor.execute.call_args.args[1]]
+        analyzer.cursor = cursor
+
+        for artist, genre in [("Angerfist", "Hardcore"), ("Angerfist", "Hardcore"),
+                              ("Angerfist", "Uptempo"), ("Miss K8", "Hardcore")]:
+            analyzer._process(artist, genre)
+        cursor.executemany.assert_not_called()
+
+        analyzer.flush()
+        artist_rows, genre_rows, pair_rows = [call.args[1] for call in cursor.executemany.call_args_list]
+        self.assertEqual(sorted(artist_rows), [("Angerfist", 3), ("Miss K8", 1)])
+        self.assertEqual(sorted(genre_rows), [("Hardcore",), ("Uptempo",)])
+        self.assertEqual(sorted(pair_rows), [(1, 10, 2), (1, 11, 1), (2, 10, 1)])
+
+        # ids are cached: a second flush does not look them up again
+        cursor.execute.reset_mock()
+        analyzer._process("Angerfist", "Hardcore")
+        analyzer.flush()
+        cursor.execute.assert_not_called()
+        self.assertEqual(cursor.executemany.call_args.args[1], [(1, 10, 1)])
+
+    def test_flush_without_data_skips_db(self):
+        analyzer = Analyzer()
+        analyzer.cursor = MagicMock()
+        analyzer.flush()
+        analyzer.cursor.executemany.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
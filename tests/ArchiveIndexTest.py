@@ -0,0 +1,118 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from downloader.ArchiveIndex import ArchiveIndex
+
+
+class DummyConnector:
+    rows = [("123", "a1"), (456, "b2")]
+    connects = 0
+
+    def connect(self):
+        DummyConnector.connects += 1
+
+        class DummyConn:
+            def cursor(self_inner):
+                class Ctx:
+                    def __enter__(self_ctx):
+                        return self_ctx
+
+                    def __exit__(self_ctx, exc_type, exc, tb):
+                        pass
+
+                    def execute(self_ctx, q, params=None):
+                        pass
+
+                    def fetchall(self_ctx):
+                        return DummyConnector.rows
+
+                return Ctx()
+
+            def close(self_inner):
+                pass
+
+        return DummyConn()
+
+
+class FailingConnector:
+    def connect(self):
+        raise RuntimeError("db down")
+
+
+class ArchiveIndexTest(unittest.TestCase):
+    def setUp(self):
+        DummyConnector.connects = 0
+        patcher = patch("downloader.ArchiveIndex.DatabaseConnector", DummyConnector)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.index = ArchiveIndex("soundcloud_archive", "soundcloud")
+
+    def test_loads_once_and_answers_from_memory(self):
+        self.assertTrue(self.index.ensure_loaded())
+        self.assertTrue(self.index.ensure_loaded())
+        self.assertTrue(self.index.contains("123", "a1"))
+        self.assertTrue(self.index.contains("456", "b2"))
+        self.assertFalse(self.index.contains("123", "b2"))
+        self.assertFalse(self.index.contains(None, "a1"))
+        self.assertEqual(DummyConnector.connects, 1)
+
+    def test_add_updates_index(self):
+        self.index.load()
+        self.index.add("789", "c3")
+        self.assertTrue(self.index.contains("789", "c3"))
+        self.assertTrue(self.index.contains_video("c3"))
+
+    def test_load_failure_leaves_index_unloaded(self):
+        with patch("downloader.ArchiveIndex.DatabaseConnector", FailingConnector):
+            self.assertFalse(self.index.load())
+        self.assertFalse(self.index.loaded)
+
+    def test_download_archive_checks_index_then_file(self):
+        self.index.load()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "acc.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("soundcloud x9\n")
+
+            archive = self.index.download_archive(path)
+            self.assertTrue(archive)
+            self.assertIn("soundcloud a1", archive)
+            self.assertIn("soundcloud x9", archive)
+            self.assertNotIn("youtube a1", archive)
+            self.assertNotIn("soundcloud new", archive)
+
+            archive.add("soundcloud new")
+            self.assertIn("soundcloud new", archive)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read().splitlines(), ["soundcloud x9", "soundcloud new"])
+
+    def test_download_archive_is_shared_per_file(self):
+        self.index.load()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "shared.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("soundcloud x9\n")
+
+            with patch("downloader.ArchiveIndex.open", side_effect=open) as opened:
+                archive = self.index.download_archive(path)
+                self.assertIs(self.index.download_archive(os.path.join(folder, ".", "shared.txt")), archive)
+                self.assertEqual(opened.call_count, 1)
+
+            threads = [threading.Thread(target=archive.add, args=(f"soundcloud t{i % 10}",)) for i in range(50)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(sorted(f.read().splitlines()),
+                                 sorted(["soundcloud x9"] + [f"soundcloud t{i}" for i in range(10)]))
+
+            self.index.load()
+            self.assertIsNot(self.index.download_archive(path), archive)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,7 @@ class ArtistFixerTest(unittest.TestCase):
             song.artist.return_value = 'New Artist'
             song.tag_collection.get_item.return_value = MagicMock()
             song.save_file.return_value = None
+            song.commit.side_effect = lambda dry_run=False: artistfixer.write_stats.record(False, would_rewrite=dry_run)
             return song
 
         self.rule_instance = MagicMock()
@@ -63,7 +64,7 @@ class ArtistFixerTest(unittest.TestCase):
         self.patcher_settings = patch.object(
             artistfixer,
             'Settings',
-            return_value=types.SimpleNamespace(music_folder_path=self.tempdir.name)
+            return_value=types.SimpleNamespace(music_folder_path=self.tempdir.name, scan_workers=2)
         )
         self.patcher_bs = patch.object(artistfixer, 'BaseSong', side_effect=fake_base_song)
         self.patcher_rule = patch.object(artistfixer, 'VerifyArtistRule', return_value=self.rule_instance)
@@ -83,6 +84,12 @@ class ArtistFixerTest(unittest.TestCase):
         self.assertEqual(self.rule_instance.apply.call_count, 3)
         # prints should indicate artists were added
         self.assertTrue(all('artists table' in call.args[0] for call in mock_print.call_args_list))
+    def test_dry_run_returns_write_summary(self):
+        summary = self.fix.run(dry_run=True)
+
+        self.assertTrue(self.fix.dry_run)
+        self.assertEqual(summary, {"inspected": 3, "rewritten": 0, "would_rewrite": 3})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,176 @@
+import socket
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from downloader.ConcurrencyController import (
+    FAILED,
+    SUCCESS,
+    THROTTLED,
+    AimdController,
+    TokenBucket,
+    classify,
+    http_status,
+)
+
+
+def http_error(status: int) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError("http://example.com", status, "error", {}, None)
+
+
+class WrappedError(Exception):
+    """Like yt-dlp's DownloadError (exc_info) and ExtractorError/TransportError (cause)."""
+
+    def __init__(self, msg, exc_info=None, cause=None):
+        super().__init__(msg)
+        self.exc_info = exc_info
+        self.cause = cause
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeHost(ThreadingHTTPServer):
+    """Local stand-in for a rate-limited extractor endpoint: 403 above `capacity` in-flight requests."""
+
+    daemon_threads = True
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.served = 0
+        self.forbidden = 0
+        super().__init__(("127.0.0.1", 0), FakeHandler)
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            overloaded = server.in_flight > server.capacity
+        try:
+            time.sleep(0.01)
+            with server.lock:
+                if overloaded:
+                    server.forbidden += 1
+                else:
+                    server.served += 1
+            self.send_response(403 if overloaded else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_refills_at_rate_up_to_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.take(), 0)
+        self.assertAlmostEqual(bucket.take(), 0.5)
+
+        clock.now = 10.0
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.take(), 0)
+        self.assertGreater(bucket.take(), 0)
+
+
+class AimdControllerTest(unittest.TestCase):
+    def test_classify(self):
+        self.assertEqual(classify(http_error(403)), THROTTLED)
+        self.assertEqual(classify(http_error(404)), FAILED)
+        self.assertEqual(classify(socket.timeout("read timed out")), THROTTLED)
+        self.assertEqual(classify(urllib.error.URLError(socket.timeout("timed out"))), THROTTLED)
+        # messages alone are not trusted
+        self.assertEqual(classify(Exception("HTTP Error 403: Forbidden")), FAILED)
+
+    def test_classify_follows_yt_dlp_error_chain(self):
+        throttled = WrappedError("Unable to download webpage",
+                                 exc_info=(WrappedError, WrappedError("x", cause=http_error(429)), None))
+        self.assertEqual(classify(throttled), THROTTLED)
+        self.assertEqual(http_status(throttled), 429)
+
+        timeout = WrappedError("x", cause=WrappedError("transport", cause=socket.timeout("timed out")))
+        self.assertEqual(classify(timeout), THROTTLED)
+        self.assertIsNone(http_status(timeout))
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        clock = FakeClock()
+        controller = AimdController(initial=2, maximum=8, rate=100, burst=100, cooldown=30, clock=clock)
+        for _ in range(10):
+            controller.acquire("host")
+            controller.release("host", SUCCESS)
+        self.assertEqual(controller.limit("host"), 4)
+
+        controller.acquire("host")
+        controller.release("host", THROTTLED)
+        self.assertEqual(controller.limit("host"), 2)
+        self.assertEqual(controller._hosts["host"].cooldown_until, 30)
+
+        controller.acquire("other")
+        controller.release("other", FAILED)
+        self.assertEqual(controller.limit("other"), 2)
+
+    def test_cooldown_doubles_while_throttled(self):
+        clock = FakeClock()
+        controller = AimdController(rate=100, burst=100, cooldown=10, max_cooldown=25, clock=clock)
+        for expected in (10, 20, 25):
+            clock.now = controller._hosts["host"].cooldown_until if "host" in controller._hosts else 0
+            controller.acquire("host")
+            controller.release("host", THROTTLED)
+            self.assertEqual(controller._hosts["host"].penalty, expected)
+
+    def test_slot_classifies_exceptions(self):
+        controller = AimdController(initial=4, rate=100, burst=100, cooldown=0)
+        with self.assertRaises(RuntimeError):
+            with controller.slot("host"):
+                raise RuntimeError("download failed") from http_error(429)
+        self.assertEqual(controller.limit("host"), 2)
+        self.assertEqual(controller.stats("host")["active"], 0)
+
+    def test_backs_off_against_fake_extractor(self):
+        host = FakeHost(capacity=3)
+        threading.Thread(target=host.serve_forever, daemon=True).start()
+        self.addCleanup(host.server_close)
+        self.addCleanup(host.shutdown)
+        url = f"http://127.0.0.1:{host.server_address[1]}/track"
+        controller = AimdController(initial=2, maximum=8, rate=1000, burst=1000, cooldown=0.02, max_cooldown=0.1)
+
+        def extract(_):
+            while True:
+                try:
+                    with controller.slot("fake"):
+                        urllib.request.urlopen(url, timeout=5).read()
+                    return True
+                except urllib.error.HTTPError as e:
+                    if e.code != 403:
+                        raise
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(extract, range(60)))
+
+        self.assertTrue(all(results))
+        self.assertEqual(host.served, 60)
+        self.assertGreater(host.forbidden, 0)
+        self.assertLess(controller.limit("fake"), 8)
+        self.assertEqual(controller.stats("fake")["active"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import postprocessing.Song.Helpers.DatabaseConnector as db_module
+from postprocessing.Song.Helpers.DatabaseConnector import ConnectionPool, DatabaseConnector
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+
+        def factory():
+            connection = MagicMock()
+            self.created.append(connection)
+            return connection
+
+        self.pool = ConnectionPool(factory, max_size=2, timeout=0.2)
+
+    def test_close_returns_connection_for_reuse(self):
+        first = self.pool.acquire()
+        raw = first._connection
+        first.close()
+        second = self.pool.acquire()
+
+        self.assertIs(second._connection, raw)
+        self.assertEqual(len(self.created), 1)
+        raw.rollback.assert_called_once()
+        raw.close.assert_not_called()
+        raw.ping.assert_called_once_with(reconnect=False)
+
+    def test_dead_connection_is_replaced_on_checkout(self):
+        with self.pool.connection() as connection:
+            dead = connection._connection
+        dead.ping.side_effect = Exception("gone away")
+
+        with self.pool.connection() as connection:
+            self.assertIsNot(connection._connection, dead)
+        dead.close.assert_called_once()
+        self.assertEqual(self.pool.metrics()["created"], 2)
+
+    def test_pool_is_bounded_and_times_out(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        with self.assertRaises(TimeoutError):
+            self.pool.acquire()
+
+        threading.Timer(0.05, first.close).start()
+        third = self.pool.acquire()
+        self.assertIs(third._connection, self.created[0])
+        self.assertEqual(len(self.created), 2)
+        second.close()
+        self.assertGreater(self.pool.metrics()["max_wait_time"], 0)
+
+    def test_metrics_track_usage(self):
+        with self.pool.connection():
+            metrics = self.pool.metrics()
+            self.assertEqual(metrics["in_use"], 1)
+            self.assertEqual(metrics["created"], 1)
+        metrics = self.pool.metrics()
+        self.assertEqual((metrics["in_use"], metrics["idle"], metrics["checkouts"]), (0, 1, 1))
+
+    def test_unreferenced_connection_is_returned(self):
+        self.pool.acquire()
+        self.assertEqual(self.pool.metrics()["in_use"], 0)
+
+    def test_closed_wrapper_rejects_use(self):
+        connection = self.pool.acquire()
+        connection.close()
+        connection.close()
+        with self.assertRaises(Exception):
+            connection.cursor()
+        self.assertEqual(self.pool.metrics()["in_use"], 0)
+
+
+class DatabaseConnectorPoolTest(unittest.TestCase):
+    def setUp(self):
+        env = {'DB_HOST': 'pool-host', 'DB_USER': 'user', 'DB_PORT': '3306', 'DB_PASS': 'pw', 'DB_DB': 'db'}
+        patcher = patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        pools = patch.dict(db_module._pools, clear=True)
+        pools.start()
+        self.addCleanup(pools.stop)
+
+    def test_connectors_share_one_pool(self):
+        with patch.object(db_module, 'pymysql') as mock_pymysql:
+            DatabaseConnector().connect().close()
+            with DatabaseConnector().connection() as connection:
+                connection.cursor()
+            self.assertEqual(mock_pymysql.connect.call_count, 1)
+            self.assertEqual(DatabaseConnector().metrics()["checkouts"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
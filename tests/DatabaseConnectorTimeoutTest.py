@@ -12,6 +12,11 @@ class DatabaseConnectorTimeoutTest(unittest.TestCase):
         os.environ.setdefault('DB_PORT', '0')
         os.environ.setdefault('DB_PASS', '')
         os.environ.setdefault('DB_DB', 'db')
+        # keep mocked connections out of the shared pool used by other tests
+        import postprocessing.Song.Helpers.DatabaseConnector as db_module
+        patcher = patch.dict(db_module._pools, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_connect_uses_default_timeout(self):
         import postprocessing.Song.Helpers.DatabaseConnector as db_module
@@ -61,11 +61,17 @@ class DbInitTest(unittest.TestCase):
             'ignored_genres',
             'label_genre',
             'subgenre_genre',
+            'file_state',
         ]
-        self.assertEqual(len(executed), len(expected_tables))
+        creates = [sql for sql in executed if 'CREATE TABLE' in sql]
+        migrations = [sql for sql in executed if sql.startswith('ALTER TABLE')]
+        self.assertEqual(len(creates), len(expected_tables))
+        self.assertEqual(len(executed), len(expected_tables) + len(migrations))
         joined = ' '.join(executed)
         for table in expected_tables:
             self.assertIn(table, joined)
+        for table in ('soundcloud_accounts', 'youtube_accounts'):
+            self.assertTrue(any(f'ALTER TABLE {table} ' in sql and 'next_check_at' in sql for sql in migrations))
 
     def test_server_startup_calls_ensure_tables_exist(self):
         original_modules = {}
@@ -0,0 +1,54 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from postprocessing.scanner import FileScanner, SKIP
+
+
+class FileScannerTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        root = Path(self.tempdir.name)
+        for name in ("a.mp3", "b.flac", "c.wav", "sub/d.mp3", "_hidden/e.mp3", "@eaDir/f.mp3"):
+            path = root / name
+            path.parent.mkdir(exist_ok=True)
+            path.touch()
+        self.root = root
+        self.scanner = FileScanner("test", {"mp3": True, "flac": True, "wav": False}, workers=4)
+
+    def test_streams_results_of_enabled_files_to_consumer(self):
+        consumer_threads = set()
+        results = []
+
+        def consumer(result):
+            consumer_threads.add(threading.current_thread())
+            results.append(result)
+
+        stats = self.scanner.scan(self.root, lambda path: path.name, consumer)
+
+        self.assertEqual(sorted(results), ["a.mp3", "b.flac", "d.mp3"])
+        self.assertEqual(consumer_threads, {threading.current_thread()})
+        self.assertEqual(stats.files, 3)
+        self.assertEqual(stats.failed, 0)
+        self.assertGreaterEqual(stats.files_per_second, 0)
+
+    def test_counts_failures_and_skips(self):
+        def task(path):
+            if path.name == "a.mp3":
+                raise ValueError("broken")
+            if path.name == "b.flac":
+                return SKIP
+            return path.name
+
+        results = []
+        stats = self.scanner.scan(self.root, task, results.append)
+
+        self.assertEqual(results, ["d.mp3"])
+        self.assertEqual(stats.files, 3)
+        self.assertEqual(stats.failed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
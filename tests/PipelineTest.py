@@ -0,0 +1,90 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from downloader.Pipeline import Pipeline, PipelineClosed, Stage
+
+
+class PipelineTest(unittest.TestCase):
+    def test_items_pass_every_stage(self):
+        tagged = []
+        lock = threading.Lock()
+
+        def tag(item):
+            with lock:
+                tagged.append(item)
+
+        with Pipeline("test", [Stage("double", lambda x: x * 2, 2), Stage("tag", tag, 3)], queue_size=2) as pipeline:
+            for i in range(20):
+                pipeline.submit(i)
+
+        self.assertEqual(sorted(tagged), [i * 2 for i in range(20)])
+        stats = pipeline.stats()
+        self.assertEqual(stats["double"], {"processed": 20, "failed": 0})
+        self.assertEqual(stats["tag"], {"processed": 20, "failed": 0})
+
+    def test_failed_and_dropped_items_do_not_reach_next_stage(self):
+        seen = []
+
+        def archive(item):
+            if item == 1:
+                raise RuntimeError("db down")
+            return None if item == 2 else item
+
+        with Pipeline("test", [Stage("archive", archive), Stage("tag", seen.append)]) as pipeline:
+            for i in range(4):
+                pipeline.submit(i)
+
+        self.assertEqual(sorted(seen), [0, 3])
+        self.assertEqual(pipeline.stats()["archive"], {"processed": 3, "failed": 1})
+
+    def test_submit_blocks_while_first_queue_is_full(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow(item):
+            started.set()
+            release.wait()
+            return item
+
+        pipeline = Pipeline("test", [Stage("slow", slow)], queue_size=1)
+        pipeline.start()
+        pipeline.submit(0)
+        started.wait()
+        pipeline.submit(1)  # fills the queue while the worker is busy
+
+        submitted = threading.Event()
+        submitter = threading.Thread(target=lambda: (pipeline.submit(2), submitted.set()))
+        submitter.start()
+        self.assertFalse(submitted.wait(0.1))
+
+        release.set()
+        submitter.join()
+        pipeline.close()
+        self.assertEqual(pipeline.stats()["slow"]["processed"], 3)
+
+    def test_close_flushes_write_buffer_and_rejects_submit(self):
+        with patch("downloader.Pipeline.write_buffer") as buffer:
+            pipeline = Pipeline("test", [Stage("noop", lambda item: item)])
+            pipeline.start()
+            pipeline.submit(0)
+            pipeline.close()
+        buffer.flush.assert_called_once()
+        with self.assertRaises(PipelineClosed):
+            pipeline.submit(1)
+
+    def test_submit_fails_when_stage_workers_died(self):
+        def crash(item):
+            raise SystemExit  # not caught per item: ends the worker thread
+
+        pipeline = Pipeline("test", [Stage("crash", crash)], queue_size=1, poll_interval=0.01)
+        pipeline.start()
+        pipeline.submit(0)
+        pipeline._threads[0][0].join(1)
+        with self.assertRaises(PipelineClosed):
+            pipeline.submit(1)
+        pipeline.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
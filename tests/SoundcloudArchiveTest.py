@@ -22,6 +22,7 @@ class DummyConnector:
                     def execute(self_inner, q, params=None): pass
                     def fetchone(self_inner): return None
                 return Ctx()
+            def close(self): pass
         return DummyConn()
 mock_db.DatabaseConnector = DummyConnector
 sys.modules['postprocessing.Song.Helpers.DatabaseConnector'] = mock_db
@@ -28,6 +28,7 @@ class DummyConnector:
                     def execute(self_inner, *args, **kwargs): pass
                     def fetchall(self_inner): return []
                 return Ctx()
+            def close(self): pass
         return Conn()
 mock_db.DatabaseConnector = DummyConnector
 sys.modules['postprocessing.Song.Helpers.DatabaseConnector'] = mock_db
@@ -23,6 +23,7 @@ class DummyConnector:
                     def execute(self_inner, *a, **k): pass
                     def fetchone(self_inner): return None
                 return Ctx()
+            def close(self): pass
         return Conn()
 db_module.DatabaseConnector = DummyConnector
 sys.modules['postprocessing.Song.Helpers.DatabaseConnector'] = db_module
@@ -44,7 +45,7 @@ sys.modules['postprocessing.Song.SoundcloudSong'] = sc_song_mod
 
 
 
-from downloader.SoundcloudProcessor import SoundcloudSongProcessor
+from downloader.SoundcloudProcessor import SoundcloudSongProcessor, enrich_stats
 
 class SoundcloudProcessorTest(unittest.TestCase):
     def tearDown(self):
@@ -64,6 +65,52 @@ class SoundcloudProcessorTest(unittest.TestCase):
             SoundcloudSongProcessor._extract_account_name_from_url('not a url'),
             'not a url'
         )
+    def _processor(self, extracted=None):
+        calls = []
+        class Extractor:
+            def extract(self_inner, url):
+                calls.append(url)
+                return extracted
+        class Downloader:
+            def get_info_extractor(self_inner, key):
+                return Extractor()
+        processor = SoundcloudSongProcessor()
+        processor._downloader = Downloader()
+        enrich_stats.reset()
+        return processor, calls
+
+    def test_enrich_info_uses_live_info_without_fetch(self):
+        processor, calls = self._processor()
+        info = {'id': '1', 'title': 'Track', 'uploader': 'DJ', 'uploader_id': '42',
+                'uploader_url': 'https://soundcloud.com/dj'}
+        enriched = processor._enrich_info(info, 'https://soundcloud.com/dj/track')
+        self.assertEqual(calls, [])
+        self.assertEqual(enriched['original_url'], 'https://soundcloud.com/dj/track')
+        self.assertEqual(enrich_stats.as_dict(), {'avoided': 1, 'fetched': 0, 'failed': 0})
+
+    def test_enrich_info_fetches_only_missing_fields(self):
+        processor, calls = self._processor({'id': '1', 'title': 'Other', 'uploader_url': 'https://soundcloud.com/dj'})
+        info = {'id': '1', 'title': 'Track', 'uploader': 'DJ', 'uploader_id': '42'}
+        enriched = processor._enrich_info(info, 'https://soundcloud.com/dj/track')
+        self.assertEqual(calls, ['https://soundcloud.com/dj/track'])
+        self.assertEqual(enriched['title'], 'Track')
+        self.assertEqual(enriched['uploader_url'], 'https://soundcloud.com/dj')
+        self.assertEqual(enrich_stats.as_dict(), {'avoided': 0, 'fetched': 1, 'failed': 0})
+    def test_run_hands_song_to_pipeline(self):
+        submitted = []
+        class Pipeline:
+            def submit(self_inner, song):
+                submitted.append(song)
+        processor, _ = self._processor()
+        processor.pipeline = Pipeline()
+        processor._progress_hooks = []  # the real PostProcessor reports progress to its downloader
+        info = {'id': '1', 'title': 'Track', 'uploader': 'DJ', 'uploader_id': '42',
+                'uploader_url': 'https://soundcloud.com/dj', 'filepath': '/music/DJ/Track.mp3',
+                'webpage_url': 'https://soundcloud.com/dj/track'}
+        self.assertEqual(processor.run(info), ([], info))
+        self.assertEqual(len(submitted), 1)
+        self.assertEqual(submitted[0].path, '/music/DJ/Track.mp3')
+        self.assertEqual(submitted[0].info['uploader_id'], '42')
 
 if __name__ == '__main__':
     unittest.main()
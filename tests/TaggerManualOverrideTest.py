@@ -53,7 +53,9 @@ class TaggerManualOverrideTest(unittest.TestCase):
 
         dummy_song.parse.assert_called_once()
         dummy_song.tag_collection.add.assert_called_with('genre', 'Trance')
-        dummy_song.save_file.assert_called_once()
+        # committed once when the song's context exits, no separate save
+        dummy_song.__exit__.assert_called_once_with(None, None, None)
+        dummy_song.save_file.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
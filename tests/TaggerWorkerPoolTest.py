@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Provide minimal env vars for Settings
+os.environ.setdefault('import_folder_path', '/tmp')
+os.environ.setdefault('music_folder_path', '/tmp')
+os.environ.setdefault('eps_folder_path', '/tmp')
+os.environ.setdefault('delimiter', '/')
+
+from postprocessing import tagger as tagger_module
+from postprocessing.constants import SongTypeEnum
+
+
+class TaggerWorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        for i in range(5):
+            Path(self.tempdir.name, f"song{i}.mp3").touch()
+
+        self.file_state = MagicMock()
+        self.file_state.is_unchanged.return_value = False
+        patcher = patch.object(tagger_module, 'file_state_helper', self.file_state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_executor_uses_configured_mode(self):
+        tagger = tagger_module.Tagger()
+        tagger.workers = 2
+        tagger.mode = "thread"
+        executor = tagger._create_executor()
+        self.assertIsInstance(executor, ThreadPoolExecutor)
+        executor.shutdown()
+
+        tagger.mode = "process"
+        executor = tagger._create_executor()
+        self.assertIsInstance(executor, ProcessPoolExecutor)
+        executor.shutdown()
+
+    def test_parse_folder_submits_batches(self):
+        tagger = tagger_module.Tagger()
+        tagger.batch_size = 2
+        batches = []
+
+        def fake_batch(items, dry_run=False):
+            batches.append(items)
+            return [(file, "OK") for file, _ in items]
+
+        with patch.object(tagger_module.Tagger, '_parse_batch', side_effect=fake_batch), \
+                patch.object(tagger_module, 'job_manager') as job_manager:
+            tagger._executor = ThreadPoolExecutor(max_workers=2)
+            try:
+                tagger.parse_folder(Path(self.tempdir.name), SongTypeEnum.GENERIC)
+            finally:
+                tagger._executor.shutdown()
+
+        self.assertEqual(sorted(len(batch) for batch in batches), [1, 2, 2])
+        self.assertEqual(self.file_state.mark.call_count, 5)
+        final = job_manager.publish.call_args.args[0]
+        self.assertEqual(final["type"], "tagger-progress")
+        self.assertTrue(final["final"])
+        self.assertEqual((final["seen"], final["queued"], final["tagged"], final["failed"]), (5, 5, 5, 0))
+
+    def test_single_queue_spans_all_roots(self):
+        other = tempfile.TemporaryDirectory()
+        self.addCleanup(other.cleanup)
+        Path(other.name, "extra.mp3").touch()
+        self.file_state.is_unchanged.side_effect = lambda path: path.endswith("song0.mp3")
+
+        tagger = tagger_module.Tagger()
+        tagger.parallel = False
+        parsed = []
+        with patch.object(tagger_module.Tagger, 'parse_song', side_effect=lambda path, song_type, dry_run=False: parsed.append(path)), \
+                patch.object(tagger_module, 'job_manager') as job_manager:
+            tagger._process([(Path(self.tempdir.name), SongTypeEnum.GENERIC),
+                             (Path(other.name), SongTypeEnum.LABEL)])
+
+        self.assertEqual(len(parsed), 5)
+        final = job_manager.publish.call_args.args[0]
+        self.assertEqual((final["seen"], final["skipped"], final["tagged"]), (6, 1, 5))
+
+    def test_run_flushes_write_buffer_even_on_error(self):
+        tagger = tagger_module.Tagger()
+        tagger.parallel = False
+        with patch.object(tagger_module, 'write_buffer') as write_buffer, \
+                patch.object(tagger_module.Tagger, '_collect_roots', return_value=[]), \
+                patch.object(tagger_module.Tagger, '_process', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                tagger.run()
+        write_buffer.flush.assert_called_once()
+        self.file_state.flush.assert_called_once()
+
+    def test_dry_run_counts_would_rewrites_without_marking(self):
+        tagger = tagger_module.Tagger()
+        tagger.parallel = False
+        with patch.object(tagger_module, 'write_buffer'), \
+                patch.object(tagger_module, 'job_manager'), \
+                patch.object(tagger_module.Tagger, '_collect_roots',
+                             return_value=[(Path(self.tempdir.name), SongTypeEnum.GENERIC)]), \
+                patch.object(tagger_module.Tagger, 'parse_song', return_value=True) as parse_song:
+            summary = tagger.run(dry_run=True)
+
+        self.assertEqual(summary, {"inspected": 5, "rewritten": 0, "would_rewrite": 5})
+        self.assertTrue(all(call.kwargs["dry_run"] for call in parse_song.call_args_list))
+        self.file_state.mark.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,9 @@ class DummyConnector:
             def commit(self_inner):
                 pass
 
+            def close(self_inner):
+                pass
+
         return DummyConn()
 
 
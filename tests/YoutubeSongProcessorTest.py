@@ -30,6 +30,12 @@ class DummySong:
         self.parse_called = False
         DummySong.last_instance = self
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
     def parse(self):
         self.parse_called = True
 
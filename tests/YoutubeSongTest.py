@@ -2,6 +2,7 @@ import os
 import sys
 import types
 import unittest
+from collections import defaultdict
 from unittest.mock import MagicMock, patch
 
 # Minimal environment variables for Settings
@@ -27,6 +28,8 @@ from postprocessing.Song.YoutubeSong import YoutubeSong
 
 
 class YoutubeSongTest(unittest.TestCase):
+    # other tests may reload the module, so patch the globals the rules are built from
+    @patch.dict(YoutubeSong.build_rules.__globals__, {'databaseHelpers': defaultdict(MagicMock)})
     @patch('postprocessing.Song.BaseSong.BaseSong.parse')
     @patch('postprocessing.Song.BaseSong.TagCollection')
     @patch('postprocessing.Song.BaseSong.MP4')